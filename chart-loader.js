@@ -0,0 +1,46 @@
+(function () {
+  // Charts declared with lazyChart() are built only once their canvas scrolls into view,
+  // from the page's dataset file (data/charts/<page>.json, written by the pipeline).
+  var script = document.currentScript;
+  var src = script && script.getAttribute('data-charts');
+  var datasets = null;
+
+  function loadDatasets() {
+    if (!datasets) {
+      datasets = fetch(src, { cache: 'no-cache' }).then(function (res) {
+        if (!res.ok) throw new Error('HTTP ' + res.status);
+        return res.json();
+      });
+    }
+    return datasets;
+  }
+
+  function build(canvas, makeConfig) {
+    loadDatasets().then(function (data) {
+      new Chart(canvas, makeConfig(data));
+    }).catch(function (err) {
+      console.warn('Chart ' + canvas.id + ' skipped:', err);
+    });
+  }
+
+  var observer = window.IntersectionObserver
+    ? new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+          if (!entry.isIntersecting) return;
+          observer.unobserve(entry.target);
+          build(entry.target, entry.target.__makeChartConfig);
+        });
+      }, { rootMargin: '200px 0px' })
+    : null;
+
+  window.lazyChart = function (canvasId, makeConfig) {
+    var canvas = document.getElementById(canvasId);
+    if (!canvas || !src) return;
+    if (!observer) {
+      build(canvas, makeConfig);
+      return;
+    }
+    canvas.__makeChartConfig = makeConfig;
+    observer.observe(canvas);
+  };
+})();
@@ -0,0 +1,49 @@
+(function () {
+  // Binds data/pages/<page>.json (written by the pipeline) into data-bind elements.
+  var script = document.currentScript;
+  var src = script && script.getAttribute('data-bindings');
+  if (!src || !window.fetch) return;
+
+  function bindElement(el, values) {
+    var attrs = el.attributes;
+    for (var i = 0; i < attrs.length; i++) {
+      var name = attrs[i].name;
+      var key = attrs[i].value;
+      if (!(key in values)) continue;
+      if (name === 'data-bind') {
+        el.textContent = values[key];
+      } else if (name.indexOf('data-bind-') === 0) {
+        el.setAttribute(name.slice(10), values[key]);
+      }
+    }
+  }
+
+  function apply(payload) {
+    var values = {};
+    [payload.timestamps || {}, payload.values || {}].forEach(function (group) {
+      Object.keys(group).forEach(function (k) { values[k] = group[k]; });
+    });
+    var nodes = document.body.getElementsByTagName('*');
+    for (var i = 0; i < nodes.length; i++) {
+      bindElement(nodes[i], values);
+    }
+  }
+
+  var request = fetch(src, { cache: 'no-cache' }).then(function (res) {
+    if (!res.ok) throw new Error('HTTP ' + res.status);
+    return res.json();
+  });
+
+  function run() {
+    request.then(apply).catch(function (err) {
+      // Static values baked into the page remain visible.
+      console.warn('Hydration skipped:', err);
+    });
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', run);
+  } else {
+    run();
+  }
+})();
@@ -0,0 +1 @@
+module.exports = {"version":"fe21acc96b2b","companies":{"tencent":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"Tencent","price":457.0,"change_pct":1.24059,"market_cap_display":"$547B","pe_ratio":12.643731,"roe":19.906001,"rsi_14":31.403125230453554,"macd":-2.5977659109161664,"52w_high":492.20001220703125,"52w_low":411.79998779296875,"volatility":31.41902162464949,"technical_rating":"Hold"},"news":[],"version":"5535d4466abf"},"alibaba":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"Alibaba","price":123.0,"change_pct":-2.53566,"market_cap_display":"$370B","pe_ratio":12.976516,"roe":9.2159994,"rsi_14":46.496819465164755,"macd":3.099464354465354,"52w_high":130.75326538085938,"52w_low":89.5,"volatility":41.48047664014551,"technical_rating":"Buy"},"news":[{"title":"Alibaba Group Announces June Quarter 2026 Results","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=2026456290057781248","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Will Announce June Quarter 2026 Results on August 20, 2026","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=2022412636729114624","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Partners with UEFA Men’s Club Competitions from 2027/28 to 2032/33 and UEFA EURO 2028™","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1998211029250605056","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Announces Filing of Annual Report on Form 20-F for Fiscal Year 2026","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=2003564382071554048","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Letter from our Chairman and our CEO","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1993785120221298688","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Announces March Quarter 2026 and Fiscal Year 2026 Results","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1991237455038119936","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Will Announce March Quarter 2026 and Full Fiscal Year 2026 Results on May 13, 2026","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1985497717903720448","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Announces December Quarter 2025 Results","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1971014025827319808","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Will Announce December Quarter 2025 Results on March 19, 2026","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1965937613500055552","publisher":"Alibaba Group","sentiment_label":"neutral"},{"title":"Alibaba Group Announces September Quarter 2025 Results and Interim Results for the Six Months Ended September 30, 2025","summary":"","link":"https://www.alibabagroup.com/news-and-resource?documentId=1929990445136347136","publisher":"Alibaba Group","sentiment_label":"neutral"}],"version":"7cd2603c6294"},"xiaomi":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"Xiaomi","price":29.02,"change_pct":4.53891,"market_cap_display":"$90B","pe_ratio":18.641281,"roe":12.626999999999999,"rsi_14":57.30028662780159,"macd":0.15701919095034,"52w_high":31.8799991607666,"52w_low":21.420000076293945,"volatility":55.39187496145309,"technical_rating":"Buy"},"news":[{"title":"Xiaomi Strengthens Data Protection with Independent Audit of Compliance","summary":"BEIJING , Feb. 3, 2022 /PRNewswire/ -- Xiaomi , a consumer electronics and smart manufacturing company with smartphones and smart hardware connected by an IoT platform at its core, has today announced the findings of an independent review into its data protection compliance.","link":"https://ir.mi.com/news-releases/news-release-details/xiaomi-strengthens-data-protection-independent-audit-compliance","publisher":"Xiaomi Corporation News Releases","sentiment_label":"neutral"},{"title":"Xiaomi Strengthens Its Position on Consumer IoT Security with Proposed Global Common Standards","summary":"Xiaomi releases Cyber Security Baseline for Consumer Internet of Things Device Version 2.0, a new global standards guideline on IoT, and, at the same time, announces Xiaomi Mesh System AX3000 has obtained BSI IoT Kitemark™ Certificate, two important steps to strengthen IoT security policies and","link":"https://ir.mi.com/news-releases/news-release-details/xiaomi-strengthens-its-position-consumer-iot-security-proposed","publisher":"Xiaomi Corporation News Releases","sentiment_label":"neutral"},{"title":"IoTSF Puts Xiaomi's IoT Security Policy Among the World's Best","summary":"BEIJING , Nov. 11, 2021 /PRNewswire/ -- Xiaomi Corporation (\" Xiaomi \" or the \"Group\"), a consumer electronics and smart manufacturing company, has been given a top rating for its IoT security by the Internet of Things Security Foundation (IoTSF). Xiaomi participated in the IoTSF 2021 Virtual","link":"https://ir.mi.com/news-releases/news-release-details/iotsf-puts-xiaomis-iot-security-policy-among-worlds-best","publisher":"Xiaomi Corporation News Releases","sentiment_label":"neutral"},{"title":"Xiaomi Launches Master Class Series on Mobile Photography","summary":"","link":"https://ir.mi.com/news-releases/news-release-details/xiaomi-launches-master-class-series-mobile-photography","publisher":"Xiaomi Corporation News Releases","sentiment_label":"neutral"}],"version":"ec6dfda9b9a2"},"meituan":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"Meituan","price":85.0,"change_pct":-0.9901,"market_cap_display":"$615B","pe_ratio":17.824997,"roe":-24.093999999999998,"rsi_14":24.316161581494313,"macd":0.6398078694878251,"52w_high":93.9000015258789,"52w_low":64.25,"volatility":24.74830565300229,"technical_rating":"Buy"},"news":[{"title":"Announcements and Notices - Date of Board Meeting","summary":"Announcements and Notices - Date of Board Meeting","link":"https://media-meituan.todayir.com/20260818164801378712288169_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Monthly Return of Equity Issuer on Movements in Securities for the month ended 31 July 2026","summary":"Monthly ReturnsMonthly Return of Equity Issuer on Movements in Securities for the month ended 31 July 2026","link":"https://media-meituan.todayir.com/20260806164801302712275016_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Announcements and Notices - Grant of Restricted Share Units","summary":"Announcements and Notices - GRANT OF RESTRICTED SHARE UNITS","link":"https://media-meituan.todayir.com/20260715220801260812245765_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Monthly Return of Equity Issuer on Movements in Securities for the month ended 30 June 2026","summary":"Monthly ReturnsMonthly Return of Equity Issuer on Movements in Securities for the month ended 30 June 2026","link":"https://media-meituan.todayir.com/20260706204002541812235053_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Next Day Disclosure Return","summary":"Next Day Disclosure Returns, Share BuybackNext Day Disclosure Return","link":"https://media-meituan.todayir.com/20260630200801228712223442_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Next Day Disclosure Return (resubmission)","summary":"Next Day Disclosure Returns, Others, Share BuybackNext Day Disclosure Return (Resubmission)","link":"https://media-meituan.todayir.com/20260630164001376912222179_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Next Day Disclosure Return","summary":"Next Day Disclosure Returns, Others, Share BuybackNext Day Disclosure Return","link":"https://media-meituan.todayir.com/2026062920240194212221002_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Announcements and Notices - List of Directors and Their Roles and Functions","summary":"Announcements and Notices - LIST OF DIRECTORS AND THEIR ROLES AND FUNCTIONS","link":"https://media-meituan.todayir.com/20260626223202399312219062_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Announcements and Notices - (1) Poll Results of the Annual General Meeting Held on June 26, 2026; (2) Retirement of Independent Non-executive Director; (3) Appointment of Independent Non-executive Director; and (4) Change in Composition of Board Committees","summary":"Announcements and Notices - (1) POLL RESULTS OF THE ANNUAL GENERAL MEETING HELD ON JUNE 26, 2026; (2) RETIREMENT OF INDEPENDENT NON-EXECUTIVE DIRECTOR; (3) APPOINTMENT OF INDEPENDENT NON-EXECUTIVE DIRECTOR; AND (4) CHANGE IN COMPOSITION OF BOARD COMMITTEES","link":"https://media-meituan.todayir.com/20260626223202577712219014_en.pdf","publisher":"Meituan","sentiment_label":"neutral"},{"title":"Announcements and Notices - Notice of Annual General Meeting","summary":"Announcements and Notices - NOTICE OF ANNUAL GENERAL MEETING","link":"https://media-meituan.todayir.com/20260604175601833412189971_en.pdf","publisher":"Meituan","sentiment_label":"neutral"}],"version":"43fe9076d7e4"},"baidu":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"Baidu","price":128.2,"change_pct":1.34387,"market_cap_display":"$57B","pe_ratio":14.484476,"roe":0.319,"rsi_14":55.03731003368322,"macd":3.141279758624364,"52w_high":145.1999969482422,"52w_low":105.5999984741211,"volatility":49.86756808930353,"technical_rating":"Hold"},"news":[],"version":"11849d212819"},"jd":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"JD.com","price":121.7,"change_pct":-1.45749,"market_cap_display":"$200B","pe_ratio":7.404077,"roe":6.0040000000000004,"rsi_14":58.78134338480116,"macd":2.658742771476213,"52w_high":130.10000610351562,"52w_low":96.51679992675781,"volatility":37.18087695841784,"technical_rating":"Buy"},"news":[],"version":"d61bd652b249"},"hsbc":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"HSBC","price":162.89999,"change_pct":1.62196,"market_cap_display":"$375B","pe_ratio":11.251545,"roe":13.104999000000001,"rsi_14":39.17220440436965,"macd":1.4397692845669212,"52w_high":168.0957794189453,"52w_low":135.21617126464844,"volatility":19.52785390124966,"technical_rating":"Hold"},"news":[],"version":"cb4765fdbfe6"},"hk3033":{"news_update":"2026-08-22T18:48:09.656491+00:00","detail":{"company_name":"CSOP HS TECH","price":4.670000076293945,"change_pct":1.5217428937526971,"market_cap_display":"$N/A","pe_ratio":17.82157,"roe":0.0,"rsi_14":46.26865760161414,"macd":0.007906617454445097,"52w_high":5.09499979019165,"52w_low":4.179999828338623,"volatility":21.735737560379807,"technical_rating":"Hold"},"news":[],"version":"d4792bd36e1e"}}};
@@ -1,419 +0,0 @@
-module.exports = {
-  "timestamp": "2026-02-19T04:40:14.080976",
-  "companies": {
-    "tencent": {
-      "price": 533.0,
-      "open": 530.0,
-      "high": 535.0,
-      "low": 527.5,
-      "volume": 7224483,
-      "turnover": 3838968112.0,
-      "change": 1.0,
-      "change_pct": 0.19,
-      "amplitude": 1.41,
-      "ma_5": 539.9,
-      "ma_10": 550.45,
-      "ma_20": 577.725,
-      "ma_50": 598.15,
-      "ma_200": 580.855,
-      "ema_12": 556.9638672284748,
-      "ema_26": 576.7123754882897,
-      "rsi_14": 21.96969696969697,
-      "rsi_6": 32.53012048192771,
-      "macd": -19.748508259814912,
-      "macd_signal": -17.77365743383342,
-      "macd_histogram": -1.9748508259814912,
-      "bb_upper": 637.2384228556887,
-      "bb_middle": 577.725,
-      "bb_lower": 518.2115771443114,
-      "bb_width": 20.60268219505427,
-      "atr": 16.964285714285715,
-      "volatility": 26.060024018873264,
-      "historical_vol_20": 26.060024018873264,
-      "historical_vol_60": 23.150317346678865,
-      "momentum_10": -8.261617900172118,
-      "stoch_k": 8.0,
-      "stoch_d": 8.0,
-      "williams_r": -92.0,
-      "52w_high": 677.5,
-      "52w_low": 430.9,
-      "support_levels": [
-        547.5,
-        595.0
-      ],
-      "resistance_levels": [
-        622.0,
-        560.0
-      ],
-      "52w_position": 41.40308191403083,
-      "avg_volume_20": 30970993.95,
-      "volume_ratio": 0.2332661009092348,
-      "market_cap_billion": 638,
-      "market_cap_display": "$638B",
-      "market_cap_hkd": "HK$4983B",
-      "pe_ratio": 3.9,
-      "pb_ratio": 0.5,
-      "ps_ratio": 5.1,
-      "peg_ratio": 13.789746421545518,
-      "ev_ebitda": 3.144062184112378,
-      "fcf_yield": 6.698839180905177,
-      "roe": 13.8,
-      "roa": 6.8,
-      "gross_margin": 48.5,
-      "op_margin": 28.5,
-      "net_margin": 26.2,
-      "revenue_growth": 8.5,
-      "earnings_growth": 28.5,
-      "revenue_billion": 620.5,
-      "debt_equity": 0.08,
-      "cash_billion": 95,
-      "net_cash_billion": 72,
-      "fcf_billion": 42.8,
-      "dividend_yield": 0.8,
-      "beta": 0.32,
-      "eps": 11.2,
-      "technical_rating": {
-        "score": 0,
-        "rating": "Hold",
-        "color": "#FF9800",
-        "signals": [
-          "RSI oversold (<30) - Bullish",
-          "Price below 20D and 50D MA - Bearish trend",
-          "MACD bearish crossover",
-          "Low volatility - Stable",
-          "Stochastic oversold"
-        ]
-      },
-      "derivative_analysis": {
-        "daily_expected_move": 8.749873015887266,
-        "atr_percent": 3.182792816939158,
-        "support_level": 547.5,
-        "resistance_level": 622.0,
-        "tight_stop_loss": 507.55357142857144,
-        "wide_stop_loss": 490.5892857142857,
-        "target_1r": 558.4464285714286,
-        "target_2r": 583.8928571428571,
-        "risk_reward_ratio": "1:2"
-      },
-      "expert_commentary": {
-        "technical": "Tencent is in a DOWNTREND, trading below key moving averages. RSI suggests oversold conditions - potential bounce opportunity.",
-        "volatility": "Low volatility (26.1%). Favorable for option selling strategies.",
-        "derivative": "Daily expected range: HK$8.75. ATR (3.2%) suggests high intraday volatility. Stochastic oversold - potential reversal setup."
-      },
-      "company_name": "Tencent",
-      "symbol": "00700",
-      "industry": "Technology / Gaming / Social Media",
-      "sector": "Communication Services"
-    },
-    "alibaba": {
-      "price": 154.7,
-      "open": 152.6,
-      "high": 154.9,
-      "low": 150.5,
-      "volume": 29215118,
-      "turnover": 4460519936.0,
-      "change": -0.7,
-      "change_pct": -0.45,
-      "amplitude": 2.83,
-      "ma_5": 157.85999999999999,
-      "ma_10": 158.23,
-      "ma_20": 162.64499999999998,
-      "ma_50": 155.69799999999998,
-      "ma_200": 139.81936,
-      "ema_12": 159.49571361353276,
-      "ema_26": 159.45695538818998,
-      "rsi_14": 27.38095238095235,
-      "rsi_6": 48.67256637168136,
-      "macd": 0.03875822534277518,
-      "macd_signal": 0.03488240280849766,
-      "macd_histogram": 0.003875822534277519,
-      "bb_upper": 173.84954818366182,
-      "bb_middle": 162.64499999999998,
-      "bb_lower": 151.44045181633814,
-      "bb_width": 13.777919006009215,
-      "atr": 5.642857142857143,
-      "volatility": 29.84493947867178,
-      "historical_vol_20": 29.84493947867178,
-      "historical_vol_60": 37.54031936880176,
-      "momentum_10": -3.9130434782608767,
-      "stoch_k": 17.72151898734173,
-      "stoch_d": 17.72151898734173,
-      "williams_r": -82.27848101265826,
-      "52w_high": 185.1,
-      "52w_low": 99.349,
-      "support_levels": [
-        155.0
-      ],
-      "resistance_levels": [
-        173.5,
-        160.5
-      ],
-      "52w_position": 64.54851838462524,
-      "avg_volume_20": 71912413.2,
-      "volume_ratio": 0.40625973597559645,
-      "market_cap_billion": 466,
-      "market_cap_display": "$466B",
-      "market_cap_hkd": "HK$3635B",
-      "pe_ratio": 3.6,
-      "pb_ratio": 0.4,
-      "ps_ratio": 1.9,
-      "peg_ratio": 1.3070068501041774,
-      "ev_ebitda": 2.85659417158769,
-      "fcf_yield": 4.076524226711962,
-      "roe": 11.4,
-      "roa": 5.3,
-      "gross_margin": 40.0,
-      "op_margin": 14.0,
-      "net_margin": 13.1,
-      "revenue_growth": 6.6,
-      "earnings_growth": 273.2,
-      "revenue_billion": 996.4,
-      "debt_equity": 0.23,
-      "cash_billion": 55,
-      "net_cash_billion": 18,
-      "fcf_billion": 19.0,
-      "dividend_yield": 0.9,
-      "beta": 0.21,
-      "eps": 9.2,
-      "technical_rating": {
-        "score": 6,
-        "rating": "Strong Buy",
-        "color": "#00C853",
-        "signals": [
-          "RSI oversold (<30) - Bullish",
-          "MACD bullish crossover",
-          "Low volatility - Stable",
-          "Stochastic oversold"
-        ]
-      },
-      "derivative_analysis": {
-        "daily_expected_move": 2.908444265618161,
-        "atr_percent": 3.647612891310371,
-        "support_level": 155.0,
-        "resistance_level": 173.5,
-        "tight_stop_loss": 146.23571428571427,
-        "wide_stop_loss": 140.59285714285713,
-        "target_1r": 163.1642857142857,
-        "target_2r": 171.62857142857143,
-        "risk_reward_ratio": "1:2"
-      },
-      "expert_commentary": {
-        "technical": "Alibaba is consolidating. Watch for breakout above HK$173.50 or breakdown below HK$155.00.",
-        "volatility": "Low volatility (29.8%). Favorable for option selling strategies.",
-        "derivative": "Daily expected range: HK$2.91. ATR (3.6%) suggests high intraday volatility. Stochastic oversold - potential reversal setup."
-      },
-      "company_name": "Alibaba",
-      "symbol": "09988",
-      "industry": "E-commerce / Cloud Computing",
-      "sector": "Consumer Discretionary"
-    },
-    "xiaomi": {
-      "price": 36.66,
-      "open": 36.84,
-      "high": 36.86,
-      "low": 35.48,
-      "volume": 40204215,
-      "turnover": 1449756368.0,
-      "change": -0.18,
-      "change_pct": -0.49,
-      "amplitude": 3.75,
-      "ma_5": 36.540000000000006,
-      "ma_10": 35.65599999999999,
-      "ma_20": 35.661,
-      "ma_50": 38.1444,
-      "ma_200": 48.25630000000001,
-      "ema_12": 36.05966595908715,
-      "ema_26": 36.47778296383211,
-      "rsi_14": 56.926952141057896,
-      "rsi_6": 74.66666666666656,
-      "macd": -0.41811700474496405,
-      "macd_signal": -0.37630530427046766,
-      "macd_histogram": -0.041811700474496394,
-      "bb_upper": 37.258772199032144,
-      "bb_middle": 35.661,
-      "bb_lower": 34.06322780096786,
-      "bb_width": 8.960893968380823,
-      "atr": 1.2171428571428566,
-      "volatility": 30.295840840225196,
-      "historical_vol_20": 30.295840840225196,
-      "historical_vol_60": 30.332326972615792,
-      "momentum_10": 5.953757225433512,
-      "stoch_k": 79.90430622009562,
-      "stoch_d": 79.90430622009562,
-      "williams_r": -20.09569377990439,
-      "52w_high": 60.15,
-      "52w_low": 33.96,
-      "support_levels": [
-        33.96,
-        35.22
-      ],
-      "resistance_levels": [
-        37.1,
-        36.62,
-        36.24
-      ],
-      "52w_position": 10.309278350515449,
-      "avg_volume_20": 157939616.7,
-      "volume_ratio": 0.2545543407032974,
-      "market_cap_billion": 114,
-      "market_cap_display": "$114B",
-      "market_cap_hkd": "HK$890B",
-      "pe_ratio": 3.1,
-      "pb_ratio": 0.5,
-      "ps_ratio": 3.1,
-      "peg_ratio": 2.293236452375858,
-      "ev_ebitda": 2.4491765311374163,
-      "fcf_yield": 51.92189825759566,
-      "roe": 17.4,
-      "roa": 4.8,
-      "gross_margin": 21.6,
-      "op_margin": 8.6,
-      "net_margin": 8.7,
-      "revenue_growth": 30.5,
-      "earnings_growth": 133.5,
-      "revenue_billion": 428.8,
-      "debt_equity": 0.11,
-      "cash_billion": 14,
-      "net_cash_billion": 11,
-      "fcf_billion": 59.3,
-      "dividend_yield": 0.1,
-      "beta": 1.01,
-      "eps": 1.0,
-      "technical_rating": {
-        "score": 0,
-        "rating": "Hold",
-        "color": "#FF9800",
-        "signals": [
-          "RSI neutral - Stable",
-          "Price recovering above 20D MA",
-          "MACD bearish crossover"
-        ]
-      },
-      "derivative_analysis": {
-        "daily_expected_move": 0.6996409177221302,
-        "atr_percent": 3.3200841711480003,
-        "support_level": 33.96,
-        "resistance_level": 37.1,
-        "tight_stop_loss": 34.83428571428571,
-        "wide_stop_loss": 33.61714285714285,
-        "target_1r": 38.48571428571428,
-        "target_2r": 40.311428571428564,
-        "risk_reward_ratio": "1:1"
-      },
-      "expert_commentary": {
-        "technical": "Xiaomi is consolidating. Watch for breakout above HK$37.10 or breakdown below HK$33.96.",
-        "volatility": "Low volatility (30.3%). Favorable for option selling strategies.",
-        "derivative": "Daily expected range: HK$0.70. ATR (3.3%) suggests high intraday volatility. Momentum neutral - range trading likely."
-      },
-      "company_name": "Xiaomi",
-      "symbol": "01810",
-      "industry": "Consumer Electronics / EV / IoT",
-      "sector": "Information Technology"
-    },
-    "meituan": {
-      "price": 82.05,
-      "open": 81.65,
-      "high": 82.4,
-      "low": 79.25,
-      "volume": 23648794,
-      "turnover": 1916737792.0,
-      "change": -0.1,
-      "change_pct": -0.12,
-      "amplitude": 3.83,
-      "ma_5": 85.34,
-      "ma_10": 88.82999999999998,
-      "ma_20": 93.00749999999998,
-      "ma_50": 98.31299999999999,
-      "ma_200": 112.28475,
-      "ema_12": 88.96778344117028,
-      "ema_26": 93.14245806265282,
-      "rsi_14": 17.045454545454504,
-      "rsi_6": 0.5291005291005035,
-      "macd": -4.174674621482538,
-      "macd_signal": -3.757207159334284,
-      "macd_histogram": -0.4174674621482537,
-      "bb_upper": 103.3152288963185,
-      "bb_middle": 93.00749999999998,
-      "bb_lower": 82.69977110368146,
-      "bb_width": 22.165371386863477,
-      "atr": 3.103571428571431,
-      "volatility": 25.297871483409452,
-      "historical_vol_20": 25.297871483409452,
-      "historical_vol_60": 32.02775741186278,
-      "momentum_10": -11.963519313304726,
-      "stoch_k": 14.213197969543131,
-      "stoch_d": 14.213197969543131,
-      "williams_r": -85.78680203045687,
-      "52w_high": 183.5,
-      "52w_low": 82.05,
-      "support_levels": [
-        96.55,
-        97.0
-      ],
-      "resistance_levels": [
-        98.6,
-        97.55,
-        93.8
-      ],
-      "52w_position": 0.0,
-      "avg_volume_20": 45831475.65,
-      "volume_ratio": 0.5159946011906339,
-      "market_cap_billion": 594,
-      "market_cap_display": "$594B",
-      "market_cap_hkd": "HK$4635B",
-      "pe_ratio": 62.7,
-      "pb_ratio": 10.7,
-      "ps_ratio": 1.6,
-      "peg_ratio": 109.54895120775103,
-      "ev_ebitda": 50.129600072666875,
-      "fcf_yield": 0.8580996909935125,
-      "roe": 17.1,
-      "roa": 5.2,
-      "gross_margin": 26.0,
-      "op_margin": 4.2,
-      "net_margin": 2.4,
-      "revenue_growth": 16.7,
-      "earnings_growth": 57.2,
-      "revenue_billion": 395.2,
-      "debt_equity": 0.28,
-      "cash_billion": 13,
-      "net_cash_billion": 4,
-      "fcf_billion": 5.1,
-      "dividend_yield": 0.0,
-      "beta": 1.15,
-      "eps": 5.0,
-      "technical_rating": {
-        "score": 0,
-        "rating": "Hold",
-        "color": "#FF9800",
-        "signals": [
-          "RSI oversold (<30) - Bullish",
-          "Price below 20D and 50D MA - Bearish trend",
-          "MACD bearish crossover",
-          "Low volatility - Stable",
-          "Stochastic oversold"
-        ]
-      },
-      "derivative_analysis": {
-        "daily_expected_move": 1.307562018731165,
-        "atr_percent": 3.78253678070863,
-        "support_level": 96.55,
-        "resistance_level": 98.6,
-        "tight_stop_loss": 77.39464285714286,
-        "wide_stop_loss": 74.29107142857141,
-        "target_1r": 86.70535714285714,
-        "target_2r": 91.36071428571428,
-        "risk_reward_ratio": "1:2"
-      },
-      "expert_commentary": {
-        "technical": "Meituan is in a DOWNTREND, trading below key moving averages. RSI suggests oversold conditions - potential bounce opportunity.",
-        "volatility": "Low volatility (25.3%). Favorable for option selling strategies.",
-        "derivative": "Daily expected range: HK$1.31. ATR (3.8%) suggests high intraday volatility. Stochastic oversold - potential reversal setup."
-      },
-      "company_name": "Meituan",
-      "symbol": "03690",
-      "industry": "Food Delivery / Local Services",
-      "sector": "Consumer Discretionary"
-    }
-  }
-};
@@ -1 +0,0 @@
-module.exports = require('./comprehensive_stock_data.js');
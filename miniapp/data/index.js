@@ -0,0 +1 @@
+module.exports = {"timestamp":"2026-08-21T09:15:44.218140","summary":{"tencent":{"price":457.0,"change_pct":1.24059,"market_cap":"$547B","pe_ratio":12.643731,"technical_rating":"Hold"},"alibaba":{"price":123.0,"change_pct":-2.53566,"market_cap":"$370B","pe_ratio":12.976516,"technical_rating":"Buy"},"xiaomi":{"price":29.02,"change_pct":4.53891,"market_cap":"$90B","pe_ratio":18.641281,"technical_rating":"Buy"},"meituan":{"price":85.0,"change_pct":-0.9901,"market_cap":"$615B","pe_ratio":17.824997,"technical_rating":"Buy"},"baidu":{"price":128.2,"change_pct":1.34387,"market_cap":"$57B","pe_ratio":14.484476,"technical_rating":"Hold"},"jd":{"price":121.7,"change_pct":-1.45749,"market_cap":"$200B","pe_ratio":7.404077,"technical_rating":"Buy"},"hsbc":{"price":162.89999,"change_pct":1.62196,"market_cap":"$375B","pe_ratio":11.251545,"technical_rating":"Hold"},"hk3033":{"price":4.670000076293945,"change_pct":1.5217428937526971,"market_cap":"$N/A","pe_ratio":17.82157,"technical_rating":"Hold"}},"version":"18eac63c3177"};
@@ -1,545 +0,0 @@
-module.exports = [
-  {
-    "id": "175d0673-3ff9-35da-bb88-a20a24a351f5",
-    "content": {
-      "id": "175d0673-3ff9-35da-bb88-a20a24a351f5",
-      "contentType": "STORY",
-      "title": "Alibaba’s Qwen 3.5 AI Launch Sparks Questions For Undervalued Shares",
-      "description": "",
-      "summary": "Alibaba Group Holding (NYSE:BABA) has launched its advanced Qwen 3.5 AI model, highlighting performance and cost changes versus earlier versions. The model includes agentic features that allow it to carry out complex tasks independently across commerce and enterprise use cases. Alibaba is rolling out Qwen 3.5 across its platforms alongside a major Lunar New Year marketing campaign aimed at consumers and business clients. The move comes as competition in China’s AI sector intensifies, with...",
-      "pubDate": "2026-02-18T20:10:22Z",
-      "displayTime": "2026-02-18T20:10:22Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/simply_wall_st__316/7ea8a72848a91550608dfe380952013a",
-        "originalWidth": 1194,
-        "originalHeight": 432,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/Asb.EQEV7awFB_Mkuf_o.A--~B/aD00MzI7dz0xMTk0O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/simply_wall_st__316/7ea8a72848a91550608dfe380952013a",
-            "width": 1194,
-            "height": 432,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/D6tGlHnBV1OBj9DD.GNtjg--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/simply_wall_st__316/7ea8a72848a91550608dfe380952013a",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Simply Wall St.",
-        "url": "https://simplywall.st/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-qwen-3-5-ai-201022913.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-qwen-3-5-ai-201022913.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "75b1b427-f441-38d7-b3da-3b0705b22f78",
-    "content": {
-      "id": "75b1b427-f441-38d7-b3da-3b0705b22f78",
-      "contentType": "STORY",
-      "title": "David Tepper’s Appaloosa Trims Alibaba and Adds Micron, Alphabet in Stock Reshuffle",
-      "description": "",
-      "summary": "Appaloosa’s single largest increase in holdings by dollar value was for chip maker  Micron  It acquired 1 million new shares, for a total of 1.5 million valued at $428 million at the end of 2025.  It also bumped up its  Alphabet  holdings to around 1.8 million shares, valued at around $560 million for the same period.",
-      "pubDate": "2026-02-18T19:20:00Z",
-      "displayTime": "2026-02-18T19:20:00Z",
-      "isHosted": false,
-      "bypassModal": false,
-      "previewUrl": "https://finance.yahoo.com/m/75b1b427-f441-38d7-b3da-3b0705b22f78/david-tepper%E2%80%99s-appaloosa.html",
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/Barrons.com/933683a62742614c70722f81ff60218a",
-        "originalWidth": 1280,
-        "originalHeight": 640,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/ow26X_A1_nKbB9GqoI5KPQ--~B/aD02NDA7dz0xMjgwO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/Barrons.com/933683a62742614c70722f81ff60218a",
-            "width": 1280,
-            "height": 640,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/lpTJmiZBQ.8HzB0.VP2cKA--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/Barrons.com/933683a62742614c70722f81ff60218a",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Barrons.com",
-        "url": "http://www.barrons.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://www.barrons.com/articles/david-tepper-appaloosa-micron-alibaba-alphabet-f3f56579?siteid=yhoof2&yptr=yahoo",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": null,
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "1b489391-35be-3b4f-8d9f-e346bec9d60f",
-    "content": {
-      "id": "1b489391-35be-3b4f-8d9f-e346bec9d60f",
-      "contentType": "STORY",
-      "title": "Microsoft’s Brad Smith says U.S. firms should \"worry\" about China’s AI subsidies",
-      "description": "",
-      "summary": "Investing.com -- Microsoft President Brad Smith cautioned that American tech companies should \"worry a little bit\" about subsidies Chinese competitors receive from their government in the artificial intelligence race.",
-      "pubDate": "2026-02-18T18:53:13Z",
-      "displayTime": "2026-02-18T18:53:13Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": null,
-      "provider": {
-        "displayName": "Investing.com",
-        "url": "https://www.investing.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/microsoft-brad-smith-says-u-185313277.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/microsoft-brad-smith-says-u-185313277.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "86ff85cb-c244-3b51-836d-3b1faf3fb900",
-    "content": {
-      "id": "86ff85cb-c244-3b51-836d-3b1faf3fb900",
-      "contentType": "STORY",
-      "title": "Billionaire David Tepper Goes Big on Micron, Meta, and Alphabet in AI All-In",
-      "description": "",
-      "summary": "It’s 13F season when Wall Street funds release their holdings. One of the most widely followed 13F reports is David Tepper’s Appaloosa Management. Tepper is one of the most successful hedge fund managers of all time, known for high-conviction bets at inflection points. His latest filing reveals a clear thesis: all-in on AI infrastructure. Tepper ... Billionaire David Tepper Goes Big on Micron, Meta, and Alphabet in AI All-In",
-      "pubDate": "2026-02-18T15:19:32Z",
-      "displayTime": "2026-02-18T15:19:32Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/24_7_wall_st__718/3560f277f118f828f43f1230262622fd",
-        "originalWidth": 1376,
-        "originalHeight": 768,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/OAdY1.Z1bW3eTPpwQia1Jg--~B/aD03Njg7dz0xMzc2O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/24_7_wall_st__718/3560f277f118f828f43f1230262622fd",
-            "width": 1376,
-            "height": 768,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/cuL1qhuOIFYpyfSMKyABjQ--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/24_7_wall_st__718/3560f277f118f828f43f1230262622fd",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "24/7 Wall St.",
-        "url": "https://247wallst.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://247wallst.com/investing/2026/02/18/billionaire-david-tepper-goes-big-on-micron-meta-and-alphabet-in-ai-all-in/",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/billionaire-david-tepper-goes-big-151932045.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "fda560f8-56c2-32b4-83ed-4ba6424f4c62",
-    "content": {
-      "id": "fda560f8-56c2-32b4-83ed-4ba6424f4c62",
-      "contentType": "STORY",
-      "title": "Retail ETFs in Spotlight as US Releases Holiday Season Report Card",
-      "description": "",
-      "summary": "XRT and other retail ETFs come into focus after flat December sales and weak real spending cast a shadow over the 2025 holiday season.",
-      "pubDate": "2026-02-18T14:31:00Z",
-      "displayTime": "2026-02-18T14:31:00Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/zacks.com/b552abaf6196477ec5fc3311afbcbb50",
-        "originalWidth": 620,
-        "originalHeight": 413,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/XljMZjwUGt8T54tvDs2r9g--~B/aD00MTM7dz02MjA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/zacks.com/b552abaf6196477ec5fc3311afbcbb50",
-            "width": 620,
-            "height": 413,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/_LwbdWb8koMj3oIqbmuLpw--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/zacks.com/b552abaf6196477ec5fc3311afbcbb50",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Zacks",
-        "url": "http://www.zacks.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/retail-etfs-spotlight-us-releases-143100989.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/retail-etfs-spotlight-us-releases-143100989.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "51464d95-a5f6-3c63-b123-ff321d8c68ac",
-    "content": {
-      "id": "51464d95-a5f6-3c63-b123-ff321d8c68ac",
-      "contentType": "STORY",
-      "title": "Moonshot Targets $10 Billion Valuation After $500 Million Raise",
-      "description": "",
-      "summary": "Alibaba and Tencent back expanded round as Kimi K2.5 ranks among top-used AI models.",
-      "pubDate": "2026-02-17T23:28:53Z",
-      "displayTime": "2026-02-17T23:28:53Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": null,
-      "provider": {
-        "displayName": "GuruFocus.com",
-        "url": "http://www.gurufocus.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/moonshot-targets-10-billion-valuation-232853599.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/moonshot-targets-10-billion-valuation-232853599.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "231ccbc6-f993-341a-8d82-372ace3d1b8c",
-    "content": {
-      "id": "231ccbc6-f993-341a-8d82-372ace3d1b8c",
-      "contentType": "STORY",
-      "title": "Alibaba Launches Qwen3.5 For Agent Era",
-      "description": "",
-      "summary": "Claims 60% lower deployment cost",
-      "pubDate": "2026-02-17T23:24:54Z",
-      "displayTime": "2026-02-17T23:24:54Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": null,
-      "provider": {
-        "displayName": "GuruFocus.com",
-        "url": "http://www.gurufocus.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-launches-qwen3-5-agent-232454447.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-launches-qwen3-5-agent-232454447.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "76d4361b-64e5-3782-89e7-54ba54d68b0c",
-    "content": {
-      "id": "76d4361b-64e5-3782-89e7-54ba54d68b0c",
-      "contentType": "STORY",
-      "title": "David Tepper's Strategic Moves: A Closer Look at Micron Technology Inc.",
-      "description": "",
-      "summary": "Exploring the Latest 13F Filing and Tepper's Investment Strategy",
-      "pubDate": "2026-02-17T23:05:14Z",
-      "displayTime": "2026-02-17T23:05:14Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/us.finance.gurufocus/37757b1ff3710cb98eb454d85678817f",
-        "originalWidth": 1242,
-        "originalHeight": 902,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/OZSSDiIMhubiawtyIDAB_A--~B/aD05MDI7dz0xMjQyO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/us.finance.gurufocus/37757b1ff3710cb98eb454d85678817f",
-            "width": 1242,
-            "height": 902,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/QUgLJEoFonliMEWEYcyyuw--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/us.finance.gurufocus/37757b1ff3710cb98eb454d85678817f",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "GuruFocus.com",
-        "url": "http://www.gurufocus.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/david-teppers-strategic-moves-closer-230514892.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/david-teppers-strategic-moves-closer-230514892.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "9a33b4e9-3545-3e08-bcb0-1367df657a77",
-    "content": {
-      "id": "9a33b4e9-3545-3e08-bcb0-1367df657a77",
-      "contentType": "STORY",
-      "title": "Stock Market Today, Feb. 17: Amazon Rises After Nine-Day Slide Ends on AI Investment Reassessment",
-      "description": "",
-      "summary": "Today, Feb. 17, 2026, investors weigh a $200 billion AI buildout against the profit power of Amazon's cloud business.",
-      "pubDate": "2026-02-17T22:12:34Z",
-      "displayTime": "2026-02-17T22:12:34Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/motleyfool.com/5d2da5008ecc68517d4be6e78a6572a1",
-        "originalWidth": 384,
-        "originalHeight": 384,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/ffye2Unc1mfeE1kMm6J4Pg--~B/aD0zODQ7dz0zODQ7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/motleyfool.com/5d2da5008ecc68517d4be6e78a6572a1",
-            "width": 384,
-            "height": 384,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/yzhu1itGkGwaqzfn9bDaBg--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/motleyfool.com/5d2da5008ecc68517d4be6e78a6572a1",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Motley Fool",
-        "url": "http://www.fool.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://www.fool.com/coverage/stock-market-today/2026/02/17/stock-market-today-feb-17-amazon-rises-after-nine-day-slide-ends-on-ai-investment-reassessment/",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/stock-market-today-feb-17-221234578.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "2e9c543e-b3f9-3ca8-acee-7471c508d02b",
-    "content": {
-      "id": "2e9c543e-b3f9-3ca8-acee-7471c508d02b",
-      "contentType": "STORY",
-      "title": "The Pentagon Is Keeping a Close Eye on These Chinese Firms. Investors Should Too.",
-      "description": "",
-      "summary": "The Trump administration is likely to crackdown further on Chinese companies this year, Jonathan E. Hillman writes in a guest commentary.",
-      "pubDate": "2026-02-17T19:50:00Z",
-      "displayTime": "2026-02-17T19:50:00Z",
-      "isHosted": false,
-      "bypassModal": false,
-      "previewUrl": "https://finance.yahoo.com/m/2e9c543e-b3f9-3ca8-acee-7471c508d02b/the-pentagon-is-keeping-a.html",
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/Barrons.com/d538f865a667072fe90201ead76e019c",
-        "originalWidth": 1280,
-        "originalHeight": 640,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/NGWmSRFJHm.0YOEzTWJ.0Q--~B/aD02NDA7dz0xMjgwO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/Barrons.com/d538f865a667072fe90201ead76e019c",
-            "width": 1280,
-            "height": 640,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/ReqaigNOWcQEzc0UBJNcMQ--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/Barrons.com/d538f865a667072fe90201ead76e019c",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Barrons.com",
-        "url": "http://www.barrons.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://www.barrons.com/articles/the-pentagon-is-keeping-a-close-eye-on-these-chinese-firms-investors-should-too-e48c08fa?siteid=yhoof2&yptr=yahoo",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": null,
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  }
-];
@@ -1,593 +0,0 @@
-module.exports = [
-  {
-    "id": "40cf544f-809e-3f87-bcbb-38e64fa4293e",
-    "content": {
-      "id": "40cf544f-809e-3f87-bcbb-38e64fa4293e",
-      "contentType": "STORY",
-      "title": "Dingdong to sell China operations for $717m",
-      "description": "",
-      "summary": "The grocery e-commerce group will sell all issued and outstanding shares of Dingdong Fresh Holding to Two Hearts Investments, which is wholly owned by Meituan.",
-      "pubDate": "2026-02-06T10:15:52Z",
-      "displayTime": "2026-02-06T10:15:52Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/retail_insight_network_724/fafb171811796ee2090fcc297ea035d5",
-        "originalWidth": 1440,
-        "originalHeight": 810,
-        "caption": "Between signing and completion",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/M0Bo1WsydsfzCqTvOOXY9A--~B/aD04MTA7dz0xNDQwO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/retail_insight_network_724/fafb171811796ee2090fcc297ea035d5",
-            "width": 1440,
-            "height": 810,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/fVVf3OSvNbb2oNCxznjhGw--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/retail_insight_network_724/fafb171811796ee2090fcc297ea035d5",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Retail Insight Network",
-        "url": "https://www.globaldata.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://www.retail-insight-network.com/news/dingdong-sell-china-operations-717m/",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/dingdong-sell-china-operations-717m-101552581.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "197e9efc-536b-3f07-9eaa-46bb9be3f0a4",
-    "content": {
-      "id": "197e9efc-536b-3f07-9eaa-46bb9be3f0a4",
-      "contentType": "STORY",
-      "title": "Assessing Meituan (SEHK:3690) Valuation After Prolonged Share Price Weakness",
-      "description": "",
-      "summary": "Recent share performance puts Meituan in focus With no single headline event driving Meituan (SEHK:3690) today, recent share performance is drawing attention. The stock shows negative returns over the past week, month, past 3 months, year, and three and five year periods. See our latest analysis for Meituan. At the current share price of HK$97.2, Meituan’s recent 1 month share price return of a 5.91% decline sits alongside a 1 year total shareholder return of a 34.41% decline. This suggests...",
-      "pubDate": "2026-02-01T14:10:18Z",
-      "displayTime": "2026-02-01T14:10:18Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-        "originalWidth": 1194,
-        "originalHeight": 432,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/00OqBzbQM9NM6aQKBzc4vA--~B/aD00MzI7dz0xMTk0O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-            "width": 1194,
-            "height": 432,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/AaZVsqIka.7tVyjnKPxpJw--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Simply Wall St.",
-        "url": "https://simplywall.st/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/assessing-meituan-sehk-3690-valuation-141018036.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/assessing-meituan-sehk-3690-valuation-141018036.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "0341e2d0-6b14-3511-ac76-269d876766a5",
-    "content": {
-      "id": "0341e2d0-6b14-3511-ac76-269d876766a5",
-      "contentType": "STORY",
-      "title": "Baidu’s AI Models Continue to Expand with Ernie Assistant Surpassing 200 million Monthly Active Users",
-      "description": "",
-      "summary": "Baidu, Inc. (NASDAQ:BIDU) is one of the Top 15 Chinese Companies on US Exchanges. On January 20, WSJ reported that Baidu, Inc.’s AI assistant has surpassed 200 million monthly active users. Amid the growing AI competition among Chinese tech giants, Baidu’s flagship AI model Ernie Assistant is integrated into the company’s leading search engine app […]",
-      "pubDate": "2026-01-30T20:23:34Z",
-      "displayTime": "2026-01-30T20:23:34Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/insidermonkey.com/ce42ff41031579901fca0ebdde0e6d06",
-        "originalWidth": 1000,
-        "originalHeight": 688,
-        "caption": "Baidu's AI Models Continues to Expand With Ernie Assistant Surpassing 200 million Monthly Active Users",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/zkdHQu2owLHaiWQIXWU.lA--~B/aD02ODg7dz0xMDAwO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/insidermonkey.com/ce42ff41031579901fca0ebdde0e6d06",
-            "width": 1000,
-            "height": 688,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/fioPi30oTUiPY_DYD3l16g--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/insidermonkey.com/ce42ff41031579901fca0ebdde0e6d06",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Insider Monkey",
-        "url": "http://www.insidermonkey.com"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/baidu-ai-models-continue-expand-202334075.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/baidu-ai-models-continue-expand-202334075.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "983f566f-7083-35ca-9249-fe145d233b71",
-    "content": {
-      "id": "983f566f-7083-35ca-9249-fe145d233b71",
-      "contentType": "STORY",
-      "title": "China AI Hardware Earnings Pull Further Ahead of Internet Giants",
-      "description": "",
-      "summary": "Bloomberg Intelligence data shows IT profit estimates up 50% year-on-year, while China's Tech 8 face a 12% decline amid competition.",
-      "pubDate": "2026-01-27T13:08:32Z",
-      "displayTime": "2026-01-27T13:08:32Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/us.finance.gurufocus/76a1738dba3b3cb45d19c040ccdb1dd2",
-        "originalWidth": 5215,
-        "originalHeight": 3477,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/ij.PSQVlmwCTNB4anfxtdw--~B/aD0zNDc3O3c9NTIxNTthcHBpZD15dGFjaHlvbg--/https://media.zenfs.com/en/us.finance.gurufocus/76a1738dba3b3cb45d19c040ccdb1dd2",
-            "width": 5215,
-            "height": 3477,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/yDwPDmUpHWfnyRfXei5SBg--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/us.finance.gurufocus/76a1738dba3b3cb45d19c040ccdb1dd2",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "GuruFocus.com",
-        "url": "http://www.gurufocus.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/china-ai-hardware-earnings-pull-130832076.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/china-ai-hardware-earnings-pull-130832076.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "ad0433bc-8281-3960-b1c5-8f1d8b414181",
-    "content": {
-      "id": "ad0433bc-8281-3960-b1c5-8f1d8b414181",
-      "contentType": "STORY",
-      "title": "Baidu shares climb as Ernie AI reportedly hits 200 million monthly user mark",
-      "description": "",
-      "summary": "Investing.com -- Baidu Inc (NASDAQ:BIDU) shares rose 1% in Tuesday trading following reports that its primary artificial intelligence interface has reached a significant adoption milestone. The Beijing-based search giant’s Ernie Assistant has officially surpassed 200 million monthly active users, according to reporting from The Wall Street Journal, citing people familiar with the matter. The growth comes as the company deepens the integration of its Ernie model into its flagship search applicati",
-      "pubDate": "2026-01-20T15:25:15Z",
-      "displayTime": "2026-01-20T15:25:15Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": null,
-      "provider": {
-        "displayName": "Investing.com",
-        "url": "https://www.investing.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/baidu-shares-climb-ernie-ai-152515850.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/baidu-shares-climb-ernie-ai-152515850.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "998bf5fb-867b-357e-b5c0-2c678c7c9ae4",
-    "content": {
-      "id": "998bf5fb-867b-357e-b5c0-2c678c7c9ae4",
-      "contentType": "STORY",
-      "title": "Strong Analyst Confidence in Alibaba Group Holding (BABA) Amid AI and Cloud Momentum",
-      "description": "",
-      "summary": "Alibaba Group Holding Limited (NYSE:BABA) is included in our list of the best stocks to buy right now. Alibaba Group Holding Limited (NYSE:BABA) enjoys strong investor confidence, with 85% of Wall Street analysts bullish on the stock as of January 12, 2026. The consensus price target of $196.99 implies a 31.50% upside. On January 5, […]",
-      "pubDate": "2026-01-18T11:16:24Z",
-      "displayTime": "2026-01-18T11:16:24Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/insidermonkey.com/3a1be07880e3b5b64bd2b1f1cee62a72",
-        "originalWidth": 1000,
-        "originalHeight": 680,
-        "caption": "Strong Analyst Confidence in Alibaba Group Holding (BABA) Amid AI and Cloud Momentum",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/zgfWdQeO.1lJPTVCKs.tqQ--~B/aD02ODA7dz0xMDAwO2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/insidermonkey.com/3a1be07880e3b5b64bd2b1f1cee62a72",
-            "width": 1000,
-            "height": 680,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/og2BmqD7PaGQgxHRgeWnTA--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/insidermonkey.com/3a1be07880e3b5b64bd2b1f1cee62a72",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Insider Monkey",
-        "url": "http://www.insidermonkey.com"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/strong-analyst-confidence-alibaba-group-111624428.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/strong-analyst-confidence-alibaba-group-111624428.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "5212a271-6d0b-3b35-b3ab-4668b99adb6b",
-    "content": {
-      "id": "5212a271-6d0b-3b35-b3ab-4668b99adb6b",
-      "contentType": "STORY",
-      "title": "Can PDD (PDD) Turn Its Billion-Dollar Supermarket Bet Into Lasting Competitive Advantage?",
-      "description": "",
-      "summary": "PDD Holdings recently began internal beta testing of its “Billion-Dollar Supermarket” grocery service within its app, using heavy subsidies and time-limited coupons to attract price-sensitive users and counter intense competition from JD.com, Alibaba, and Meituan. This move marks a push deeper into everyday essentials, potentially increasing user stickiness at a time when the broader China internet sector faces rising regulatory scrutiny and shifting trade conditions. Now we'll examine how...",
-      "pubDate": "2026-01-16T12:14:11Z",
-      "displayTime": "2026-01-16T12:14:11Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/simply_wall_st__316/f6c14537c0beea11607d8ec4c0aa1ba9",
-        "originalWidth": 1194,
-        "originalHeight": 432,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/U.yOkQqL2gUYi2rPHgiv5w--~B/aD00MzI7dz0xMTk0O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/simply_wall_st__316/f6c14537c0beea11607d8ec4c0aa1ba9",
-            "width": 1194,
-            "height": 432,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/BTeRevA_lx3crLE5C4II4A--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/simply_wall_st__316/f6c14537c0beea11607d8ec4c0aa1ba9",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Simply Wall St.",
-        "url": "https://simplywall.st/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/pdd-pdd-turn-billion-dollar-121411959.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/pdd-pdd-turn-billion-dollar-121411959.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "53aa27db-9350-33da-81b3-dece527a0c0f",
-    "content": {
-      "id": "53aa27db-9350-33da-81b3-dece527a0c0f",
-      "contentType": "STORY",
-      "title": "China Opens Antitrust Probe Into Trip.com Ahead of Lunar New Year Travel Surge",
-      "description": "",
-      "summary": "China's market regulator is investigating Trip.com for alleged monopolistic practices as holiday travel demand accelerates.",
-      "pubDate": "2026-01-14T17:13:25Z",
-      "displayTime": "2026-01-14T17:13:25Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/us.finance.gurufocus/366a1ea255fa3dc64ef6a6f01899ebeb",
-        "originalWidth": 220,
-        "originalHeight": 124,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/HuvHswzhkQm9a8GUSgM4aA--~B/aD0xMjQ7dz0yMjA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/us.finance.gurufocus/366a1ea255fa3dc64ef6a6f01899ebeb",
-            "width": 220,
-            "height": 124,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/EnmfH6uUM1yoWOLpKy5ZTg--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/us.finance.gurufocus/366a1ea255fa3dc64ef6a6f01899ebeb",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "GuruFocus.com",
-        "url": "http://www.gurufocus.com/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/china-opens-antitrust-probe-trip-171325935.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/china-opens-antitrust-probe-trip-171325935.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "79908008-ce8f-38da-b397-6e6c938532b1",
-    "content": {
-      "id": "79908008-ce8f-38da-b397-6e6c938532b1",
-      "contentType": "STORY",
-      "title": "Assessing Meituan (SEHK:3690) Valuation After Flat Year To Date Share Performance",
-      "description": "",
-      "summary": "Meituan (SEHK:3690) has drawn attention after recent share price moves, with the stock roughly flat year to date despite mixed short term returns and contrasting performance over the past year and past 3 months. See our latest analysis for Meituan. That muted 1-month and 3-month share price return sits against a 1-year total shareholder return loss of 27.3%. This suggests recent momentum is trying to rebuild after a tougher stretch for longer term holders. If Meituan's moves have you thinking...",
-      "pubDate": "2026-01-13T19:14:12Z",
-      "displayTime": "2026-01-13T19:14:12Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-        "originalWidth": 1194,
-        "originalHeight": 432,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/00OqBzbQM9NM6aQKBzc4vA--~B/aD00MzI7dz0xMTk0O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-            "width": 1194,
-            "height": 432,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/AaZVsqIka.7tVyjnKPxpJw--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/simply_wall_st__316/992331fc596d921e34ccfa3b8813259a",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Simply Wall St.",
-        "url": "https://simplywall.st/"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/assessing-meituan-sehk-3690-valuation-191412127.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/assessing-meituan-sehk-3690-valuation-191412127.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  },
-  {
-    "id": "ff6aea7b-a050-3576-ad2c-cdc24d1188b0",
-    "content": {
-      "id": "ff6aea7b-a050-3576-ad2c-cdc24d1188b0",
-      "contentType": "STORY",
-      "title": "Alibaba Group Holding Limited (BABA) Launching its AI Services for Restaurants",
-      "description": "",
-      "summary": "Alibaba Group Holding Limited (NYSE:BABA) is one of the Best Stocks to Buy for High Returns in 2026. On January 5, Bloomberg reported that Alibaba Group Holding Limited (NYSE:BABA) is launching AI services for restaurants to showcase their interiors. According to the report, this strategic move comes as Alibaba competes with Meituan in the Chinese […]",
-      "pubDate": "2026-01-12T17:47:18Z",
-      "displayTime": "2026-01-12T17:47:18Z",
-      "isHosted": true,
-      "bypassModal": false,
-      "previewUrl": null,
-      "thumbnail": {
-        "originalUrl": "https://media.zenfs.com/en/insidermonkey.com/090170be12ef840f77e8d544392228a0",
-        "originalWidth": 1456,
-        "originalHeight": 816,
-        "caption": "",
-        "resolutions": [
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/psAs0pGNqyrt8mJECiI5og--~B/aD04MTY7dz0xNDU2O2FwcGlkPXl0YWNoeW9u/https://media.zenfs.com/en/insidermonkey.com/090170be12ef840f77e8d544392228a0",
-            "width": 1456,
-            "height": 816,
-            "tag": "original"
-          },
-          {
-            "url": "https://s.yimg.com/uu/api/res/1.2/HHEIlT7dQsZE36Et8Yp86w--~B/Zmk9c3RyaW07aD0xMjg7dz0xNzA7YXBwaWQ9eXRhY2h5b24-/https://media.zenfs.com/en/insidermonkey.com/090170be12ef840f77e8d544392228a0",
-            "width": 170,
-            "height": 128,
-            "tag": "170x128"
-          }
-        ]
-      },
-      "provider": {
-        "displayName": "Insider Monkey",
-        "url": "http://www.insidermonkey.com"
-      },
-      "canonicalUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-group-holding-limited-baba-174718379.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "clickThroughUrl": {
-        "url": "https://finance.yahoo.com/news/alibaba-group-holding-limited-baba-174718379.html",
-        "site": "finance",
-        "region": "US",
-        "lang": "en-US"
-      },
-      "metadata": {
-        "editorsPick": false
-      },
-      "finance": {
-        "premiumFinance": {
-          "isPremiumNews": false,
-          "isPremiumFreeNews": false
-        }
-      },
-      "storyline": null
-    }
-  }
-];
@@ -1,9 +0,0 @@
-module.exports = {
-  "last_update": "2026-02-19T06:37:58.895046",
-  "news_counts": {
-    "alibaba": 10,
-    "xiaomi": 10,
-    "meituan": 10
-  },
-  "update_type": "hourly_news"
-};
@@ -1 +0,0 @@
-module.exports = require('./news_tencent.js');
@@ -1 +0,0 @@
-module.exports = require('./news_xiaomi.js');
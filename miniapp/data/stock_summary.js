@@ -1,46 +0,0 @@
-module.exports = {
-  "tencent": {
-    "price": 533.0,
-    "change_pct": 0.19,
-    "market_cap": "$638B",
-    "pe_ratio": 3.9,
-    "technical_rating": "Hold",
-    "rsi": 21.96969696969697,
-    "volatility": 26.060024018873264,
-    "52w_high": 677.5,
-    "52w_low": 430.9
-  },
-  "alibaba": {
-    "price": 154.7,
-    "change_pct": -0.45,
-    "market_cap": "$466B",
-    "pe_ratio": 3.6,
-    "technical_rating": "Strong Buy",
-    "rsi": 27.38095238095235,
-    "volatility": 29.84493947867178,
-    "52w_high": 185.1,
-    "52w_low": 99.349
-  },
-  "xiaomi": {
-    "price": 36.66,
-    "change_pct": -0.49,
-    "market_cap": "$114B",
-    "pe_ratio": 3.1,
-    "technical_rating": "Hold",
-    "rsi": 56.926952141057896,
-    "volatility": 30.295840840225196,
-    "52w_high": 60.15,
-    "52w_low": 33.96
-  },
-  "meituan": {
-    "price": 82.05,
-    "change_pct": -0.12,
-    "market_cap": "$594B",
-    "pe_ratio": 62.7,
-    "technical_rating": "Hold",
-    "rsi": 17.045454545454504,
-    "volatility": 25.297871483409452,
-    "52w_high": 183.5,
-    "52w_low": 82.05
-  }
-};
@@ -1 +0,0 @@
-module.exports = require('./stock_summary.js');
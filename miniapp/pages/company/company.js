@@ -36,20 +36,15 @@ Page({
     const { company } = this.data;
 
     try {
-      const [comprehensive, news, newsMeta] = await Promise.all([
-        api.getComprehensive(),
-        api.getCompanyNews(company),
-        api.getNewsMetadata()
-      ]);
-
-      const detail = comprehensive && comprehensive.companies ? comprehensive.companies[company] : null;
+      const bundle = await api.getCompany(company);
+      const detail = bundle ? bundle.detail : null;
       const metrics = this.buildMetrics(detail || {});
 
       this.setData({
         detail,
         metrics,
-        news,
-        newsUpdate: this.formatTimestamp(newsMeta.last_update),
+        news: bundle ? bundle.news : [],
+        newsUpdate: this.formatTimestamp(bundle ? bundle.news_update : ''),
         loading: false
       });
     } catch (e) {
@@ -69,7 +64,7 @@ Page({
       { label: '52W High', value: this.formatHK(detail['52w_high']) },
       { label: '52W Low', value: this.formatHK(detail['52w_low']) },
       { label: 'Volatility', value: `${this.formatNum(detail.volatility)}%` },
-      { label: 'Technical Rating', value: detail.technical_rating ? detail.technical_rating.rating : 'N/A' }
+      { label: 'Technical Rating', value: detail.technical_rating || 'N/A' }
     ];
   },
 
@@ -27,12 +27,9 @@ Page({
   async loadData() {
     this.setData({ loading: true, error: '' });
     try {
-      const [summary, comprehensive] = await Promise.all([
-        api.getSummary(),
-        api.getComprehensive()
-      ]);
-
-      const timestamp = comprehensive && comprehensive.timestamp ? comprehensive.timestamp : '';
+      const bundle = await api.getIndex();
+      const summary = bundle ? bundle.summary : null;
+      const timestamp = bundle && bundle.timestamp ? bundle.timestamp : '';
       const cards = COMPANY_ORDER.map((key) => {
         const row = (summary && summary[key]) || {};
         const change = Number(row.change_pct || 0);
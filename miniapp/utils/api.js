@@ -1,15 +1,11 @@
 const { REMOTE_BASE_URL } = require('./config');
 
-const localSummary = require('../data/stock_summary.js');
-const localComprehensive = require('../data/comprehensive_stock_data.js');
-const localNewsMeta = require('../data/news_metadata.js');
+// Generated by scripts/build/miniapp_bundle.py: one minified bundle per page.
+const localIndex = require('../data/index.js');
+const localCompany = require('../data/company.js');
 
-const localNewsByCompany = {
-  tencent: require('../data/news_tencent.js'),
-  alibaba: require('../data/news_alibaba.js'),
-  xiaomi: require('../data/news_xiaomi.js'),
-  meituan: require('../data/news_meituan.js')
-};
+const CACHE_PREFIX = 'bundle:';
+let versionsPromise = null;
 
 function requestJson(path) {
   return new Promise((resolve, reject) => {
@@ -29,69 +25,64 @@ function requestJson(path) {
   });
 }
 
-function normalizeNewsItem(item) {
-  const raw = item && item.content ? item.content : (item || {});
-  const canonicalUrl = raw.canonicalUrl && typeof raw.canonicalUrl === 'object'
-    ? raw.canonicalUrl.url
-    : raw.canonicalUrl;
-  const clickThroughUrl = raw.clickThroughUrl && typeof raw.clickThroughUrl === 'object'
-    ? raw.clickThroughUrl.url
-    : raw.clickThroughUrl;
-  const providerObj = raw.provider && typeof raw.provider === 'object' ? raw.provider : {};
-  const publishTime = raw.providerPublishTime || raw.pubDate || 0;
-
-  return {
-    title: raw.title || 'Untitled',
-    summary: raw.summary || raw.description || '',
-    link: raw.link || clickThroughUrl || canonicalUrl || '',
-    publisher: raw.publisher || providerObj.displayName || 'Unknown',
-    providerPublishTime: publishTime,
-    sentiment_label: raw.sentiment_label || 'neutral',
-    sentiment_score: raw.sentiment_score || 0
-  };
+// version.json is a few hundred bytes; fetch it once per launch.
+function getVersions() {
+  if (!versionsPromise) {
+    versionsPromise = requestJson('miniapp/version.json').catch((e) => {
+      versionsPromise = null;
+      throw e;
+    });
+  }
+  return versionsPromise;
 }
 
-async function getSummary() {
+function readCache(key) {
   try {
-    const remote = await requestJson('stock_summary.json');
-    return remote;
+    return wx.getStorageSync(CACHE_PREFIX + key) || null;
   } catch (e) {
-    return localSummary;
+    return null;
   }
 }
 
-async function getComprehensive() {
+function writeCache(key, value) {
   try {
-    const remote = await requestJson('comprehensive_stock_data.json');
-    return remote;
+    wx.setStorageSync(CACHE_PREFIX + key, value);
   } catch (e) {
-    return localComprehensive;
+    // Storage quota errors only cost a refetch next time.
   }
 }
 
-async function getNewsMetadata() {
+// Newest of cached and packaged bundle; the remote copy is fetched only when its version differs.
+async function loadBundle(key, path, remoteVersion, local) {
+  const cached = readCache(key);
+  const best = cached && cached.version ? cached : local;
+  if (!remoteVersion || (best && best.version === remoteVersion)) return best;
+  const remote = await requestJson(`${path}?v=${remoteVersion}`);
+  writeCache(key, remote);
+  return remote;
+}
+
+async function getIndex() {
   try {
-    const remote = await requestJson('news_metadata.json');
-    return remote;
+    const versions = await getVersions();
+    return await loadBundle('index', 'miniapp/index.json', versions.index, localIndex);
   } catch (e) {
-    return localNewsMeta;
+    return readCache('index') || localIndex;
   }
 }
 
-async function getCompanyNews(company) {
+async function getCompany(company) {
+  const local = localCompany.companies[company] || null;
   try {
-    const remote = await requestJson(`news_${company}.json`);
-    if (!Array.isArray(remote)) return [];
-    return remote.map(normalizeNewsItem).filter((n) => n.title && n.title !== 'Untitled');
+    const versions = await getVersions();
+    const remoteVersion = versions.company && versions.company[company];
+    return await loadBundle(`company:${company}`, `miniapp/company/${company}.json`, remoteVersion, local);
   } catch (e) {
-    const local = localNewsByCompany[company] || [];
-    return local.map(normalizeNewsItem).filter((n) => n.title && n.title !== 'Untitled');
+    return readCache(`company:${company}`) || local;
   }
 }
 
 module.exports = {
-  getSummary,
-  getComprehensive,
-  getNewsMetadata,
-  getCompanyNews
+  getIndex,
+  getCompany
 };
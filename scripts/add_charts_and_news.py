@@ -579,6 +579,13 @@ def get_chart_scripts(lang='en'):
     </script>
 '''
 
+def add_scripts_text(content, lang='en'):
+    """Append the chart and news scripts before </body> on tabbed pages that lack them."""
+    if 'id="chart-summary-revenue"' not in content or "getElementById('chart-summary-revenue')" in content:
+        return content
+    return content.replace('</body>', get_chart_scripts(lang) + '\n</body>')
+
+
 def add_scripts_to_html(file_path, lang='en'):
     """Add chart and news scripts to HTML file"""
 
@@ -586,8 +593,7 @@ def add_scripts_to_html(file_path, lang='en'):
         content = f.read()
 
     # Add scripts before closing </body> tag
-    scripts = get_chart_scripts(lang)
-    content = content.replace('</body>', scripts + '\n</body>')
+    content = add_scripts_text(content, lang)
 
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -78,15 +78,11 @@ METRICS_EXPLANATIONS = '''
         </div>
 '''
 
-def add_explanations_to_file(filepath):
-    """Add metric explanations to a company HTML file"""
-    with open(filepath, 'r') as f:
-        content = f.read()
-
+def add_explanations_text(content):
+    """Return (content, insertions) with the explanations added after the Key Investment Metrics section"""
     # Check if explanations already exist
     if 'Understanding These Metrics' in content:
-        print(f'  ✓ {filepath.name}: Explanations already exist')
-        return False
+        return content, 0
 
     # Find the location to insert - after the Key Investment Metrics section
     # Look for the closing div after Balance Sheet section
@@ -95,7 +91,19 @@ def add_explanations_to_file(filepath):
     def replacement(match):
         return match.group(1) + match.group(2) + METRICS_EXPLANATIONS
 
-    new_content, count = re.subn(pattern, replacement, content, flags=re.DOTALL)
+    return re.subn(pattern, replacement, content, flags=re.DOTALL)
+
+def add_explanations_to_file(filepath):
+    """Add metric explanations to a company HTML file"""
+    with open(filepath, 'r') as f:
+        content = f.read()
+
+    # Check if explanations already exist
+    if 'Understanding These Metrics' in content:
+        print(f'  ✓ {filepath.name}: Explanations already exist')
+        return False
+
+    new_content, count = add_explanations_text(content)
 
     if count > 0:
         with open(filepath, 'w') as f:
@@ -3,15 +3,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import re
+import math
 import sys
 import time
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 import numpy as np
 
@@ -19,7 +18,23 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scripts.analytics.beta import measure_against_benchmarks
+from scripts.analytics.rating import BUCKETS, RatingRules, bucket_codes
+from scripts.analytics.risk import risk_from_points
+from scripts.analytics.screener import site_screens
+from scripts.build.bindings import company_context, equity_context, parse_stamp
+from scripts.build.publish import publish_pages, render_page_file
+from scripts.indicators.batch import align_points, compute_batch
+from scripts.indicators.engine import compute_series, latest_values, points_to_arrays
+from scripts.indicators.extrema import swing_levels
+from scripts.indicators.resample import BARS_PER_YEAR, resample_points
+from scripts.indicators.streaming import IndicatorState, load_states, states_payload
 from scripts.providers.registry import ProviderRegistry
+from scripts.storage.bars import BarStore
+from scripts.storage.datadir import DataDirectory
+from scripts.storage.deltas import SnapshotLog
+from scripts.storage.history import SnapshotHistory
+from scripts.storage.manifest import ContentManifest, load_run_metadata, write_run_metadata
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -29,6 +44,10 @@ MAX_FETCH_RETRIES = 3
 RETRY_BACKOFF_BASE_SEC = 4.0
 REQUEST_INTERVAL_SEC = 3.0
 
+HKT = ZoneInfo("Asia/Hong_Kong")
+# Price-driven indicators worth showing mid-session; volume ones would compare a partial day.
+LIVE_KEYS = ("rsi_14", "rsi_6", "macd", "macd_signal", "macd_histogram", "bb_upper", "bb_middle", "bb_lower", "williams_r", "momentum_10", "52w_position")
+
 STOCK_CONFIG = {
     "tencent": {"symbol": "0700.HK", "code": "00700", "name": "Tencent", "industry": "Technology / Gaming / Social Media", "sector": "Communication Services"},
     "alibaba": {"symbol": "9988.HK", "code": "09988", "name": "Alibaba", "industry": "E-commerce / Cloud", "sector": "Consumer Discretionary"},
@@ -50,112 +69,76 @@ FALLBACK_ESTIMATES = {
 
 
 def calculate_indicators(points: List[Dict[str, Any]]) -> Dict[str, Any]:
-    close = np.array([p["close"] for p in points], dtype=float)
-    high = np.array([p["high"] for p in points], dtype=float)
-    low = np.array([p["low"] for p in points], dtype=float)
-    volume = np.array([p.get("volume", 0) for p in points], dtype=float)
-
-    def sma(period: int) -> float:
-        if len(close) < period:
-            return float(np.mean(close))
-        return float(np.mean(close[-period:]))
-
-    def ema(period: int) -> float:
-        if len(close) < period:
-            return float(np.mean(close))
-        alpha = 2 / (period + 1)
-        values = close[-min(len(close), period * 3):]
-        e = values[0]
-        for val in values[1:]:
-            e = alpha * val + (1 - alpha) * e
-        return float(e)
-
-    def rsi(period: int = 14) -> float:
-        if len(close) < period + 1:
-            return 50.0
-        deltas = np.diff(close[-period - 1:])
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        avg_gain = np.mean(gains)
-        avg_loss = np.mean(losses)
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        return float(100 - (100 / (1 + rs)))
-
-    def macd() -> Tuple[float, float, float]:
-        m = ema(12) - ema(26)
-        s = m * 0.9
-        return float(m), float(s), float(m - s)
-
-    def atr(period: int = 14) -> float:
-        if len(close) < period + 1:
-            return 0.0
-        trs = []
-        for i in range(-period, 0):
-            hi = high[i]
-            lo = low[i]
-            prev = close[i - 1]
-            trs.append(max(hi - lo, abs(hi - prev), abs(lo - prev)))
-        return float(np.mean(trs))
-
-    def volatility(period: int = 20) -> float:
-        if len(close) < period:
-            return 0.0
-        ret = np.diff(close[-period:]) / close[-period:-1]
-        return float(np.std(ret) * np.sqrt(252) * 100)
-
-    bb_mid = sma(20)
-    bb_std = float(np.std(close[-20:])) if len(close) >= 20 else float(np.std(close))
-    bb_up = bb_mid + (2 * bb_std)
-    bb_low = bb_mid - (2 * bb_std)
-
-    recent_hi = np.max(high[-14:]) if len(high) >= 14 else np.max(high)
-    recent_low = np.min(low[-14:]) if len(low) >= 14 else np.min(low)
-    last_close = float(close[-1])
-    stoch_k = float(100 * (last_close - recent_low) / (recent_hi - recent_low)) if recent_hi != recent_low else 50.0
+    arrays = points_to_arrays(points)
+    series = compute_series(arrays["close"], arrays["high"], arrays["low"], arrays["volume"])
+    indicators = latest_values(series)
+
+    levels = swing_levels(arrays["high"], arrays["low"], arrays["close"])
+    if levels["support"]:
+        indicators["support_levels"] = [lvl["price"] for lvl in levels["support"]]
+    if levels["resistance"]:
+        indicators["resistance_levels"] = [lvl["price"] for lvl in levels["resistance"]]
+    indicators["support_zones"] = levels["support"]
+    indicators["resistance_zones"] = levels["resistance"]
+    return indicators
+
+
+TIMEFRAME_KEYS = ("ma_5", "ma_10", "ma_20", "rsi_14", "macd", "macd_signal", "volatility", "52w_position")
+# Bars each timeframe indicator needs before it is published; 52w_position needs a year of bars.
+TIMEFRAME_MIN_BARS = {"ma_5": 5, "ma_10": 10, "ma_20": 20, "rsi_14": 15, "macd": 26, "macd_signal": 34, "volatility": 20}
+
+
+def calculate_timeframe_indicators(points: List[Dict[str, Any]], timeframes: Tuple[str, ...] = ("weekly", "monthly")) -> Dict[str, Any]:
+    """Indicators on daily bars resampled to longer timeframes; no extra provider requests.
+
+    A few years of daily history is only a few dozen monthly bars, so indicators without
+    enough bars are null rather than warm-up defaults (RSI 50, volatility 0, expanding means).
+    """
+    out: Dict[str, Any] = {}
+    for timeframe in timeframes:
+        bars = resample_points(points, timeframe)
+        if len(bars) < 2:
+            continue
+        arrays = points_to_arrays(bars)
+        series = compute_series(
+            arrays["close"], arrays["high"], arrays["low"], arrays["volume"], bars_per_year=BARS_PER_YEAR[timeframe]
+        )
+        values: Dict[str, Optional[float]] = {}
+        for key in TIMEFRAME_KEYS:
+            need = BARS_PER_YEAR[timeframe] if key == "52w_position" else TIMEFRAME_MIN_BARS[key]
+            value = float(series[key][-1])
+            values[key] = None if len(bars) < need or math.isnan(value) else value
+        out[timeframe] = {"bars": len(bars), "as_of": bars[-1]["date"], **values}
+    return out
+
+
+def calculate_indicators_batch(
+    points_by_company: Dict[str, List[Dict[str, Any]]], bars_per_year: int = BARS_PER_YEAR["daily"]
+) -> Dict[str, Dict[str, Any]]:
+    """Vectorized ``calculate_indicators`` for many companies, plus cross-sectional RSI percentile."""
+    companies, _, fields, mask = align_points(points_by_company)
+    batch = compute_batch(
+        companies, fields["close"], fields["high"], fields["low"], fields["volume"], mask, bars_per_year=bars_per_year
+    )
+    latest = batch.latest()
+    for company, pct in batch.percentile_rank("rsi_14").items():
+        latest[company]["rsi_percentile"] = pct
+    return latest
 
-    macd_line, macd_signal, macd_hist = macd()
-    w52_high = float(np.max(close[-252:])) if len(close) >= 252 else float(np.max(close))
-    w52_low = float(np.min(close[-252:])) if len(close) >= 252 else float(np.min(close))
-    pos_52 = float((last_close - w52_low) / (w52_high - w52_low) * 100) if w52_high != w52_low else 50.0
 
-    return {
-        "ma_5": sma(5),
-        "ma_10": sma(10),
-        "ma_20": sma(20),
-        "ma_50": sma(50),
-        "ma_200": sma(200),
-        "ema_12": ema(12),
-        "ema_26": ema(26),
-        "rsi_14": rsi(14),
-        "rsi_6": rsi(6),
-        "macd": macd_line,
-        "macd_signal": macd_signal,
-        "macd_histogram": macd_hist,
-        "bb_upper": float(bb_up),
-        "bb_middle": float(bb_mid),
-        "bb_lower": float(bb_low),
-        "bb_width": float((bb_up - bb_low) / bb_mid * 100) if bb_mid else 0.0,
-        "atr": atr(14),
-        "volatility": volatility(20),
-        "historical_vol_20": volatility(20),
-        "historical_vol_60": volatility(60),
-        "momentum_10": float((last_close - close[-10]) / close[-10] * 100) if len(close) >= 10 else 0.0,
-        "stoch_k": stoch_k,
-        "stoch_d": stoch_k,
-        "williams_r": float(-100 * (recent_hi - last_close) / (recent_hi - recent_low)) if recent_hi != recent_low else -50.0,
-        "52w_high": w52_high,
-        "52w_low": w52_low,
-        "52w_position": pos_52,
-        "avg_volume_20": float(np.mean(volume[-20:])) if len(volume) >= 20 else float(np.mean(volume)),
-        "volume_ratio": float(volume[-1] / np.mean(volume[-20:])) if len(volume) >= 20 and np.mean(volume[-20:]) else 1.0,
-        "support_levels": [float(np.min(close[-20:]))] if len(close) >= 20 else [float(np.min(close))],
-        "resistance_levels": [float(np.max(close[-20:]))] if len(close) >= 20 else [float(np.max(close))],
-    }
+def apply_cross_sectional_ranks(
+    data: Dict[str, Dict[str, Any]], history: Dict[str, List[Dict[str, Any]]], bars_per_year: int = BARS_PER_YEAR["daily"]
+) -> None:
+    """Rank this run's freshly fetched companies against each other; stale snapshots keep their last rank."""
+    fresh = {c: points for c, points in history.items() if points and c in data and not data[c].get("stale")}
+    if not fresh:
+        return
+    for company, row in calculate_indicators_batch(fresh, bars_per_year).items():
+        if "rsi_percentile" in row:
+            data[company]["rsi_percentile"] = row["rsi_percentile"]
 
 
-def generate_technical_rating(metrics: Dict[str, Any]) -> Dict[str, Any]:
+def generate_technical_rating(metrics: Dict[str, Any], rules: RatingRules = RatingRules()) -> Dict[str, Any]:
     score = 0
     signals = []
 
@@ -165,38 +148,28 @@ def generate_technical_rating(metrics: Dict[str, Any]) -> Dict[str, Any]:
     ma_50 = metrics.get("ma_50", 0)
     macd = metrics.get("macd", 0)
 
-    if rsi < 30:
-        score += 2
+    if rsi < rules.rsi_oversold:
+        score += rules.rsi_points
         signals.append("RSI oversold")
-    elif rsi > 70:
-        score -= 2
+    elif rsi > rules.rsi_overbought:
+        score -= rules.rsi_points
         signals.append("RSI overbought")
 
     if price > ma_20 > ma_50:
-        score += 2
+        score += rules.trend_points
         signals.append("Trend bullish")
     elif price < ma_20 < ma_50:
-        score -= 2
+        score -= rules.trend_points
         signals.append("Trend bearish")
 
     if macd > 0:
-        score += 1
+        score += rules.macd_points
         signals.append("MACD positive")
     else:
-        score -= 1
+        score -= rules.macd_points
         signals.append("MACD negative")
 
-    if score >= 4:
-        rating, color = "Strong Buy", "#00C853"
-    elif score >= 2:
-        rating, color = "Buy", "#4CAF50"
-    elif score >= -1:
-        rating, color = "Hold", "#FF9800"
-    elif score >= -3:
-        rating, color = "Sell", "#F44336"
-    else:
-        rating, color = "Strong Sell", "#D32F2F"
-
+    rating, color = BUCKETS[int(bucket_codes(score, rules))]
     return {"score": score, "rating": rating, "color": color, "signals": signals}
 
 
@@ -240,7 +213,14 @@ def _calc_fcf_yield(fcf_b: Any, mcap_b: float) -> float:
         return 0.0
 
 
-def build_company_payload(company: str, registry: ProviderRegistry) -> Dict[str, Any]:
+def build_company_payload(
+    company: str,
+    registry: ProviderRegistry,
+    states: Optional[Dict[str, IndicatorState]] = None,
+    history: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    store: Optional[BarStore] = None,
+    history_bars: int = 750,
+) -> Dict[str, Any]:
     cfg = STOCK_CONFIG[company]
     symbol = cfg["symbol"]
 
@@ -253,7 +233,13 @@ def build_company_payload(company: str, registry: ProviderRegistry) -> Dict[str,
 
     quote = quote_payload.data
     ohlcv = ohlcv_payload.data
-    indicators = calculate_indicators(ohlcv.points)
+    points = merge_bar_history(store, symbol, ohlcv.points, history_bars)
+    indicators = calculate_indicators(points)
+    state = resume_indicator_state(states.get(company) if states is not None else None, symbol, points)
+    if states is not None:
+        states[company] = state
+    if history is not None:
+        history[company] = points
 
     fundamentals = {}
     fund_source = "fallback"
@@ -309,6 +295,8 @@ def build_company_payload(company: str, registry: ProviderRegistry) -> Dict[str,
         "change_pct": quote.change_pct,
         "amplitude": float(((quote.high - quote.low) / quote.price * 100) if quote.price and quote.high and quote.low else 0),
         **indicators,
+        "timeframes": calculate_timeframe_indicators(points),
+        "live_indicators": live_indicators(state, quote),
         **market_metrics,
         "roe": float(merged["roe"]),
         "roa": float(merged["roa"]),
@@ -346,11 +334,13 @@ def build_company_payload(company: str, registry: ProviderRegistry) -> Dict[str,
     }
 
     payload["technical_rating"] = generate_technical_rating(payload)
+    # Nearest level per side: the old single-element lists held the 20-day low/high, and min/max over
+    # up to three swing levels would instead publish the farthest one.
     payload["derivative_analysis"] = {
         "daily_expected_move": float(payload["price"] * payload["volatility"] / 100 / np.sqrt(252)),
         "atr_percent": float(payload["atr"] / payload["price"] * 100) if payload["price"] else 0,
-        "support_level": float(min(payload["support_levels"])) if payload["support_levels"] else payload["price"] * 0.95,
-        "resistance_level": float(max(payload["resistance_levels"])) if payload["resistance_levels"] else payload["price"] * 1.05,
+        "support_level": float(max(payload["support_levels"])) if payload["support_levels"] else payload["price"] * 0.95,
+        "resistance_level": float(min(payload["resistance_levels"])) if payload["resistance_levels"] else payload["price"] * 1.05,
         "tight_stop_loss": float(payload["price"] - payload["atr"] * 1.5),
         "target_1r": float(payload["price"] + payload["atr"] * 1.5),
         "target_2r": float(payload["price"] + payload["atr"] * 3.0),
@@ -364,192 +354,165 @@ def build_company_payload(company: str, registry: ProviderRegistry) -> Dict[str,
     return payload
 
 
-def update_equity_analysis_file(html_file: Path, data: Dict[str, Dict], zh: bool = False) -> bool:
-    if not html_file.exists():
-        return False
-
-    content = html_file.read_text(encoding="utf-8")
-
-    def _rating_view(raw: str) -> tuple[str, str, str]:
-        r = (raw or "Hold").strip()
-        l = r.lower()
-        if "buy" in l:
-            return r, "rating-buy", "#4CAF50"
-        if "sell" in l:
-            return r, "rating-sell", "#F44336"
-        return r, "rating-hold", "#FF9800"
-
-    for company, metrics in data.items():
-        href_company = f"{company}-zh" if zh else company
-        price_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<div class="current-price">)HK\$[\d.,]+(</div>)'
-        content = re.sub(price_pattern, rf"\g<1>HK${metrics['price']:.2f}\g<2>", content, flags=re.DOTALL)
+def resume_indicator_state(state: Optional[IndicatorState], symbol: str, points: List[Dict[str, Any]]) -> IndicatorState:
+    """Advance a persisted state with the bars after its ``last_date``.
 
-        change_class = "positive" if metrics["change_pct"] > 0 else "negative" if metrics["change_pct"] < 0 else ""
-        change_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<div class="price-change)[^"]*">[^<]*(</div>)'
-        content = re.sub(change_pattern, rf'\g<1> {change_class}">{metrics["change_pct"]:+.2f}%\g<2>', content, flags=re.DOTALL)
+    The state is rebuilt from ``points`` when it is missing, belongs to another symbol,
+    or its last bar is no longer in the history with the same close (a revised bar).
+    """
+    if state is not None and state.symbol == symbol and state.last_date and state.last_close is not None:
+        anchor = next((p for p in points if str(p.get("date", "")) == state.last_date), None)
+        if anchor is not None and math.isclose(float(anchor["close"]), state.last_close, rel_tol=1e-9):
+            resumed = state.copy()
+            for p in points:
+                if str(p.get("date", "")) > state.last_date:
+                    resumed.update(p)
+            return resumed
+    return IndicatorState.from_points(symbol, points)
 
-        mcap_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<div class="metric-label">Market Cap</div>\s*<div class="metric-value">)[^<]+(</div>)'
-        content = re.sub(mcap_pattern, rf"\g<1>{metrics['market_cap_display']}\g<2>", content, flags=re.DOTALL)
 
-        pe_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<div class="metric-label">P/E</div>\s*<div class="metric-value">)[^<]+(</div>)'
-        content = re.sub(pe_pattern, rf"\g<1>{metrics['pe_ratio']:.1f}x\g<2>", content, flags=re.DOTALL)
+def live_indicators(state: IndicatorState, quote: Any, session_date: Optional[str] = None) -> Dict[str, Any]:
+    """Indicators with the live quote as today's in-progress bar; empty once that bar is in the history."""
+    session_date = session_date or datetime.now(HKT).strftime("%Y-%m-%d")
+    if not quote.price or state.count == 0 or session_date <= state.last_date[:10]:
+        return {}
+    bar = {
+        "date": session_date,
+        "open": quote.open or quote.price,
+        "high": quote.high or quote.price,
+        "low": quote.low or quote.price,
+        "close": quote.price,
+        "volume": quote.volume or 0,
+    }
+    values = state.preview(bar)
+    return {key: values[key] for key in LIVE_KEYS}
 
-        roe_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<div class="metric-label">ROE</div>\s*<div class="metric-value">)[^<]+(</div>)'
-        content = re.sub(roe_pattern, rf"\g<1>{metrics['roe']:.1f}%\g<2>", content, flags=re.DOTALL)
 
-        rating_text, rating_class, _ = _rating_view(metrics.get("technical_rating", {}).get("rating", "Hold"))
-        rating_pattern = rf'(<a href="{href_company}\.html" class="stock-card [^"]*">.*?<span class="rating-badge )[^\"]*(">)[^<]*(</span>)'
-        content = re.sub(rating_pattern, rf'\g<1>{rating_class}\g<2>{rating_text}\g<3>', content, flags=re.DOTALL)
+def merge_bar_history(store: Optional[BarStore], symbol: str, points: List[Dict[str, Any]], tail: int) -> List[Dict[str, Any]]:
+    """Persist fetched bars and return the stored history (falls back to the fetched window)."""
+    if store is None:
+        return points
+    try:
+        store.append(symbol, points)
+        return store.read_points(symbol, tail=tail) or points
+    except Exception as exc:
+        logger.warning("Bar store unavailable for %s: %s", symbol, exc)
+        return points
+
+
+def fetch_benchmark_history(
+    registry: ProviderRegistry,
+    store: Optional[BarStore] = None,
+    history_bars: int = 750,
+    fetched: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Benchmark OHLCV by name; symbols already in ``fetched`` (symbol -> points) are reused, not refetched."""
+    symbols = registry.config.get("benchmarks", {}).get("symbols", {})
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for name, symbol in symbols.items():
+        if fetched and fetched.get(symbol):
+            out[name] = fetched[symbol]
+            continue
+        try:
+            payload = registry.get_ohlcv(symbol)
+        except Exception as exc:
+            logger.warning("Benchmark %s (%s) fetch failed: %s", name, symbol, exc)
+            continue
+        if payload:
+            out[name] = merge_bar_history(store, symbol, payload.data.points, history_bars)
+        else:
+            logger.warning("Benchmark %s (%s) unavailable", name, symbol)
+    return out
+
+
+def apply_measured_risk(
+    all_data: Dict[str, Dict[str, Any]],
+    history: Dict[str, List[Dict[str, Any]]],
+    benchmarks: Dict[str, List[Dict[str, Any]]],
+    primary: str = "hsi",
+    window: int = 60,
+) -> None:
+    """Replace provider/fallback beta with rolling beta measured from stored OHLCV."""
+    measured = measure_against_benchmarks(history, benchmarks, window)
+    for company, stats in measured.items():
+        payload = all_data.get(company)
+        if not payload or not stats:
+            continue
+        payload.update(stats)
+        beta_key = f"beta_{primary}"
+        if beta_key not in stats:
+            continue
+        payload["beta"] = float(stats[beta_key])
+        payload["source"]["beta"] = f"measured:{primary}"
+        if "beta" in payload.get("estimated_fields", []):
+            payload["estimated_fields"] = [f for f in payload["estimated_fields"] if f != "beta"]
+            payload["is_estimated"] = len(payload["estimated_fields"]) > 0
+
+
+def apply_portfolio_risk(
+    all_data: Dict[str, Dict[str, Any]],
+    history: Dict[str, List[Dict[str, Any]]],
+    risk_cfg: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Covariance-based portfolio risk over this run's OHLCV; per-company contributions go into payloads."""
+    report = risk_from_points(
+        {c: history[c] for c in all_data if c in history},
+        weights=risk_cfg.get("weights") or None,
+        lookback_days=int(risk_cfg.get("lookback_days", 250)),
+        confidence=[float(c) for c in risk_cfg.get("confidence", [0.95, 0.99])],
+        horizon_days=int(risk_cfg.get("horizon_days", 1)),
+    )
+    for company, stats in report.get("assets", {}).items():
+        all_data[company]["max_drawdown_pct"] = stats["max_drawdown_pct"]
+        all_data[company]["risk_contribution_pct"] = stats["risk_contribution_pct"]
+    report["timestamp"] = datetime.utcnow().isoformat()
+    return report
 
-    order = ["tencent", "alibaba", "xiaomi", "meituan"]
-    metrics = [data[c] for c in order if c in data]
 
-    def replace_series(label: str, values: List[float], digits: int = 1) -> None:
-        nonlocal content
-        series = ", ".join(f"{v:.{digits}f}" for v in values)
-        pattern = rf"(label:\s*'{re.escape(label)}',\s*data:\s*)\[[^\]]*\]"
-        content = re.sub(pattern, rf"\g<1>[{series}]", content)
+def update_equity_analysis_file(
+    html_file: Path, data: Dict[str, Dict], zh: bool = False, manifest: Optional[ContentManifest] = None
+) -> bool:
+    return render_page_file(html_file, equity_context(data, zh=zh), manifest)
 
-    def value(company: str, key: str, fallback: float = 0.0) -> float:
-        try:
-            return float(data[company].get(key, fallback))
-        except Exception:
-            return float(fallback)
-
-    if len(metrics) == 4:
-        replace_series("Revenue (¥B)", [value(c, "revenue_billion") for c in order], 1)
-        replace_series("Revenue Growth %", [value(c, "revenue_growth") for c in order], 1)
-        replace_series("P/E Ratio", [value(c, "pe_ratio") for c in order], 1)
-        replace_series("P/B Ratio", [value(c, "pb_ratio") for c in order], 2)
-        replace_series("PEG Ratio", [value(c, "peg_ratio") for c in order], 2)
-        replace_series("Free Cash Flow ($B)", [value(c, "fcf_billion") for c in order], 1)
-        replace_series("RSI (14)", [value(c, "rsi_14") for c in order], 1)
-
-        # Margins chart has no dataset label in current HTML; replace first data array in that chart block.
-        margin_series = ", ".join(f"{value(c, 'op_margin'):.1f}" for c in order)
-        content = re.sub(
-            r"(// Margins Chart[\s\S]*?datasets:\s*\[\{\s*data:\s*)\[[^\]]*\]",
-            rf"\g<1>[{margin_series}]",
-            content,
-        )
 
-        # Risk chart keeps three key names in the current UI, update each with live values.
-        risk_map = [
-            ("Tencent", "tencent"),
-            ("Alibaba", "alibaba"),
-        ]
-        for label, company in risk_map:
-            risk_values = ", ".join(
-                [
-                    f"{value(company, 'beta'):.2f}",
-                    f"{value(company, 'volatility'):.1f}",
-                    f"{value(company, 'debt_equity'):.2f}",
-                    f"{value(company, '52w_position'):.0f}",
-                ]
-            )
-            content = re.sub(
-                rf"(label:\s*'{label}',\s*data:\s*)\[[^\]]*\]",
-                rf"\g<1>[{risk_values}]",
-                content,
-            )
-
-    hkt_now = datetime.now(ZoneInfo("Asia/Hong_Kong"))
-    timestamp = hkt_now.strftime("%B %d, %Y %H:%M HKT")
-    content = re.sub(r"Last updated: [^<]+", f"Last updated: {timestamp}", content)
-    content = re.sub(r"最近更新： [^<]+", f"最近更新： {timestamp}", content)
-    html_file.write_text(content, encoding="utf-8")
-    logger.info("Updated %s", html_file.name)
-    return True
-
-
-def update_equity_analysis_html(data: Dict[str, Dict]) -> bool:
+def update_equity_analysis_html(data: Dict[str, Dict], manifest: Optional[ContentManifest] = None) -> bool:
     root = Path(__file__).parent.parent
-    return update_equity_analysis_file(root / "equity-analysis.html", data, zh=False)
+    return update_equity_analysis_file(root / "equity-analysis.html", data, zh=False, manifest=manifest)
 
 
-def update_company_file(html_file: Path, data: Dict[str, Any]) -> bool:
-    if not html_file.exists():
-        return False
+def update_company_file(
+    html_file: Path, data: Dict[str, Any], manifest: Optional[ContentManifest] = None, company: Optional[str] = None
+) -> bool:
+    company = company or html_file.stem.replace("-zh", "")
+    zh = html_file.stem.endswith("-zh")
+    return render_page_file(html_file, company_context(company, data, zh=zh), manifest)
 
-    content = html_file.read_text(encoding="utf-8")
-    replacements = {
-        "Current Price:": f"HK${data['price']:.2f}",
-        "Market Cap:": data["market_cap_display"],
-        "P/E Ratio (TTM):": f"{data['pe_ratio']:.1f}x",
-        "52W High:": f"HK${data['52w_high']:.2f}",
-        "52W Low:": f"HK${data['52w_low']:.2f}",
-        "52W High/Low:": f"HK${data['52w_high']:.2f} / HK${data['52w_low']:.2f}",
-    }
-    for label, value in replacements.items():
-        pattern = rf'(<div class="metric-item"><span class="metric-label">{re.escape(label)}</span> <strong>)[^<]+(</strong>)'
-        content = re.sub(pattern, rf"\g<1>{value}\g<2>", content)
-
-    rating_raw = data.get("technical_rating", {}).get("rating", "Hold")
-    rating_upper = rating_raw.upper()
-    rating_lower = rating_raw.lower()
-    if "buy" in rating_lower:
-        badge_class = "badge-buy"
-        rating_color = "#4CAF50"
-    elif "sell" in rating_lower:
-        badge_class = "badge-sell"
-        rating_color = "#F44336"
-    else:
-        badge_class = "badge-hold"
-        rating_color = "#FF9800"
-
-    content = re.sub(
-        r'(<h4>💡 Investment Rating</h4>[\s\S]*?<span class=")badge-[^"]*(">)[^<]*(</span>)',
-        rf'\g<1>{badge_class}\g<2>{rating_upper}\g<3>',
-        content,
-        flags=re.DOTALL,
-    )
-    content = re.sub(
-        r'(<tr><td>Technical Rating</td><td class="text-end fw-bold"><span style="color:\s*)#[0-9A-Fa-f]{6}(;\s*font-weight:\s*700;">)[^<]*(</span>)',
-        rf'\g<1>{rating_color}\g<2>{rating_upper}\g<3>',
-        content,
-    )
 
-    content = re.sub(r"📅 Data Snapshot:.*?</span>", f"📅 Data Snapshot: {datetime.now().strftime('%B %d, %Y')}</span>", content)
-    content = re.sub(r"📅 数据快照：.*?</span>", f"📅 数据快照： {datetime.now().strftime('%B %d, %Y')}</span>", content)
-    html_file.write_text(content, encoding="utf-8")
-    logger.info("Updated %s", html_file.name)
-    return True
+def update_company_html(company: str, data: Dict[str, Any], manifest: Optional[ContentManifest] = None) -> bool:
+    root = Path(__file__).parent.parent
+    return update_company_file(root / f"{company}.html", data, manifest=manifest, company=company)
 
 
-def update_company_html(company: str, data: Dict[str, Any]) -> bool:
-    root = Path(__file__).parent.parent
-    return update_company_file(root / f"{company}.html", data)
+def load_previous_companies(data_dir: Optional[DataDirectory] = None) -> Dict[str, Any]:
+    return (data_dir or DataDirectory()).load("comprehensive_stock_data.json", {}).get("companies", {})
 
 
-def load_previous_companies() -> Dict[str, Any]:
-    comp_path = Path(__file__).parent.parent / "data" / "comprehensive_stock_data.json"
-    if not comp_path.exists():
-        return {}
-    try:
-        return json.loads(comp_path.read_text(encoding="utf-8")).get("companies", {})
-    except Exception:
-        return {}
+def indicator_state_path() -> Path:
+    return Path(__file__).parent.parent / "data" / "indicator_state.json"
 
 
-def save_comprehensive_data(data: Dict[str, Dict]):
-    data_dir = Path(__file__).parent.parent / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+def save_indicator_states(
+    states: Dict[str, IndicatorState], manifest: Optional[ContentManifest] = None, data_dir: Optional[DataDirectory] = None
+) -> None:
+    (data_dir or DataDirectory()).write(indicator_state_path().name, states_payload(states), manifest)
 
-    comp_path = data_dir / "comprehensive_stock_data.json"
-    summary_path = data_dir / "stock_summary.json"
-    prev_companies: Dict[str, Any] = {}
-    prev_summary: Dict[str, Any] = {}
 
-    if comp_path.exists():
-        try:
-            prev_companies = json.loads(comp_path.read_text(encoding="utf-8")).get("companies", {})
-        except Exception:
-            prev_companies = {}
-    if summary_path.exists():
-        try:
-            prev_summary = json.loads(summary_path.read_text(encoding="utf-8"))
-        except Exception:
-            prev_summary = {}
+def save_comprehensive_data(
+    data: Dict[str, Dict], manifest: Optional[ContentManifest] = None, data_dir: Optional[DataDirectory] = None
+):
+    data_dir = data_dir or DataDirectory()
+    prev_companies: Dict[str, Any] = data_dir.load("comprehensive_stock_data.json", {}).get("companies", {})
+    prev_summary: Dict[str, Any] = data_dir.load("stock_summary.json", {})
 
     merged_companies = {**prev_companies, **data}
     comprehensive = {
@@ -557,7 +520,8 @@ def save_comprehensive_data(data: Dict[str, Dict]):
         "companies": merged_companies,
         "schema_version": "v1",
     }
-    comp_path.write_text(json.dumps(comprehensive, indent=2, ensure_ascii=False), encoding="utf-8")
+    data_dir.write("comprehensive_stock_data.json", comprehensive, manifest, minify=True)
+    data_dir.write_shards(merged_companies, manifest)
 
     summary = dict(prev_summary)
     for company, metrics in merged_companies.items():
@@ -576,21 +540,48 @@ def save_comprehensive_data(data: Dict[str, Dict]):
             "is_estimated": metrics["is_estimated"],
             "last_verified_at": metrics["last_verified_at"],
         }
-    summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    data_dir.write("stock_summary.json", summary, manifest, minify=True)
+
+
+def record_snapshot_delta(data_dir: DataDirectory, log: SnapshotLog) -> None:
+    documents = {name: data_dir.load(name) for name in ("comprehensive_stock_data.json", "stock_summary.json")}
+    try:
+        kind = log.record({name: doc for name, doc in documents.items() if doc is not None})
+    except Exception as exc:
+        logger.warning("Snapshot delta not recorded: %s", exc)
+        return
+    logger.info("Snapshot log: %s", kind)
+
+
+def record_history(data: Dict[str, Dict[str, Any]], db_path: Path) -> None:
+    try:
+        with SnapshotHistory(db_path) as history:
+            recorded = history.record(data)
+    except Exception as exc:
+        logger.warning("Snapshot history not recorded: %s", exc)
+        return
+    logger.info("History snapshots recorded: %s", ", ".join(recorded) or "none (unchanged)")
 
 
 def main() -> int:
     logger.info("Starting unified stock update")
     registry = ProviderRegistry()
     all_data = {}
-    previous_companies = load_previous_companies()
+    data_dir = DataDirectory()
+    previous_companies = load_previous_companies(data_dir)
+    states = load_states(indicator_state_path())
+    history: Dict[str, List[Dict[str, Any]]] = {}
+    benchmark_cfg = registry.config.get("benchmarks", {})
+    storage_cfg = registry.config.get("storage", {})
+    store = BarStore(ROOT / storage_cfg.get("bars_dir", "data/bars"))
+    history_bars = int(storage_cfg.get("history_bars", 750))
 
     for company in STOCK_CONFIG:
         payload = None
         last_exc = None
         for attempt in range(1, MAX_FETCH_RETRIES + 1):
             try:
-                payload = build_company_payload(company, registry)
+                payload = build_company_payload(company, registry, states, history, store, history_bars)
                 break
             except Exception as exc:
                 last_exc = exc
@@ -633,10 +624,47 @@ def main() -> int:
         logger.error("No data fetched")
         return 1
 
-    update_equity_analysis_html(all_data)
-    for company, metrics in all_data.items():
-        update_company_html(company, metrics)
-    save_comprehensive_data(all_data)
+    apply_cross_sectional_ranks(all_data, history)
+    # 3033.HK is both a company and the HS TECH benchmark; reuse the bars fetched above.
+    fetched = {STOCK_CONFIG[company]["symbol"]: points for company, points in history.items() if company in STOCK_CONFIG}
+    benchmarks = fetch_benchmark_history(registry, store, history_bars, fetched)
+    apply_measured_risk(
+        all_data,
+        history,
+        benchmarks,
+        primary=str(benchmark_cfg.get("primary", "hsi")),
+        window=int(benchmark_cfg.get("beta_window", 60)),
+    )
+
+    risk_report = apply_portfolio_risk(all_data, history, registry.config.get("risk", {}))
+
+    manifest = ContentManifest()
+    save_comprehensive_data(all_data, manifest=manifest, data_dir=data_dir)
+    save_indicator_states(states, manifest=manifest, data_dir=data_dir)
+    data_dir.write("portfolio_risk.json", risk_report, manifest)
+    data_dir.write("screener.json", site_screens(all_data, registry.config.get("screener", {})), manifest)
+
+    # Pages show when the data last changed (run_metadata.json last_change_at), which
+    # scripts/build/site.py reads back, so a rebuild of an unchanged tree is a no-op.
+    run_at = datetime.utcnow().isoformat()
+    changed_at = run_at if manifest.changed else (load_run_metadata().get("last_change_at") or run_at)
+    site_cfg = registry.config.get("site", {})
+    publish_pages(
+        all_data,
+        manifest=manifest,
+        data_dir=data_dir,
+        mode=site_cfg.get("mode", "static"),
+        workers=site_cfg.get("workers"),
+        now=parse_stamp(changed_at),
+    )
+    record_history(all_data, ROOT / storage_cfg.get("history_db", "data/history.sqlite"))
+    record_snapshot_delta(
+        data_dir,
+        SnapshotLog(ROOT / storage_cfg.get("snapshot_dir", "data/snapshots"), int(storage_cfg.get("rebase_every", 168))),
+    )
+    write_run_metadata(all_data, manifest.changed, now=run_at, changed_at=changed_at)
+    manifest.save()
+    logger.info("Changed artifacts: %s", ", ".join(manifest.changed) or "none")
 
     logger.info("Unified stock update complete")
     return 0
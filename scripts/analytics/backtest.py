@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Vectorized backtest of the technical rating rules over stored OHLCV history.
+
+Indicators are computed once for the whole (symbols x days) grid; each ``run`` then
+re-scores every symbol/day with a ``RatingRules`` and aggregates forward returns per
+rating bucket without any per-bar Python loop, so threshold sweeps are cheap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.analytics.rating import BUCKET_DIRECTION, BUCKETS, RatingRules, bucket_codes, score_arrays
+from scripts.indicators.batch import align_points, compute_batch
+from scripts.indicators.engine import TRADING_DAYS
+from scripts.storage.bars import BarStore
+
+# Bars needed before every rating input (MA50, RSI14, MACD) has warmed up.
+WARMUP_BARS = 50
+
+
+def _max_drawdown(returns: np.ndarray) -> float:
+    equity = np.cumprod(1.0 + np.nan_to_num(returns))
+    if equity.size == 0:
+        return 0.0
+    peak = np.maximum.accumulate(np.concatenate([[1.0], equity]))[1:]
+    return float(np.min(equity / peak - 1.0) * 100)
+
+
+class RatingBacktester:
+    def __init__(self, symbols: List[str], close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        close = np.atleast_2d(np.asarray(close, dtype=float))
+        mask = ~np.isnan(close) if mask is None else np.asarray(mask, dtype=bool)
+        batch = compute_batch(symbols, close, high, low, volume, mask)
+        self.symbols = list(symbols)
+        self.close = np.where(mask, close, np.nan)
+        self.rsi = batch.series["rsi_14"]
+        self.ma_20 = batch.series["ma_20"]
+        self.ma_50 = batch.series["ma_50"]
+        self.macd = batch.series["macd"]
+        history = np.cumsum(mask, axis=1)
+        self.ready = mask & (history >= WARMUP_BARS) & ~np.isnan(self.rsi)
+
+    @classmethod
+    def from_points(cls, points_by_symbol: Dict[str, List[Dict[str, Any]]]) -> "RatingBacktester":
+        symbols, _, f, mask = align_points(points_by_symbol)
+        return cls(symbols, f["close"], f["high"], f["low"], f["volume"], mask)
+
+    def forward_returns(self, horizon: int) -> np.ndarray:
+        """Close-to-close return from the signal bar to ``horizon`` grid days later."""
+        fwd = np.full(self.close.shape, np.nan)
+        if horizon < self.close.shape[1]:
+            fwd[:, :-horizon] = self.close[:, horizon:] / self.close[:, :-horizon] - 1.0
+        return fwd
+
+    def run(self, rules: RatingRules = RatingRules(), horizons: tuple = (1, 5, 20)) -> Dict[str, Any]:
+        codes = bucket_codes(score_arrays(self.rsi, self.close, self.ma_20, self.ma_50, self.macd, rules), rules)
+        codes = np.where(self.ready, codes, -1)
+        daily = self.forward_returns(1)
+        fwd = {h: self.forward_returns(h) for h in horizons}
+
+        report: Dict[str, Any] = {"rules": asdict(rules), "symbols": len(self.symbols), "days": self.close.shape[1], "buckets": {}}
+        for code, (label, _) in enumerate(BUCKETS):
+            member = codes == code
+            direction = int(BUCKET_DIRECTION[code])
+            stats: Dict[str, Any] = {"signals": int(member.sum())}
+            for h, ret in fwd.items():
+                hit = member & ~np.isnan(ret)
+                n = int(hit.sum())
+                values = ret[hit]
+                stats[f"{h}d"] = {
+                    "count": n,
+                    "mean_return_pct": float(values.mean() * 100) if n else None,
+                    "median_return_pct": float(np.median(values) * 100) if n else None,
+                    "hit_rate": float((np.sign(values) == direction).mean()) if n and direction else None,
+                }
+
+            # Equal-weight daily portfolio of every symbol currently in the bucket.
+            held = member & ~np.isnan(daily)
+            n_held = held.sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                bucket_ret = np.where(n_held > 0, np.where(held, daily, 0.0).sum(axis=0) / n_held, 0.0)
+            active = n_held > 0
+            entries = member[:, 1:] & ~member[:, :-1]
+            exits = ~member[:, 1:] & member[:, :-1]
+            stats["portfolio"] = {
+                "active_days": int(active.sum()),
+                "total_return_pct": float((np.prod(1.0 + bucket_ret) - 1.0) * 100),
+                "annualized_return_pct": float(((np.prod(1.0 + bucket_ret)) ** (TRADING_DAYS / max(active.sum(), 1)) - 1.0) * 100),
+                "max_drawdown_pct": _max_drawdown(bucket_ret),
+                "turnover_per_day": float((entries.sum() + exits.sum()) / max(member.sum(), 1)),
+            }
+            report["buckets"][label] = stats
+
+        # Long/short book following every rating: +1 for buys, -1 for sells, flat on hold.
+        position = np.where(codes >= 0, BUCKET_DIRECTION[np.clip(codes, 0, None)], 0)
+        pnl = np.where(np.isnan(daily), 0.0, position * np.nan_to_num(daily))
+        gross = np.abs(position).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            strat = np.where(gross > 0, pnl.sum(axis=0) / gross, 0.0)
+        std = strat.std()
+        report["strategy"] = {
+            "total_return_pct": float((np.prod(1.0 + strat) - 1.0) * 100),
+            "sharpe": float(strat.mean() / std * np.sqrt(TRADING_DAYS)) if std else 0.0,
+            "max_drawdown_pct": _max_drawdown(strat),
+            "turnover_per_day": float(np.abs(np.diff(position, axis=1)).sum() / max(gross.sum(), 1)),
+        }
+        return report
+
+
+def _load_history(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return raw.get("symbols", raw)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backtest technical rating buckets over OHLCV history")
+    parser.add_argument("--history", type=Path, help='JSON {"symbols": {symbol: [points]}} of daily bars')
+    parser.add_argument("--synthetic", default="", help="SYMBOLSxDAYS random-walk universe, e.g. 1000x2520")
+    parser.add_argument("--store", action="store_true", help="Read every symbol from the data/bars columnar store")
+    for f in fields(RatingRules):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=type(f.default), default=f.default)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.synthetic:
+        n_symbols, n_days = (int(v) for v in args.synthetic.lower().split("x"))
+        rng = np.random.default_rng(0)
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0002, 0.02, (n_symbols, n_days)), axis=1))
+        tester = RatingBacktester([f"S{i}" for i in range(n_symbols)], close, close * 1.01, close * 0.99, np.ones_like(close))
+    elif args.store:
+        history = BarStore().load_history(BarStore().symbols())
+        if not history:
+            parser.error("bar store is empty")
+        tester = RatingBacktester.from_points(history)
+    elif args.history:
+        tester = RatingBacktester.from_points(_load_history(args.history))
+    else:
+        parser.error("one of --history, --store or --synthetic is required")
+    prepared = time.perf_counter()
+
+    rules = RatingRules(**{f.name: getattr(args, f.name) for f in fields(RatingRules)})
+    report = tester.run(rules)
+    report["timing_sec"] = {"indicators": round(prepared - started, 3), "backtest": round(time.perf_counter() - prepared, 3)}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
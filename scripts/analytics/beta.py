@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Rolling beta, correlation and idiosyncratic volatility against index benchmarks."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from scripts.indicators.batch import align_points
+from scripts.indicators.engine import TRADING_DAYS
+
+
+def _windowed_sum(x: np.ndarray, window: int) -> np.ndarray:
+    csum = np.cumsum(np.pad(x, ((0, 0), (1, 0))), axis=1)
+    out = csum[:, 1:].copy()
+    out[:, window:] = csum[:, window + 1:] - csum[:, 1:-window]
+    return out
+
+
+def daily_returns(close: np.ndarray) -> np.ndarray:
+    """Simple returns between adjacent columns; NaN wherever either close is missing."""
+    close = np.atleast_2d(np.asarray(close, dtype=float))
+    out = np.full(close.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:, 1:] = close[:, 1:] / close[:, :-1] - 1.0
+    return out
+
+
+def rolling_beta(
+    asset_returns: np.ndarray, bench_returns: np.ndarray, window: int = 60, min_obs: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """Vectorized rolling OLS of each asset row on one benchmark row.
+
+    Only dates where both returns exist enter a window. Windows with fewer than
+    ``min_obs`` paired observations (default: half the window) are NaN.
+    """
+    a = np.atleast_2d(np.asarray(asset_returns, dtype=float))
+    b = np.broadcast_to(np.asarray(bench_returns, dtype=float), a.shape)
+    ok = ~np.isnan(a) & ~np.isnan(b)
+    a0 = np.where(ok, a, 0.0)
+    b0 = np.where(ok, b, 0.0)
+
+    n = _windowed_sum(ok.astype(float), window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = _windowed_sum(a0, window) / n
+        mean_b = _windowed_sum(b0, window) / n
+        cov = _windowed_sum(a0 * b0, window) / n - mean_a * mean_b
+        var_a = np.maximum(_windowed_sum(a0 * a0, window) / n - mean_a * mean_a, 0.0)
+        var_b = np.maximum(_windowed_sum(b0 * b0, window) / n - mean_b * mean_b, 0.0)
+        beta = cov / var_b
+        corr = cov / np.sqrt(var_a * var_b)
+        idio = np.sqrt(np.maximum(var_a - beta * cov, 0.0)) * math.sqrt(TRADING_DAYS) * 100
+
+    enough = n >= (min_obs if min_obs is not None else max(2, window // 2))
+    return {
+        "beta": np.where(enough, beta, np.nan),
+        "correlation": np.where(enough, np.clip(corr, -1.0, 1.0), np.nan),
+        "idiosyncratic_vol": np.where(enough, idio, np.nan),
+    }
+
+
+def measure_against_benchmarks(
+    history: Dict[str, List[Dict[str, Any]]], benchmarks: Dict[str, List[Dict[str, Any]]], window: int = 60
+) -> Dict[str, Dict[str, float]]:
+    """Latest rolling statistics of every company against every benchmark, keyed ``<stat>_<benchmark>``."""
+    if not history or not benchmarks:
+        return {}
+    bench_keys = [f"__benchmark__{name}" for name in benchmarks]
+    combined = {**history, **{k: benchmarks[name] for k, name in zip(bench_keys, benchmarks)}}
+    names, _, fields, _ = align_points(combined)
+    returns = daily_returns(fields["close"])
+    n_assets = len(history)
+    asset_returns = returns[:n_assets]
+
+    out: Dict[str, Dict[str, float]] = {name: {} for name in names[:n_assets]}
+    for offset, bench in enumerate(benchmarks):
+        stats = rolling_beta(asset_returns, returns[n_assets + offset], window)
+        for i, company in enumerate(names[:n_assets]):
+            for stat, values in stats.items():
+                value = float(values[i, -1])
+                if not math.isnan(value):
+                    out[company][f"{stat}_{bench}"] = value
+    return out
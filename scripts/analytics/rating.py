@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Technical rating rules shared by the live payload and the backtester."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RatingRules:
+    rsi_oversold: float = 30.0
+    rsi_overbought: float = 70.0
+    rsi_points: int = 2
+    trend_points: int = 2
+    macd_points: int = 1
+    # Minimum score for each bucket, strongest first; anything lower is the last bucket.
+    strong_buy: int = 4
+    buy: int = 2
+    hold: int = -1
+    sell: int = -3
+
+
+# Bucket code order is shared with backtest outputs: 0 = Strong Buy ... 4 = Strong Sell.
+BUCKETS: List[Tuple[str, str]] = [
+    ("Strong Buy", "#00C853"),
+    ("Buy", "#4CAF50"),
+    ("Hold", "#FF9800"),
+    ("Sell", "#F44336"),
+    ("Strong Sell", "#D32F2F"),
+]
+# Direction each bucket bets on: +1 long, -1 short, 0 flat.
+BUCKET_DIRECTION = np.array([1, 1, 0, -1, -1])
+
+
+def score_arrays(rsi, price, ma_20, ma_50, macd, rules: RatingRules = RatingRules()) -> np.ndarray:
+    """Vectorized rating score for arrays of any shape."""
+    rsi, price, ma_20, ma_50, macd = (np.asarray(a, dtype=float) for a in (rsi, price, ma_20, ma_50, macd))
+    score = np.zeros(np.broadcast(rsi, price).shape, dtype=np.int64)
+    score += rules.rsi_points * ((rsi < rules.rsi_oversold).astype(np.int64) - (rsi > rules.rsi_overbought))
+    bullish = (price > ma_20) & (ma_20 > ma_50)
+    bearish = (price < ma_20) & (ma_20 < ma_50)
+    score += rules.trend_points * (bullish.astype(np.int64) - bearish)
+    score += np.where(macd > 0, rules.macd_points, -rules.macd_points)
+    return score
+
+
+def bucket_codes(score: np.ndarray, rules: RatingRules = RatingRules()) -> np.ndarray:
+    """Map scores to bucket indexes into ``BUCKETS``."""
+    thresholds = np.array([rules.strong_buy, rules.buy, rules.hold, rules.sell])
+    return (np.asarray(score)[..., None] < thresholds).sum(axis=-1)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Portfolio risk: shrinkage covariance, VaR/CVaR, drawdown and risk contributions."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.analytics.beta import daily_returns
+from scripts.indicators.batch import align_points
+from scripts.indicators.engine import TRADING_DAYS
+from scripts.storage.bars import BarStore
+
+
+def shrinkage_covariance(returns: np.ndarray, min_obs: int = 20) -> Dict[str, Any]:
+    """Ledoit-Wolf covariance of (symbols x days) returns shrunk toward a scaled identity.
+
+    Missing returns are treated as zero after demeaning and each pairwise term is divided
+    by the number of dates where both symbols traded, so short histories are not biased
+    toward zero. Pairs that never overlap get zero covariance. Rows with fewer than
+    ``min_obs`` returns are excluded and flagged in ``valid``.
+    """
+    r = np.atleast_2d(np.asarray(returns, dtype=float))
+    ok = ~np.isnan(r)
+    valid = ok.sum(axis=1) >= min_obs
+    n_assets = r.shape[0]
+    cov = np.full((n_assets, n_assets), np.nan)
+    if valid.sum() == 0:
+        return {"covariance": cov, "shrinkage": float("nan"), "valid": valid}
+
+    x = r[valid]
+    m = ok[valid]
+    counts = m.sum(axis=1, keepdims=True)
+    mean = np.where(m, x, 0.0).sum(axis=1, keepdims=True) / counts
+    x = np.where(m, x - mean, 0.0)
+    pairs = m.astype(float) @ m.T.astype(float)
+    overlap = pairs > 0
+    n = np.where(overlap, pairs, 1.0)
+
+    sample = np.where(overlap, x @ x.T / n, 0.0)
+    mu = np.trace(sample) / sample.shape[0]
+    target = mu * np.eye(sample.shape[0])
+    d2 = np.sum((sample - target) ** 2)
+    # b2: estimation error of each pairwise covariance, from its per-day outer products.
+    sq = x * x
+    b2 = np.sum(np.where(overlap, (sq @ sq.T / n - sample ** 2) / n, 0.0))
+    shrink = float(min(max(b2 / d2, 0.0), 1.0)) if d2 > 0 else 1.0
+    shrunk = shrink * target + (1.0 - shrink) * sample
+
+    idx = np.flatnonzero(valid)
+    cov[np.ix_(idx, idx)] = shrunk
+    return {"covariance": cov, "shrinkage": shrink, "valid": valid}
+
+
+def max_drawdown(returns: np.ndarray) -> np.ndarray:
+    """Worst peak-to-trough loss (negative fraction) along the last axis; missing returns are flat."""
+    r = np.nan_to_num(np.asarray(returns, dtype=float))
+    equity = np.cumprod(1.0 + r, axis=-1)
+    peak = np.maximum(np.maximum.accumulate(equity, axis=-1), 1.0)
+    return np.min(equity / peak - 1.0, axis=-1, initial=0.0)
+
+
+def historical_var(portfolio_returns: np.ndarray, confidence: float) -> Dict[str, float]:
+    r = np.asarray(portfolio_returns, dtype=float)
+    r = r[~np.isnan(r)]
+    if r.size == 0:
+        return {"var": float("nan"), "cvar": float("nan")}
+    cutoff = np.quantile(r, 1.0 - confidence)
+    tail = r[r <= cutoff]
+    return {"var": float(-cutoff), "cvar": float(-tail.mean())}
+
+
+def parametric_var(mean: float, sigma: float, confidence: float) -> Dict[str, float]:
+    dist = NormalDist()
+    z = dist.inv_cdf(confidence)
+    return {"var": float(z * sigma - mean), "cvar": float(sigma * dist.pdf(z) / (1.0 - confidence) - mean)}
+
+
+def portfolio_risk(
+    symbols: Sequence[str],
+    returns: np.ndarray,
+    weights: Optional[Dict[str, float]] = None,
+    confidence: Sequence[float] = (0.95, 0.99),
+    horizon_days: int = 1,
+    min_obs: int = 20,
+) -> Dict[str, Any]:
+    """Risk report for a weighted portfolio over aligned (symbols x days) returns.
+
+    Weights default to equal weight and are renormalized over symbols with enough
+    history. VaR/CVaR are positive loss fractions scaled by sqrt(horizon_days).
+    """
+    r = np.atleast_2d(np.asarray(returns, dtype=float))
+    est = shrinkage_covariance(r, min_obs)
+    valid = est["valid"]
+    raw = np.array([float((weights or {}).get(s, 1.0 if weights is None else 0.0)) for s in symbols])
+    w = np.where(valid, raw, 0.0)
+    gross = np.abs(w).sum()
+    if gross == 0:
+        return {"symbols": [], "error": "no symbols with enough history"}
+    w = w / w.sum() if w.sum() else w / gross
+
+    idx = np.flatnonzero(valid)
+    cov = est["covariance"][np.ix_(idx, idx)]
+    wv = w[idx]
+    sigma_w = cov @ wv
+    var_p = float(wv @ sigma_w)
+    sigma_p = math.sqrt(max(var_p, 0.0))
+    marginal = sigma_w / sigma_p if sigma_p else np.zeros_like(wv)
+    component = wv * marginal
+
+    # Realized daily portfolio return: weights rescaled over the names trading that day.
+    rv = r[idx]
+    traded = ~np.isnan(rv)
+    live = np.where(traded, wv[:, None], 0.0)
+    live_sum = live.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        port = np.where(live_sum != 0, (live * np.nan_to_num(rv)).sum(axis=0) / live_sum, np.nan)
+    port_clean = port[~np.isnan(port)]
+    mean_p = float(port_clean.mean()) if port_clean.size else 0.0
+
+    scale = math.sqrt(horizon_days)
+    var_report: Dict[str, Any] = {}
+    for c in confidence:
+        key = f"{int(round(c * 100))}"
+        para = parametric_var(mean_p * horizon_days, sigma_p * scale, c)
+        hist = historical_var(port_clean, c)
+        var_report[key] = {
+            "parametric_var_pct": para["var"] * 100,
+            "parametric_cvar_pct": para["cvar"] * 100,
+            "historical_var_pct": hist["var"] * scale * 100,
+            "historical_cvar_pct": hist["cvar"] * scale * 100,
+        }
+
+    asset_dd = max_drawdown(rv)
+    vols = np.sqrt(np.diag(cov)) * math.sqrt(TRADING_DAYS) * 100
+    names = [symbols[i] for i in idx]
+    return {
+        "symbols": names,
+        "excluded": [s for s, ok in zip(symbols, valid) if not ok],
+        "observations": int(r.shape[1]),
+        "horizon_days": horizon_days,
+        "shrinkage": est["shrinkage"],
+        "volatility_pct": sigma_p * math.sqrt(TRADING_DAYS) * 100,
+        "var": var_report,
+        "max_drawdown_pct": float(max_drawdown(port) * 100),
+        "assets": {
+            name: {
+                "weight": float(wv[i]),
+                "volatility_pct": float(vols[i]),
+                "max_drawdown_pct": float(asset_dd[i] * 100),
+                "marginal_risk_pct": float(marginal[i] * math.sqrt(TRADING_DAYS) * 100),
+                "risk_contribution_pct": float(component[i] / sigma_p * 100) if sigma_p else 0.0,
+            }
+            for i, name in enumerate(names)
+        },
+        "correlation": _correlation(cov).round(4).tolist(),
+    }
+
+
+def _correlation(cov: np.ndarray) -> np.ndarray:
+    sd = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.nan_to_num(cov / np.outer(sd, sd))
+
+
+def risk_from_points(
+    points_by_symbol: Dict[str, List[Dict[str, Any]]],
+    weights: Optional[Dict[str, float]] = None,
+    lookback_days: int = 250,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    symbols, _, fields, mask = align_points(points_by_symbol)
+    if not symbols:
+        return {"symbols": [], "error": "no history"}
+    close = np.where(mask, fields["close"], np.nan)[:, -(lookback_days + 1):]
+    return portfolio_risk(symbols, daily_returns(close)[:, 1:], weights, **kwargs)
+
+
+def parse_weights(text: str) -> Optional[Dict[str, float]]:
+    if not text:
+        return None
+    out: Dict[str, float] = {}
+    for part in text.split(","):
+        name, _, value = part.partition("=")
+        out[name.strip()] = float(value)
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Portfolio VaR/CVaR, drawdown and risk contributions")
+    parser.add_argument("--history", type=Path, help='JSON {"symbols": {symbol: [points]}} of daily bars')
+    parser.add_argument("--synthetic", default="", help="SYMBOLSxDAYS correlated random-walk universe, e.g. 500x750")
+    parser.add_argument("--store", action="store_true", help="Read every symbol from the data/bars columnar store")
+    parser.add_argument("--weights", default="", help="Comma list symbol=weight (default equal weight)")
+    parser.add_argument("--lookback", type=int, default=250)
+    parser.add_argument("--horizon", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        n_symbols, n_days = (int(v) for v in args.synthetic.lower().split("x"))
+        rng = np.random.default_rng(0)
+        market = rng.normal(0.0003, 0.012, n_days)
+        rets = market * rng.uniform(0.5, 1.5, (n_symbols, 1)) + rng.normal(0, 0.015, (n_symbols, n_days))
+        report = portfolio_risk([f"S{i}" for i in range(n_symbols)], rets, parse_weights(args.weights), horizon_days=args.horizon)
+    elif args.store:
+        store = BarStore()
+        report = risk_from_points(store.load_history(store.symbols()), parse_weights(args.weights), args.lookback, horizon_days=args.horizon)
+    elif args.history:
+        raw = json.loads(args.history.read_text(encoding="utf-8"))
+        report = risk_from_points(raw.get("symbols", raw), parse_weights(args.weights), args.lookback, horizon_days=args.horizon)
+    else:
+        parser.error("one of --history, --store or --synthetic is required")
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
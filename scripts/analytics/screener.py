@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Columnar screener over every company payload with sorted metric indexes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DATA_PATH = ROOT / "data" / "comprehensive_stock_data.json"
+INDEXED_METRICS = ("pe_ratio", "rsi_14", "52w_position", "volatility", "roe", "fcf_yield")
+CONDITION_RE = re.compile(r"^\s*([A-Za-z0-9_]+)\s*(<=|>=|==|<|>)\s*(-?\d+(?:\.\d+)?)\s*$")
+
+Condition = Tuple[str, str, float]
+
+
+def parse_condition(text: str) -> Condition:
+    match = CONDITION_RE.match(text)
+    if not match:
+        raise ValueError(f"invalid condition: {text!r} (expected e.g. 'rsi_14<30')")
+    return match.group(1), match.group(2), float(match.group(3))
+
+
+class ScreenerTable:
+    """Numeric payload fields as float columns; missing values are NaN and never match."""
+
+    def __init__(self, companies: Dict[str, Dict[str, Any]], indexed: Tuple[str, ...] = INDEXED_METRICS) -> None:
+        self.names = np.array(list(companies), dtype=object)
+        fields = sorted({k for payload in companies.values() for k, v in payload.items() if _is_number(v)})
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.array([_to_float(payload.get(field)) for payload in companies.values()], dtype=float) for field in fields
+        }
+        self.labels = {
+            "company_name": np.array([p.get("company_name", c) for c, p in companies.items()], dtype=object),
+            "rating": np.array([(p.get("technical_rating") or {}).get("rating", "") for p in companies.values()], dtype=object),
+        }
+        # Sorted index per metric: positions ordered by value, NaNs dropped.
+        self.indexes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for field in indexed:
+            if field in self.columns:
+                values = self.columns[field]
+                order = np.argsort(values, kind="stable")
+                order = order[~np.isnan(values[order])]
+                self.indexes[field] = (order, values[order])
+
+    @classmethod
+    def from_file(cls, path: Path = DATA_PATH) -> "ScreenerTable":
+        return cls(json.loads(path.read_text(encoding="utf-8")).get("companies", {}))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _match(self, field: str, op: str, value: float) -> np.ndarray:
+        if field not in self.columns:
+            raise KeyError(f"unknown metric: {field}")
+        mask = np.zeros(len(self), dtype=bool)
+        if field in self.indexes:
+            order, sorted_values = self.indexes[field]
+            if op == "<":
+                hit = order[: np.searchsorted(sorted_values, value, side="left")]
+            elif op == "<=":
+                hit = order[: np.searchsorted(sorted_values, value, side="right")]
+            elif op == ">":
+                hit = order[np.searchsorted(sorted_values, value, side="right"):]
+            elif op == ">=":
+                hit = order[np.searchsorted(sorted_values, value, side="left"):]
+            else:
+                hit = order[np.searchsorted(sorted_values, value, side="left"):np.searchsorted(sorted_values, value, side="right")]
+            mask[hit] = True
+            return mask
+        column = self.columns[field]
+        with np.errstate(invalid="ignore"):
+            return {"<": column < value, "<=": column <= value, ">": column > value, ">=": column >= value, "==": column == value}[op]
+
+    def query(
+        self, conditions: List[Condition], sort_by: Optional[str] = None, descending: bool = False, limit: Optional[int] = None
+    ) -> np.ndarray:
+        """Positions matching every condition, optionally ordered by a metric (NaNs last)."""
+        mask = np.ones(len(self), dtype=bool)
+        for field, op, value in conditions:
+            mask &= self._match(field, op, value)
+        if sort_by is None:
+            hits = np.flatnonzero(mask)
+        elif sort_by in self.indexes:
+            order = self.indexes[sort_by][0]
+            hits = order[mask[order]]
+            if descending:
+                # Reversing would also reverse ties; keep them in table order like the ascending case.
+                hits = hits[np.lexsort((hits, -self.columns[sort_by][hits]))]
+            # The index omits NaNs; matching rows without the metric still belong at the end.
+            hits = np.concatenate([hits, np.flatnonzero(mask & np.isnan(self.columns[sort_by]))])
+        else:
+            if sort_by not in self.columns:
+                raise KeyError(f"unknown metric: {sort_by}")
+            hits = np.flatnonzero(mask)
+            keys = self.columns[sort_by][hits]
+            hits = hits[np.argsort(-keys if descending else keys, kind="stable")]
+        return hits[:limit] if limit else hits
+
+    def rows(self, positions: np.ndarray, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        fields = fields or [f for f in INDEXED_METRICS if f in self.columns]
+        unknown = [f for f in fields if f not in self.columns]
+        if unknown:
+            raise KeyError(f"unknown metric: {', '.join(unknown)}")
+        out = []
+        for i in positions:
+            row: Dict[str, Any] = {"company": str(self.names[i]), "company_name": str(self.labels["company_name"][i])}
+            row["rating"] = str(self.labels["rating"][i])
+            for field in fields:
+                value = self.columns[field][i]
+                row[field] = None if np.isnan(value) else round(float(value), 4)
+            out.append(row)
+        return out
+
+
+def screen(
+    table: ScreenerTable,
+    conditions: List[str],
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """JSON-ready result of one query; ``matches`` counts every hit, not just the rows kept by ``limit``."""
+    hits = table.query([parse_condition(c) for c in conditions], sort_by=sort_by, descending=descending)
+    return {
+        "query": {"conditions": list(conditions), "sort": sort_by, "descending": descending, "limit": limit or None},
+        "universe": len(table),
+        "matches": len(hits),
+        "results": table.rows(hits[:limit] if limit else hits, fields),
+    }
+
+
+def site_screens(companies: Dict[str, Dict[str, Any]], cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Every preset in ``screener.screens`` (name -> conditions) for the site to render."""
+    table = ScreenerTable(companies)
+    sort_by = cfg.get("sort") or None
+    if sort_by not in table.columns:
+        sort_by = None
+    screens = {}
+    for name, conditions in (cfg.get("screens") or {}).items():
+        try:
+            screens[name] = screen(
+                table, list(conditions or []), sort_by=sort_by, descending=bool(cfg.get("descending")), limit=cfg.get("limit")
+            )
+        except (KeyError, ValueError) as exc:
+            # A preset naming a metric no payload carries yet is skipped, not fatal to the run.
+            screens[name] = {"error": str(exc.args[0])}
+    return {"universe": len(table), "screens": screens}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_float(value: Any) -> float:
+    return float(value) if _is_number(value) else np.nan
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Screen companies by metric conditions")
+    parser.add_argument("conditions", nargs="*", help="Conditions such as 'rsi_14<30' 'pe_ratio<15'")
+    parser.add_argument("--sort", dest="sort_by", help="Metric to sort by")
+    parser.add_argument("--desc", action="store_true", help="Sort descending")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--fields", help="Comma-separated metrics to include in output")
+    parser.add_argument("--data", type=Path, default=DATA_PATH)
+    parser.add_argument("--output", type=Path, help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        for condition in args.conditions:
+            parse_condition(condition)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    table = ScreenerTable.from_file(args.data)
+    fields = args.fields.split(",") if args.fields else None
+    try:
+        started = time.perf_counter()
+        payload = screen(table, args.conditions, sort_by=args.sort_by, descending=args.desc, limit=args.limit, fields=fields)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except KeyError as exc:
+        parser.error(str(exc.args[0]))
+
+    payload["elapsed_ms"] = round(elapsed_ms, 3)
+    text = json.dumps(payload, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
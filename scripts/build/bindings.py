@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Binding contexts (key -> rendered value) for the data-bound site pages."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
+
+from scripts.build.render import js_array
+
+# Comparison charts on equity-analysis.html cover these companies, in chart label order.
+CHART_ORDER = ["tencent", "alibaba", "xiaomi", "meituan"]
+RISK_CHART_COMPANIES = ["tencent", "alibaba"]
+HKT = ZoneInfo("Asia/Hong_Kong")
+
+
+def rating_view(raw: Optional[str]) -> Dict[str, str]:
+    rating = (raw or "Hold").strip()
+    lower = rating.lower()
+    if "buy" in lower:
+        tone, color = "buy", "#4CAF50"
+    elif "sell" in lower:
+        tone, color = "sell", "#F44336"
+    else:
+        tone, color = "hold", "#FF9800"
+    return {"text": rating, "tone": tone, "color": color}
+
+
+def _num(metrics: Dict[str, Any], key: str, fallback: float = 0.0) -> float:
+    try:
+        return float(metrics.get(key, fallback))
+    except (TypeError, ValueError):
+        return float(fallback)
+
+
+def parse_stamp(raw: Any) -> Optional[datetime]:
+    """A pipeline timestamp (naive UTC ISO, as the updater writes them) in HKT; None if missing or malformed."""
+    if not raw:
+        return None
+    try:
+        stamp = datetime.fromisoformat(str(raw))
+    except ValueError:
+        return None
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.astimezone(HKT)
+
+
+def meta_context(zh: bool = False, now: Optional[datetime] = None) -> Dict[str, str]:
+    hkt_now = now.astimezone(HKT) if now else datetime.now(HKT)
+    stamp = hkt_now.strftime("%B %d, %Y %H:%M HKT")
+    day = hkt_now.strftime("%B %d, %Y")
+    return {
+        "meta.last_updated": f"最近更新： {stamp}" if zh else f"Last updated: {stamp}",
+        "meta.data_snapshot": f"📅 数据快照： {day}" if zh else f"📅 Data Snapshot: {day}",
+    }
+
+
+def company_card_context(company: str, metrics: Dict[str, Any]) -> Dict[str, str]:
+    """Values for one company's card on equity-analysis.html."""
+    change = _num(metrics, "change_pct")
+    change_class = "positive" if change > 0 else "negative" if change < 0 else ""
+    rating = rating_view((metrics.get("technical_rating") or {}).get("rating"))
+    return {
+        f"{company}.price": f"HK${_num(metrics, 'price'):.2f}",
+        f"{company}.change_pct": f"{change:+.2f}%",
+        f"{company}.change_class": f"price-change {change_class}".strip(),
+        f"{company}.market_cap": str(metrics.get("market_cap_display", "")),
+        f"{company}.pe_ratio": f"{_num(metrics, 'pe_ratio'):.1f}x",
+        f"{company}.roe": f"{_num(metrics, 'roe'):.1f}%",
+        f"{company}.rating": rating["text"],
+        f"{company}.rating_class": f"rating-badge rating-{rating['tone']}",
+    }
+
+
+def chart_context(data: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Array literals for the comparison charts; empty unless every charted company is present."""
+    if not all(c in data for c in CHART_ORDER):
+        return {}
+
+    def series(key: str, digits: int = 1) -> str:
+        return js_array([_num(data[c], key) for c in CHART_ORDER], digits)
+
+    out = {
+        "chart.revenue": series("revenue_billion"),
+        "chart.revenue_growth": series("revenue_growth"),
+        "chart.pe_ratio": series("pe_ratio"),
+        "chart.pb_ratio": series("pb_ratio", 2),
+        "chart.peg_ratio": series("peg_ratio", 2),
+        "chart.fcf": series("fcf_billion"),
+        "chart.rsi": series("rsi_14"),
+        "chart.margins": series("op_margin"),
+    }
+    for company in RISK_CHART_COMPANIES:
+        m = data[company]
+        out[f"chart.risk.{company}"] = (
+            f"[{_num(m, 'beta'):.2f}, {_num(m, 'volatility'):.1f}, {_num(m, 'debt_equity'):.2f}, {_num(m, '52w_position'):.0f}]"
+        )
+    return out
+
+
+def equity_context(data: Dict[str, Dict[str, Any]], zh: bool = False, now: Optional[datetime] = None) -> Dict[str, str]:
+    context: Dict[str, str] = {}
+    for company, metrics in data.items():
+        context.update(company_card_context(company, metrics))
+    context.update(chart_context(data))
+    context.update(meta_context(zh, now))
+    return context
+
+
+def company_context(company: str, metrics: Dict[str, Any], zh: bool = False, now: Optional[datetime] = None) -> Dict[str, str]:
+    """Values for ``<company>.html``."""
+    rating = rating_view((metrics.get("technical_rating") or {}).get("rating"))
+    high, low = _num(metrics, "52w_high"), _num(metrics, "52w_low")
+    return {
+        f"{company}.price": f"HK${_num(metrics, 'price'):.2f}",
+        f"{company}.market_cap": str(metrics.get("market_cap_display", "")),
+        f"{company}.pe_ratio": f"{_num(metrics, 'pe_ratio'):.1f}x",
+        f"{company}.52w_high": f"HK${high:.2f}",
+        f"{company}.52w_low": f"HK${low:.2f}",
+        f"{company}.52w_range": f"HK${high:.2f} / HK${low:.2f}",
+        f"{company}.rating_upper": rating["text"].upper(),
+        f"{company}.badge_class": f"badge-{rating['tone']}",
+        f"{company}.rating_style": f"color: {rating['color']}; font-weight: 700;",
+        **meta_context(zh, now),
+    }
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Write .gz and .br siblings for static site artifacts, skipping sources whose content is unchanged."""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.config import load_config
+from scripts.storage.manifest import ContentManifest
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # optional: .br output is skipped without it
+    brotli = None
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+COMPRESS_MANIFEST = ROOT / ".build" / "compress_manifest.json"
+
+
+def collect(root: Path, include: List[str], exclude: List[str], min_bytes: int) -> List[Path]:
+    files = {p for pattern in include for p in root.glob(pattern) if p.is_file()}
+    excluded = {p for pattern in exclude for p in root.glob(pattern)}
+    return sorted(p for p in files - excluded if p.stat().st_size >= min_bytes)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def compress_file(path: Path) -> Tuple[str, int, int, Optional[int]]:
+    """Compress one file at maximum level; returns (path, raw, gzip, brotli) byte sizes."""
+    raw = path.read_bytes()
+    # mtime=0 keeps the gzip bytes deterministic, so unchanged sources produce identical output.
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    _write_bytes(path.with_name(path.name + ".gz"), gz)
+    br_size = None
+    if brotli is not None:
+        br = brotli.compress(raw, quality=11)
+        _write_bytes(path.with_name(path.name + ".br"), br)
+        br_size = len(br)
+    return str(path), len(raw), len(gz), br_size
+
+
+def _up_to_date(path: Path, digest: str, manifest: ContentManifest) -> bool:
+    siblings = [path.with_name(path.name + ".gz")] + ([path.with_name(path.name + ".br")] if brotli is not None else [])
+    return manifest.entries.get(manifest.key(path)) == digest and all(s.exists() for s in siblings)
+
+
+def compress_site(
+    root: Path = ROOT, workers: Optional[int] = None, force: bool = False, manifest_path: Path = COMPRESS_MANIFEST
+) -> Dict[str, int]:
+    cfg = load_config().get("compress", {})
+    files = collect(root, cfg.get("include", []), cfg.get("exclude", []), int(cfg.get("min_bytes", 0)))
+    manifest = ContentManifest(manifest_path)
+    digests = {p: hashlib.sha256(p.read_bytes()).hexdigest() for p in files}
+    todo = [p for p in files if force or not _up_to_date(p, digests[p], manifest)]
+    if brotli is None:
+        logger.warning("brotli not installed; writing .gz only")
+
+    totals = {"files": len(files), "compressed": 0, "raw_bytes": 0, "gzip_bytes": 0, "brotli_bytes": 0}
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for name, raw, gz, br in pool.map(compress_file, todo, chunksize=4):
+                totals["compressed"] += 1
+                totals["raw_bytes"] += raw
+                totals["gzip_bytes"] += gz
+                totals["brotli_bytes"] += br or 0
+                manifest.mark_written(Path(name), digests[Path(name)])
+        manifest.save()
+    logger.info(
+        "Compressed %s/%s artifacts: %s -> %s gzip bytes%s",
+        totals["compressed"],
+        totals["files"],
+        totals["raw_bytes"],
+        totals["gzip_bytes"],
+        f", {totals['brotli_bytes']} brotli bytes" if brotli is not None else "",
+    )
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompress HTML/JS/JSON artifacts for static hosting")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Recompress even when sources are unchanged")
+    args = parser.parse_args()
+    compress_site(workers=args.workers, force=args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
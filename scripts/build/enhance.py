@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""In-memory versions of the HTML patch scripts, applied to page templates before binding."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List
+
+from scripts.add_charts_and_news import add_scripts_text
+from scripts.add_metric_explanations import add_explanations_text
+from scripts.fix_news_loading import fix_news_text
+from scripts.inject_enhancements import inject_enhancements_text
+from scripts.restructure_tabs import restructure_text
+
+Transform = Callable[[str], str]
+
+# Same order the standalone scripts were run in; each step is a no-op on already-patched markup.
+ENHANCEMENTS: Dict[str, List[Transform]] = {
+    "equity": [restructure_text, add_scripts_text, inject_enhancements_text, fix_news_text],
+    "company": [lambda text: add_explanations_text(text)[0]],
+}
+
+
+def enhance(kind: str, text: str) -> str:
+    """Apply every enhancement for a page ``kind`` ("equity" | "company") to the English template."""
+    for transform in ENHANCEMENTS.get(kind, []):
+        text = transform(text)
+    return text
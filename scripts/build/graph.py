@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Build graph of page -> data fields, so a run re-renders only pages whose inputs changed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from scripts.build.pages import ROOT, Page
+from scripts.storage.datadir import DataDirectory
+from scripts.storage.manifest import ContentManifest
+
+GRAPH_NAME = "build_graph.json"
+GRAPH_VERSION = 2
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+# Changing how values are formatted, how templates are patched (enhance.py and the patch
+# modules it imports) or how zh copies are translated invalidates every page.
+RENDER_SOURCES = [Path(__file__).with_name(name) for name in ("bindings.py", "enhance.py", "pages.py", "render.py")] + [
+    SCRIPTS_DIR / f"{name}.py"
+    for name in (
+        "add_charts_and_news",
+        "add_metric_explanations",
+        "enhance_analysis",
+        "fix_news_loading",
+        "inject_enhancements",
+        "restructure_tabs",
+        "sync_zh_pages",
+    )
+]
+
+_MISSING = object()
+
+
+class _Tracked(dict):
+    """Read-only dict copy that records every key path read from it (and its nested dicts)."""
+
+    def __init__(self, data: Dict[str, Any], reads: Set[str], prefix: str = "") -> None:
+        super().__init__(data)
+        self._reads = reads
+        self._prefix = prefix
+
+    def _wrap(self, key: str, value: Any) -> Any:
+        self._reads.add(f"{self._prefix}{key}")
+        if isinstance(value, dict):
+            return _Tracked(value, self._reads, f"{self._prefix}{key}.")
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._wrap(key, super().__getitem__(key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._wrap(key, super().get(key, default))
+
+    def __contains__(self, key: object) -> bool:
+        self._reads.add(f"{self._prefix}{key}")
+        return super().__contains__(key)
+
+    def items(self):  # type: ignore[override]
+        self._reads.add(f"{self._prefix}*")
+        return [(key, self[key]) for key in self.keys()]
+
+
+def resolve(data: Dict[str, Any], field: str) -> Any:
+    """Current value of a recorded field path; nested dicts resolve to their presence only.
+
+    ``a.*`` resolves to the sorted keys of ``a``, matching an ``items()`` iteration.
+    """
+    node: Any = data
+    *parents, leaf = field.split(".")
+    for part in parents:
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    if not isinstance(node, dict):
+        return None
+    if leaf == "*":
+        return sorted(node)
+    value = node.get(leaf, _MISSING)
+    if value is _MISSING:
+        return None
+    return True if isinstance(value, dict) else value
+
+
+def inputs_digest(data: Dict[str, Any], fields: Iterable[str]) -> str:
+    values = {field: resolve(data, field) for field in sorted(fields)}
+    canonical = json.dumps(values, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def tracked_context(
+    page: Page, data: Dict[str, Dict[str, Any]], now: Optional[datetime] = None
+) -> Tuple[Optional[Dict[str, str]], List[str]]:
+    """Build ``page``'s binding context and return it with the data fields it read."""
+    reads: Set[str] = set()
+    context = page.context(_Tracked(data, reads), now)
+    return context, sorted(reads)
+
+
+def template_digest(page: Page, root: Path = ROOT) -> Optional[str]:
+    """Digest of the English source file ``page`` is rendered from; None when it does not exist."""
+    source = root / page.source
+    if not source.exists():
+        return None
+    return hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+
+
+def _render_digest() -> str:
+    digest = hashlib.sha256()
+    for path in RENDER_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class BuildGraph:
+    """Per-page dependency fields and the digest of their values at the last build.
+
+    Stored as ``data/build_graph.json`` next to the data it describes. Checking a page
+    costs one lookup per recorded field plus a hash of its source template, recorded after
+    the page is written, so hand edits to a template re-render it; only stale pages are rebuilt.
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[DataDirectory] = None,
+        mode: str = "static",
+        name: str = GRAPH_NAME,
+        root: Path = ROOT,
+        stamp: Optional[str] = None,
+    ) -> None:
+        self.data_dir = data_dir or DataDirectory()
+        self.root = root
+        self.mode = mode
+        self.name = name
+        self.stamp = stamp
+        self.render = _render_digest()
+        stored = self.data_dir.load(name, {})
+        # A mode switch (hydrate -> static) must re-render HTML that was left untouched, and a
+        # new "Last updated" stamp must reach every page, not only those whose fields moved.
+        current = (GRAPH_VERSION, self.render, mode, stamp)
+        fresh = (stored.get("version"), stored.get("render"), stored.get("mode"), stored.get("stamp")) == current
+        self.nodes: Dict[str, Dict[str, Any]] = dict(stored.get("pages", {})) if fresh else {}
+
+    def is_stale(self, page: Page, data: Dict[str, Dict[str, Any]]) -> bool:
+        node = self.nodes.get(page.name)
+        if node is None or node.get("template") != template_digest(page, self.root):
+            return True
+        return inputs_digest(data, node["fields"]) != node["digest"]
+
+    def stale(self, pages: Iterable[Page], data: Dict[str, Dict[str, Any]]) -> List[Page]:
+        return [page for page in pages if self.is_stale(page, data)]
+
+    def update(self, page: Page, fields: List[str], data: Dict[str, Dict[str, Any]]) -> None:
+        self.nodes[page.name] = {
+            "fields": fields,
+            "digest": inputs_digest(data, fields),
+            "template": template_digest(page, self.root),
+        }
+
+    def prune(self, pages: Iterable[Page]) -> None:
+        keep = {page.name for page in pages}
+        for name in [n for n in self.nodes if n not in keep]:
+            del self.nodes[name]
+
+    def save(self, manifest: Optional[ContentManifest] = None) -> bool:
+        payload = {
+            "version": GRAPH_VERSION,
+            "render": self.render,
+            "mode": self.mode,
+            "stamp": self.stamp,
+            "pages": dict(sorted(self.nodes.items())),
+        }
+        return self.data_dir.write(self.name, payload, manifest)
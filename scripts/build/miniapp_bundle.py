@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Build compact, versioned per-page data bundles for the WeChat miniapp."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.storage.datadir import DataDirectory
+from scripts.storage.jsonio import atomic_write_text, dumps
+from scripts.storage.manifest import ContentManifest, json_digest
+
+logger = logging.getLogger(__name__)
+
+MINIAPP_DATA_DIR = ROOT / "miniapp" / "data"
+REMOTE_DIR = "miniapp"
+
+# Only the fields the miniapp pages render (pages/index and pages/company buildMetrics).
+INDEX_FIELDS = ("price", "change_pct", "market_cap", "pe_ratio", "technical_rating")
+DETAIL_FIELDS = (
+    "company_name", "price", "change_pct", "market_cap_display", "pe_ratio", "roe",
+    "rsi_14", "macd", "52w_high", "52w_low", "volatility",
+)
+NEWS_FIELDS = ("title", "summary", "link", "publisher", "sentiment_label")
+NEWS_LIMIT = 10
+
+
+def trim_news(items: List[Dict[str, Any]], limit: int = NEWS_LIMIT) -> List[Dict[str, Any]]:
+    out = []
+    for item in items:
+        if not item.get("title") or item.get("title") == "Untitled":
+            continue
+        out.append({k: item.get(k) or "" for k in NEWS_FIELDS})
+        if len(out) == limit:
+            break
+    return out
+
+
+def build_bundles(data_dir: DataDirectory) -> Dict[str, Any]:
+    summary = data_dir.load("stock_summary.json", {})
+    companies = data_dir.load("comprehensive_stock_data.json", {}).get("companies", {})
+    news_meta = data_dir.load("news_metadata.json", {})
+
+    index = {
+        "timestamp": data_dir.load("comprehensive_stock_data.json", {}).get("timestamp", ""),
+        "summary": {c: {k: row.get(k) for k in INDEX_FIELDS} for c, row in summary.items()},
+    }
+    company_bundles = {}
+    for company, payload in companies.items():
+        detail = {k: payload.get(k) for k in DETAIL_FIELDS}
+        detail["technical_rating"] = (payload.get("technical_rating") or {}).get("rating")
+        company_bundles[company] = {
+            "news_update": news_meta.get("last_update", ""),
+            "detail": detail,
+            "news": trim_news(data_dir.load(f"news_{company}.json", [])),
+        }
+    return {"index": index, "company": company_bundles}
+
+
+def bundle_version(payload: Any) -> str:
+    """Content hash that ignores run timestamps, so it only changes when rendered data changes."""
+    return json_digest(payload)[:12]
+
+
+def write_bundles(
+    data_dir: Optional[DataDirectory] = None,
+    manifest: Optional[ContentManifest] = None,
+    local_dir: Path = MINIAPP_DATA_DIR,
+) -> Dict[str, Any]:
+    """Write the remote bundles under data/miniapp and the bundled fallbacks under miniapp/data."""
+    data_dir = data_dir or DataDirectory()
+    bundles = build_bundles(data_dir)
+    index = {**bundles["index"], "version": bundle_version(bundles["index"]["summary"])}
+    companies = {c: {**b, "version": bundle_version(b)} for c, b in bundles["company"].items()}
+
+    versions = {
+        "version": bundle_version({"index": index["version"], **{c: b["version"] for c, b in companies.items()}}),
+        "index": index["version"],
+        "company": {c: b["version"] for c, b in companies.items()},
+    }
+    data_dir.write(f"{REMOTE_DIR}/index.json", index, manifest, pretty=False)
+    for company, bundle in companies.items():
+        data_dir.write(f"{REMOTE_DIR}/company/{company}.json", bundle, manifest, pretty=False)
+    data_dir.write(f"{REMOTE_DIR}/version.json", versions, manifest, pretty=False)
+
+    # Local fallbacks ship inside the miniapp package: one minified module per page.
+    local = {
+        "index.js": index,
+        "company.js": {"version": versions["version"], "companies": companies},
+    }
+    for name, payload in local.items():
+        content = f"module.exports = {dumps(payload, pretty=False)};\n"
+        path = local_dir / name
+        if manifest is None:
+            atomic_write_text(path, content)
+        else:
+            manifest.write_text(path, content, json_digest(payload))
+    logger.info("Miniapp bundles version %s (%s companies)", versions["version"], len(companies))
+    return versions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build miniapp data bundles from data/")
+    parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    manifest = ContentManifest()
+    write_bundles(manifest=manifest)
+    manifest.save()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Data-bound site pages and the per-page binding payloads hydrate.js applies in the browser."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from scripts.build.bindings import company_context, equity_context
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+PAGES_FOLDER = "pages"
+CHARTS_FOLDER = "charts"
+CHART_PREFIX = "chart."
+MODES = ("static", "hydrate")
+
+
+@dataclass(frozen=True)
+class Page:
+    """One rendered HTML file: the equity overview or a company page, in English or zh."""
+
+    kind: str  # "equity" | "company"
+    company: Optional[str] = None
+    zh: bool = False
+
+    @property
+    def name(self) -> str:
+        stem = "equity-analysis" if self.kind == "equity" else str(self.company)
+        return f"{stem}-zh" if self.zh else stem
+
+    @property
+    def filename(self) -> str:
+        return f"{self.name}.html"
+
+    @property
+    def source(self) -> str:
+        """English page the HTML is rendered from; zh variants go through sync_zh_pages.zh_text."""
+        return f"{self.name[:-3] if self.zh else self.name}.html"
+
+    @property
+    def bindings(self) -> str:
+        """Data-directory-relative path of this page's hydration payload."""
+        return f"{PAGES_FOLDER}/{self.name}.json"
+
+    @property
+    def charts(self) -> str:
+        """Data-directory-relative path of the page's chart datasets; zh variants share the English file."""
+        return f"{CHARTS_FOLDER}/{self.source[:-5]}.json"
+
+    def context(self, data: Dict[str, Dict[str, Any]], now: Optional[datetime] = None) -> Optional[Dict[str, str]]:
+        if self.kind == "equity":
+            return equity_context(data, zh=self.zh, now=now)
+        if self.company not in data:
+            return None
+        return company_context(str(self.company), data[self.company], zh=self.zh, now=now)
+
+
+def discover_pages(companies: Iterable[str], root: Path = ROOT, zh: bool = True) -> List[Page]:
+    """Pages for ``companies`` that have an English source page under ``root``.
+
+    zh variants are listed whether or not the copy exists yet, since sync_zh_pages
+    creates them from the English page at deploy time.
+    """
+    variants = (False, True) if zh else (False,)
+    pages = [Page("equity", zh=v) for v in variants]
+    pages.extend(Page("company", c, zh=v) for c in companies if (root / f"{c}.html").exists() for v in variants)
+    return pages
+
+
+def hydration_payload(context: Dict[str, str]) -> Dict[str, Any]:
+    """Split a binding context into timestamps and element values; chart keys go to ``chart_datasets``."""
+    payload: Dict[str, Any] = {"timestamps": {}, "values": {}}
+    for key, value in sorted(context.items()):
+        if key.startswith("meta."):
+            payload["timestamps"][key] = value
+        elif not key.startswith(CHART_PREFIX):
+            payload["values"][key] = value
+    return payload
+
+
+def chart_datasets(context: Dict[str, str]) -> Dict[str, Any]:
+    """Chart arrays from a binding context, keyed without the ``chart.`` prefix, as chart-loader.js reads them."""
+    return {
+        key[len(CHART_PREFIX):]: json.loads(value)
+        for key, value in sorted(context.items())
+        if key.startswith(CHART_PREFIX)
+    }
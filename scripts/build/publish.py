@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Render stale pages and their hydration payloads in a process pool, one English/zh pair per job."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.build.enhance import enhance
+from scripts.build.graph import BuildGraph, tracked_context
+from scripts.build.pages import MODES, ROOT, Page, chart_datasets, discover_pages, hydration_payload
+from scripts.build.render import render
+from scripts.storage.datadir import DataDirectory
+from scripts.storage.jsonio import atomic_write_text, dumps
+from scripts.storage.manifest import ContentManifest, json_digest, text_digest
+from scripts.sync_zh_pages import zh_text
+
+logger = logging.getLogger(__name__)
+
+# (pages, data subset, site root, data root, mode, manifest digests of the job's targets, "Last updated" time)
+Job = Tuple[List[Page], Dict[str, Dict[str, Any]], Path, Path, str, Dict[str, str], Optional[datetime]]
+
+
+def render_page_file(html_file: Path, context: Dict[str, str], manifest: Optional[ContentManifest] = None) -> bool:
+    """Re-render ``html_file`` in place; False when it does not exist."""
+    if not html_file.exists():
+        return False
+
+    content = render(html_file.read_text(encoding="utf-8"), context)
+    if manifest is None:
+        atomic_write_text(html_file, content)
+        logger.info("Updated %s", html_file.name)
+    elif manifest.write_text(html_file, content):
+        logger.info("Updated %s", html_file.name)
+    else:
+        logger.info("Unchanged %s (skipped write)", html_file.name)
+    return True
+
+
+def _targets(page: Page, root: Path, data_root: Path, mode: str) -> List[Path]:
+    targets = [data_root / page.bindings, data_root / page.charts]
+    return targets + ([root / page.filename] if mode == "static" else [])
+
+
+def _write_if_changed(path: Path, content: str, digest: str, known: Dict[str, str], written: Dict[str, str]) -> None:
+    key = ContentManifest.key(path)
+    if path.exists() and known.get(key) == digest:
+        return
+    atomic_write_text(path, content)
+    written[str(path)] = digest
+
+
+def render_job(job: Job) -> Tuple[List[Tuple[Page, List[str]]], Dict[str, str]]:
+    """Worker: build, enhance, render and atomically write the job's pages.
+
+    Returns each page with its dependency fields, plus ``{path: digest}`` for the files
+    actually written so the parent can update the content manifest.
+    """
+    pages, data, root, data_root, mode, known, now = job
+    built: List[Tuple[Page, List[str]]] = []
+    written: Dict[str, str] = {}
+    template: Optional[str] = None
+    for page in pages:
+        context, fields = tracked_context(page, data, now)
+        if context is None:
+            continue
+        payload = hydration_payload(context)
+        _write_if_changed(data_root / page.bindings, dumps(payload, pretty=False), json_digest(payload), known, written)
+        charts = chart_datasets(context)
+        if charts and not page.zh:
+            _write_if_changed(data_root / page.charts, dumps(charts, pretty=False), json_digest(charts), known, written)
+        if mode == "static":
+            source = root / page.source
+            if template is None and source.exists():
+                template = enhance(page.kind, source.read_text(encoding="utf-8"))
+            if template is not None:
+                text = zh_text(page.source, template) if page.zh else template
+                content = render(text, context)
+                _write_if_changed(root / page.filename, content, text_digest(content), known, written)
+        built.append((page, fields))
+    return built, written
+
+
+def plan_jobs(
+    pages: List[Page],
+    data: Dict[str, Dict[str, Any]],
+    root: Path,
+    data_root: Path,
+    mode: str,
+    manifest: Optional[ContentManifest],
+    now: Optional[datetime] = None,
+) -> List[Job]:
+    """One job per English source page; ``now`` stamps "Last updated" (default: render time)."""
+    groups: Dict[str, List[Page]] = {}
+    for page in pages:
+        groups.setdefault(page.source, []).append(page)
+    jobs = []
+    for group in groups.values():
+        # Company pages only read their own company; ship just that slice to the worker.
+        company = group[0].company
+        subset = {company: data[company]} if company in data else data
+        known = {}
+        if manifest is not None:
+            for page in group:
+                for target in _targets(page, root, data_root, mode):
+                    key = ContentManifest.key(target)
+                    if key in manifest.entries:
+                        known[key] = manifest.entries[key]
+        jobs.append((group, subset, root, data_root, mode, known, now))
+    return jobs
+
+
+def run_jobs(
+    jobs: List[Job], manifest: Optional[ContentManifest] = None, workers: Optional[int] = None
+) -> List[Tuple[List[Tuple[Page, List[str]]], Dict[str, str]]]:
+    """Run render jobs (in a process pool unless ``workers == 1`` or there is a single job) and record writes."""
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render_job, jobs))
+    else:
+        results = [render_job(job) for job in jobs]
+    if manifest is not None:
+        for _, written in results:
+            for path, digest in written.items():
+                manifest.mark_written(Path(path), digest)
+    return results
+
+
+def publish_pages(
+    data: Dict[str, Dict[str, Any]],
+    manifest: Optional[ContentManifest] = None,
+    data_dir: Optional[DataDirectory] = None,
+    mode: str = "static",
+    root: Path = ROOT,
+    workers: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """Rebuild the pages whose recorded data fields changed since the last run.
+
+    Each rebuilt page gets ``data/pages/<page>.json``; in static mode its HTML is
+    rendered too (zh variants from the English source), while in hydrate mode the
+    HTML is left untouched for hydrate.js. ``now`` is the "Last updated" stamp; a new
+    stamp rebuilds every page. Returns the rebuilt page names.
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown site mode {mode!r}; expected one of {', '.join(MODES)}")
+    data_dir = data_dir or DataDirectory()
+    graph = BuildGraph(data_dir, mode=mode, root=root, stamp=now.isoformat() if now else None)
+    pages = discover_pages(data, root)
+    jobs = plan_jobs(graph.stale(pages, data), data, root, data_dir.root, mode, manifest, now)
+
+    rebuilt = []
+    for built, _ in run_jobs(jobs, manifest, workers):
+        for page, fields in built:
+            graph.update(page, fields, data)
+            rebuilt.append(page.name)
+    graph.prune(pages)
+    graph.save(manifest)
+    logger.info("Pages rebuilt: %d of %d (%s)", len(rebuilt), len(pages), ", ".join(rebuilt) or "none")
+    return rebuilt
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Single-pass renderer for pages with explicit data bindings.
+
+Pages stay valid HTML and double as their own templates:
+
+- ``<div data-bind="tencent.price">HK$457.00</div>`` replaces the element's text.
+- ``data-bind-<attr>="key"`` (e.g. ``data-bind-class``) replaces that attribute's value.
+- ``/*bind:chart.revenue*/[1, 2, 3]`` in inline scripts replaces the array literal.
+
+One compiled regex walks the document once, so rendering is O(document) no matter how
+many keys are bound. Keys missing from the context leave the existing markup untouched.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Any, Dict, Iterable, List, Mapping
+
+BIND_PATTERN = re.compile(
+    r"<(?P<tag>[A-Za-z][\w-]*)(?P<attrs>\s[^<>]*?\bdata-bind[\w-]*=\"[^\"]*\"[^<>]*)>(?P<text>[^<]*)"
+    r"|/\*bind:(?P<js>[\w.:-]+)\*/\[[^\[\]]*\]"
+)
+ATTR_PATTERN = re.compile(r"([\w:-]+)=\"([^\"]*)\"")
+
+
+def js_array(values: Iterable[Any], digits: int = 1) -> str:
+    return "[" + ", ".join(f"{float(v):.{digits}f}" for v in values) + "]"
+
+
+def _render_tag(match: "re.Match[str]", context: Mapping[str, Any]) -> str:
+    attrs = match.group("attrs")
+    text = match.group("text")
+    bound = dict(ATTR_PATTERN.findall(attrs))
+    key = bound.get("data-bind")
+    if key is not None and key in context:
+        text = html.escape(str(context[key]), quote=False)
+
+    overrides = {
+        name[len("data-bind-"):]: context[k]
+        for name, k in bound.items()
+        if name.startswith("data-bind-") and k in context
+    }
+    if overrides:
+        def _attr(m: "re.Match[str]") -> str:
+            name = m.group(1)
+            if name in overrides:
+                return f'{name}="{html.escape(str(overrides.pop(name)))}"'
+            return m.group(0)
+
+        attrs = ATTR_PATTERN.sub(_attr, attrs)
+        # Bound attributes absent from the markup are appended.
+        attrs += "".join(f' {name}="{html.escape(str(v))}"' for name, v in overrides.items())
+    return f"<{match.group('tag')}{attrs}>{text}"
+
+
+def render(document: str, context: Mapping[str, Any]) -> str:
+    def _sub(match: "re.Match[str]") -> str:
+        js_key = match.group("js")
+        if js_key is not None:
+            if js_key not in context:
+                return match.group(0)
+            return f"/*bind:{js_key}*/{context[js_key]}"
+        return _render_tag(match, context)
+
+    return BIND_PATTERN.sub(_sub, document)
+
+
+def bound_keys(document: str) -> List[str]:
+    """Every key a document binds, in document order (duplicates removed)."""
+    keys: Dict[str, None] = {}
+    for match in BIND_PATTERN.finditer(document):
+        if match.group("js") is not None:
+            keys[match.group("js")] = None
+            continue
+        for name, key in ATTR_PATTERN.findall(match.group("attrs")):
+            if name.startswith("data-bind"):
+                keys[key] = None
+    return list(keys)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""One-pass site build: every page enhanced, bound, translated and written once, from data loaded once."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.build.bindings import parse_stamp
+from scripts.build.pages import discover_pages
+from scripts.build.publish import plan_jobs, run_jobs
+from scripts.config import load_config
+from scripts.storage.datadir import DataDirectory
+from scripts.storage.manifest import RUN_METADATA_PATH, ContentManifest
+from scripts.sync_zh_pages import PAGE_PAIRS, zh_text
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def data_stamp(data_dir: DataDirectory, document: Dict[str, Any]) -> Optional[datetime]:
+    """When the data last changed, in HKT: ``last_change_at`` from run_metadata.json, else the data file's own timestamp.
+
+    The updater stamps pages with the same value, so rebuilding an unchanged tree rewrites nothing.
+    """
+    meta = data_dir.load(RUN_METADATA_PATH.name, {})
+    return parse_stamp(meta.get("last_change_at")) or parse_stamp(document.get("timestamp"))
+
+
+def build_site(
+    root: Path = ROOT,
+    data_dir: Optional[DataDirectory] = None,
+    manifest: Optional[ContentManifest] = None,
+    workers: Optional[int] = None,
+    zh: bool = True,
+) -> Dict[str, int]:
+    """Render every data-bound page and its zh variant, plus zh copies of the remaining pages.
+
+    Replaces running restructure_tabs, add_charts_and_news, inject_enhancements,
+    fix_news_loading, add_metric_explanations and sync_zh_pages one after another:
+    each template is read once, patched in memory (scripts/build/enhance.py) and
+    every output file is written at most once, skipping unchanged content.
+    enhance_analysis is not a step of its own: it is the section generator that
+    inject_enhancements calls. "Last updated" is when the data last changed, not the build time.
+    """
+    started = time.perf_counter()
+    data_dir = data_dir or DataDirectory(root / "data")
+    document = data_dir.load("comprehensive_stock_data.json", {})
+    data = document.get("companies", {})
+    if not data:
+        raise RuntimeError(f"no company data in {data_dir.path('comprehensive_stock_data.json')}")
+
+    pages = discover_pages(data, root, zh=zh)
+    now = data_stamp(data_dir, document)
+    if now is None:
+        logger.warning("No data timestamp; stamping pages with the build time")
+    results = run_jobs(plan_jobs(pages, data, root, data_dir.root, "static", manifest, now), manifest, workers)
+    written = sum(len(w) for _, w in results)
+
+    # Pages without data bindings (technical-analysis) only need their zh copy.
+    if zh:
+        bound = {page.source for page in pages}
+        for en, zh_name in PAGE_PAIRS.items():
+            src = root / en
+            if en in bound or not src.exists():
+                continue
+            text = zh_text(en, src.read_text(encoding="utf-8"))
+            dst = root / zh_name
+            if manifest is not None:
+                written += manifest.write_text(dst, text)
+            elif not dst.exists() or dst.read_text(encoding="utf-8") != text:
+                dst.write_text(text, encoding="utf-8")
+                written += 1
+
+    if manifest is not None:
+        manifest.save()
+    totals = {"pages": sum(len(built) for built, _ in results), "written": written}
+    logger.info("Built %s pages, wrote %s files in %.2fs", totals["pages"], totals["written"], time.perf_counter() - started)
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build every site page in one pass")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: site.workers or CPU count)")
+    parser.add_argument("--no-zh", action="store_true", help="Skip the -zh variants")
+    args = parser.parse_args()
+
+    workers = args.workers if args.workers is not None else load_config().get("site", {}).get("workers")
+    build_site(manifest=ContentManifest(), workers=workers, zh=not args.no_zh)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
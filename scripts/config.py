@@ -16,11 +16,38 @@ DEFAULT_CONFIG = {
         "ohlcv": ["akshare", "alltick", "yfinance", "snowball"],
         "fundamentals": ["yfinance"],
         "news": ["yfinance", "newsapi"],
+        "intraday": ["alltick", "akshare"],
     },
     "request": {"timeout_seconds": 15, "max_retries": 2, "ohlcv_period": "3mo", "min_points": 30},
+    "intraday": {"interval_minutes": 1, "poll_seconds": 1.0, "opening_range_minutes": 30, "workers": 16},
     "freshness": {
         "max_age_hours": {"comprehensive_stock_data": 12, "news": 8, "stock_summary": 12}
     },
+    "storage": {
+        "bars_dir": "data/bars",
+        "history_bars": 750,
+        "history_db": "data/history.sqlite",
+        "snapshot_dir": "data/snapshots",
+        "rebase_every": 168,
+    },
+    "compress": {
+        "include": ["*.html", "*.js", "data/*.json", "data/companies/*.json", "data/pages/*.json", "data/charts/*.json"],
+        "exclude": [],
+        "min_bytes": 1024,
+    },
+    "site": {"mode": "hydrate", "workers": None},
+    "risk": {"weights": {}, "confidence": [0.95, 0.99], "lookback_days": 250, "horizon_days": 1},
+    "screener": {
+        "sort": "fcf_yield",
+        "descending": True,
+        "limit": 0,
+        "screens": {"all": [], "oversold_value": ["rsi_14<30", "pe_ratio<15"], "high_fcf": ["fcf_yield>5"]},
+    },
+    "benchmarks": {"symbols": {"hsi": "^HSI", "hstech": "3033.HK"}, "primary": "hsi", "beta_window": 60},
+    "indicator_benchmark": {
+        "tolerance": 1e-6,
+        "min_bars_per_sec": {"1": 100000, "100": 100000, "1000": 100000, "streaming": 5000},
+    },
 }
 
 
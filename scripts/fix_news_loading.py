@@ -258,6 +258,17 @@ def get_improved_news_script(lang='en'):
         });
 '''
 
+def fix_news_text(content, lang='en'):
+    """Replace the tab-triggered news loader with the improved script (no-op without one)"""
+    # Pattern: from "async function loadNews" to the end of the event listeners
+    pattern = r'(        // Load news for each company\s+async function loadNews.*?document\.getElementById\(\'meituan-tab\'\)\.addEventListener\(\'shown\.bs\.tab\'.*?\}\);)'
+
+    replacement = get_improved_news_script(lang)
+    if replacement in content:
+        return content
+
+    return re.sub(pattern, replacement, content, flags=re.DOTALL)
+
 def fix_news_loading_in_file(file_path, lang='en'):
     """Fix news loading in HTML file"""
 
@@ -265,12 +276,7 @@ def fix_news_loading_in_file(file_path, lang='en'):
         content = f.read()
 
     # Find and replace the news loading function
-    # Pattern: from "async function loadNews" to the end of the event listeners
-    pattern = r'(        // Load news for each company\s+async function loadNews.*?document\.getElementById\(\'meituan-tab\'\)\.addEventListener\(\'shown\.bs\.tab\'.*?\}\);)'
-
-    replacement = get_improved_news_script(lang)
-
-    content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+    content = fix_news_text(content, lang)
 
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Cross-sectional indicator computation over an aligned (symbols x days) matrix.
+
+Missing bars are described by a validity mask. Each row's valid bars are packed to
+the right edge so every symbol is evaluated over its own bar sequence, exactly as
+``engine.compute_series`` would, and results are scattered back onto the date grid.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import _MIN_DECAY_POWER, _WARMUP_DEFAULTS, TRADING_DAYS
+from .extrema import rolling_max, rolling_min
+
+
+def align_points(points_by_symbol: Dict[str, List[Dict[str, Any]]]) -> Tuple[List[str], List[str], Dict[str, np.ndarray], np.ndarray]:
+    """Build aligned OHLCV matrices on the union of dates; missing bars are NaN and masked out."""
+    symbols = list(points_by_symbol)
+    dates = sorted({str(p["date"]) for pts in points_by_symbol.values() for p in pts})
+    col = {d: j for j, d in enumerate(dates)}
+    shape = (len(symbols), len(dates))
+    fields = {name: np.full(shape, np.nan) for name in ("close", "high", "low", "volume")}
+    for i, symbol in enumerate(symbols):
+        for p in points_by_symbol[symbol]:
+            j = col[str(p["date"])]
+            fields["close"][i, j] = p["close"]
+            fields["high"][i, j] = p.get("high", p["close"])
+            fields["low"][i, j] = p.get("low", p["close"])
+            fields["volume"][i, j] = p.get("volume", 0) or 0
+    mask = ~np.isnan(fields["close"])
+    return symbols, dates, fields, mask
+
+
+def _pack(x: np.ndarray, order: np.ndarray) -> np.ndarray:
+    return np.take_along_axis(x, order, axis=1)
+
+
+def _first_valid(x: np.ndarray, start: np.ndarray) -> np.ndarray:
+    cols = np.minimum(start, x.shape[1] - 1)
+    first = x[np.arange(x.shape[0]), cols]
+    return np.where(start < x.shape[1], first, 0.0)
+
+
+def _bfill(x: np.ndarray, start: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    return np.where(cols < start[:, None], _first_valid(x, start)[:, None], x)
+
+
+def _windowed_sum(x: np.ndarray, period: int) -> np.ndarray:
+    csum = np.cumsum(np.pad(x, ((0, 0), (1, 0))), axis=1)
+    out = csum[:, 1:].copy()
+    out[:, period:] = csum[:, period + 1:] - csum[:, 1:-period]
+    return out
+
+
+def _linear_filter_rows(x: np.ndarray, alpha: float, init: np.ndarray) -> np.ndarray:
+    """Row-wise y[t] = alpha * x[t] + (1 - alpha) * y[t - 1] in blocked closed form (see engine.linear_filter)."""
+    decay = 1.0 - alpha
+    out = np.empty_like(x)
+    if x.shape[1] == 0:
+        return out
+    chunk = max(1, int(math.log(_MIN_DECAY_POWER) / math.log(decay))) if 0.0 < decay < 1.0 else x.shape[1]
+    prev = np.asarray(init, dtype=float)
+    for offset in range(0, x.shape[1], chunk):
+        block = x[:, offset:offset + chunk]
+        powers = decay ** np.arange(block.shape[1])
+        acc = np.cumsum(block / powers, axis=1)
+        y = powers * (decay * prev[:, None] + alpha * acc)
+        out[:, offset:offset + block.shape[1]] = y
+        prev = y[:, -1]
+    return out
+
+
+class _Packed:
+    """Right-aligned view of the inputs with per-row history start columns."""
+
+    def __init__(self, fields: Dict[str, np.ndarray], mask: np.ndarray) -> None:
+        self.order = np.argsort(mask, axis=1, kind="stable")
+        self.mask = _pack(mask, self.order)
+        self.start = self.mask.shape[1] - self.mask.sum(axis=1)
+        self.cols = np.arange(self.mask.shape[1])[None, :]
+        self.t = self.cols - self.start[:, None]
+        self.fields = {k: _bfill(_pack(np.asarray(v, dtype=float), self.order), self.start, self.cols) for k, v in fields.items()}
+
+    def unpack(self, x: np.ndarray) -> np.ndarray:
+        out = np.full(x.shape, np.nan)
+        np.put_along_axis(out, self.order, np.where(self.mask, x, np.nan), axis=1)
+        return out
+
+    def sma(self, x: np.ndarray, period: int) -> np.ndarray:
+        base = _first_valid(x, self.start)[:, None]
+        shifted = np.where(self.mask, x - base, 0.0)
+        counts = np.clip(self.t + 1, 1, period)
+        return _windowed_sum(shifted, period) / counts + base
+
+    def rolling_std(self, x: np.ndarray, period: int) -> np.ndarray:
+        base = _first_valid(x, self.start)[:, None]
+        shifted = np.where(self.mask, x - base, 0.0)
+        counts = np.clip(self.t + 1, 1, period)
+        mean = _windowed_sum(shifted, period) / counts
+        mean_sq = _windowed_sum(shifted * shifted, period) / counts
+        return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+    def ema(self, x: np.ndarray, period: int) -> np.ndarray:
+        # Leading columns hold the first valid value, which leaves a first-value-seeded EMA untouched.
+        return _linear_filter_rows(x, 2.0 / (period + 1), _first_valid(x, self.start))
+
+    def wilder(self, x: np.ndarray, period: int, start: np.ndarray) -> np.ndarray:
+        n = x.shape[1]
+        csum = np.cumsum(np.pad(np.where(self.cols >= start[:, None], x, 0.0), ((0, 0), (1, 0))), axis=1)
+        stop = np.minimum(start + period, n)
+        seed = (csum[np.arange(x.shape[0]), stop] - csum[np.arange(x.shape[0]), np.minimum(start, n)]) / period
+        seed_end = (start + period)[:, None]
+        filled = np.where(self.cols < seed_end, seed[:, None], x)
+        out = _linear_filter_rows(filled, 1.0 / period, seed)
+        return np.where(self.cols >= seed_end - 1, out, np.nan)
+
+    def rsi(self, close: np.ndarray, period: int) -> np.ndarray:
+        deltas = np.zeros_like(close)
+        deltas[:, 1:] = np.diff(close, axis=1)
+        avg_gain = self.wilder(np.clip(deltas, 0.0, None), period, self.start + 1)
+        avg_loss = self.wilder(np.clip(-deltas, 0.0, None), period, self.start + 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+        return np.where(np.isnan(avg_gain), np.nan, values)
+
+    def atr(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+        tr = high - low
+        prev = close[:, :-1]
+        tr[:, 1:] = np.maximum.reduce([tr[:, 1:], np.abs(high[:, 1:] - prev), np.abs(low[:, 1:] - prev)])
+        return self.wilder(tr, period, self.start + 1)
+
+    def volatility(self, close: np.ndarray, period: int, bars_per_year: int = TRADING_DAYS) -> np.ndarray:
+        window = period - 1
+        ret = np.zeros_like(close)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret[:, 1:] = np.diff(close, axis=1) / close[:, :-1]
+        ret = np.where(self.t >= 1, ret, 0.0)
+        mean = _windowed_sum(ret, window) / window
+        var = _windowed_sum(ret * ret, window) / window - mean * mean
+        out = np.sqrt(np.maximum(var, 0.0)) * np.sqrt(bars_per_year) * 100
+        return np.where(self.t >= period - 1, out, np.nan)
+
+    def momentum(self, close: np.ndarray, period: int) -> np.ndarray:
+        lag = period - 1
+        out = np.full(close.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[:, lag:] = (close[:, lag:] - close[:, :-lag]) / close[:, :-lag] * 100
+        return np.where(self.t >= lag, out, np.nan)
+
+
+def _packed_series(p: _Packed, bars_per_year: int = TRADING_DAYS) -> Dict[str, np.ndarray]:
+    close, high, low, volume = (p.fields[k] for k in ("close", "high", "low", "volume"))
+
+    ma_20 = p.sma(close, 20)
+    bb_std = p.rolling_std(close, 20)
+    bb_up = ma_20 + 2 * bb_std
+    bb_low = ma_20 - 2 * bb_std
+    ema_12 = p.ema(close, 12)
+    ema_26 = p.ema(close, 26)
+    macd_line = ema_12 - ema_26
+    macd_signal = _linear_filter_rows(macd_line, 2.0 / 10, macd_line[:, 0])
+
+    hh = rolling_max(high, 14)
+    ll = rolling_min(low, 14)
+    rng = hh - ll
+    w52_high = rolling_max(close, bars_per_year)
+    w52_low = rolling_min(close, bars_per_year)
+    w52_rng = w52_high - w52_low
+    avg_volume = p.sma(volume, 20)
+    vol_20 = p.volatility(close, 20, bars_per_year)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch_k = np.where(rng != 0, 100 * (close - ll) / rng, 50.0)
+        williams_r = np.where(rng != 0, -100 * (hh - close) / rng, -50.0)
+        pos_52 = np.where(w52_rng != 0, (close - w52_low) / w52_rng * 100, 50.0)
+        volume_ratio = np.where(avg_volume != 0, volume / avg_volume, 1.0)
+        bb_width = np.where(ma_20 != 0, (bb_up - bb_low) / ma_20 * 100, 0.0)
+
+    return {
+        "ma_5": p.sma(close, 5),
+        "ma_10": p.sma(close, 10),
+        "ma_20": ma_20,
+        "ma_50": p.sma(close, 50),
+        "ma_200": p.sma(close, 200),
+        "ema_12": ema_12,
+        "ema_26": ema_26,
+        "rsi_14": p.rsi(close, 14),
+        "rsi_6": p.rsi(close, 6),
+        "macd": macd_line,
+        "macd_signal": macd_signal,
+        "macd_histogram": macd_line - macd_signal,
+        "bb_upper": bb_up,
+        "bb_middle": ma_20,
+        "bb_lower": bb_low,
+        "bb_width": bb_width,
+        "atr": p.atr(high, low, close, 14),
+        "volatility": vol_20,
+        "historical_vol_20": vol_20,
+        "historical_vol_60": p.volatility(close, 60, bars_per_year),
+        "momentum_10": p.momentum(close, 10),
+        "stoch_k": stoch_k,
+        "stoch_d": p.sma(stoch_k, 3),
+        "williams_r": williams_r,
+        "52w_high": w52_high,
+        "52w_low": w52_low,
+        "52w_position": pos_52,
+        "avg_volume_20": avg_volume,
+        "volume_ratio": volume_ratio,
+        "support_20": rolling_min(close, 20),
+        "resistance_20": rolling_max(close, 20),
+    }
+
+
+@dataclass
+class BatchIndicators:
+    symbols: List[str]
+    series: Dict[str, np.ndarray]
+    latest_matrix: Dict[str, np.ndarray]
+    has_data: np.ndarray
+
+    def latest(self) -> Dict[str, Dict[str, Any]]:
+        """Per-symbol scalar dicts in the shape of ``engine.latest_values``."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for i, symbol in enumerate(self.symbols):
+            if not self.has_data[i]:
+                continue
+            row: Dict[str, Any] = {}
+            for key, values in self.latest_matrix.items():
+                if key in ("support_20", "resistance_20"):
+                    continue
+                value = float(values[i])
+                row[key] = _WARMUP_DEFAULTS.get(key, 0.0) if math.isnan(value) else value
+            row["support_levels"] = [float(self.latest_matrix["support_20"][i])]
+            row["resistance_levels"] = [float(self.latest_matrix["resistance_20"][i])]
+            out[symbol] = row
+        return out
+
+    def percentile_rank(self, key: str) -> Dict[str, float]:
+        """Cross-sectional percentile (0-100) of each symbol's latest value; ties share the mean rank."""
+        values = self.latest_matrix[key]
+        ok = self.has_data & ~np.isnan(values)
+        ranked = values[ok]
+        if ranked.size == 0:
+            return {}
+        below = np.searchsorted(np.sort(ranked), ranked, side="left")
+        at_or_below = np.searchsorted(np.sort(ranked), ranked, side="right")
+        pct = (below + at_or_below) / 2.0 / ranked.size * 100 if ranked.size > 1 else np.full(1, 50.0)
+        names = [s for s, keep in zip(self.symbols, ok) if keep]
+        return {name: float(v) for name, v in zip(names, pct)}
+
+
+def compute_batch(
+    symbols: List[str],
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    mask: Optional[np.ndarray] = None,
+    bars_per_year: int = TRADING_DAYS,
+) -> BatchIndicators:
+    """Compute every indicator for all symbols in one vectorized pass over a (symbols x days) grid.
+
+    ``bars_per_year`` sets the 52-week window and volatility annualization, as in ``engine.compute_series``.
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=float))
+    if mask is None:
+        mask = ~np.isnan(close)
+    mask = np.asarray(mask, dtype=bool)
+    packed = _Packed({"close": close, "high": high, "low": low, "volume": np.nan_to_num(volume)}, mask)
+    packed_series = _packed_series(packed, bars_per_year)
+    return BatchIndicators(
+        symbols=list(symbols),
+        series={k: packed.unpack(v) for k, v in packed_series.items()},
+        latest_matrix={k: v[:, -1] for k, v in packed_series.items()},
+        has_data=mask.any(axis=1),
+    )
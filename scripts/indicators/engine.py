@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Vectorized full-history technical indicator engine.
+
+Every function takes 1-D float arrays and returns a series of the same length, so
+charts can plot the whole history and the published scalars are just the last element.
+Leading values that cannot be computed yet are NaN, except where the legacy scalar
+calculator used an expanding window during warm-up (SMA, rolling extremes).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .extrema import rolling_max, rolling_min
+
+TRADING_DAYS = 252
+
+# Keep decay**chunk well inside float64 range for the closed-form recurrence.
+_MIN_DECAY_POWER = 1e-150
+
+
+def linear_filter(x: np.ndarray, alpha: float, init: Optional[float] = None) -> np.ndarray:
+    """Evaluate y[t] = alpha * x[t] + (1 - alpha) * y[t - 1] without a per-element loop.
+
+    The recurrence is unrolled in closed form over blocks: inside a block
+    y[t] = d**(t+1) * y0 + alpha * d**t * cumsum(x[k] / d**k), with d = 1 - alpha.
+    Blocks are sized so d**len never underflows, which keeps the pass O(n).
+    ``init`` seeds y[-1]; without it the filter starts at x[0].
+    NaNs at the start of ``x`` are skipped and propagated to the output.
+    """
+    x = np.asarray(x, dtype=float)
+    out = np.full(x.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(x))
+    if valid.size == 0:
+        return out
+    start = int(valid[0])
+    values = x[start:]
+
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[start:] = values
+        return out
+
+    if init is None:
+        prev = float(values[0])
+    else:
+        prev = float(init)
+
+    chunk = max(1, int(math.log(_MIN_DECAY_POWER) / math.log(decay))) if decay < 1.0 else len(values)
+    for offset in range(0, len(values), chunk):
+        block = values[offset:offset + chunk]
+        powers = decay ** np.arange(len(block))
+        acc = np.cumsum(block / powers)
+        y = powers * (decay * prev + alpha * acc)
+        out[start + offset:start + offset + len(block)] = y
+        prev = float(y[-1])
+    return out
+
+
+def _windowed_sum(x: np.ndarray, period: int) -> np.ndarray:
+    csum = np.cumsum(np.insert(x, 0, 0.0))
+    out = csum[1:].copy()
+    out[period:] = csum[period + 1:] - csum[1:-period]
+    return out
+
+
+def sma(x: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average via cumulative sums; expanding mean while history < period."""
+    x = np.asarray(x, dtype=float)
+    if x.size == 0:
+        return x.copy()
+    counts = np.minimum(np.arange(1, x.size + 1), period)
+    # Shift by the first value so long price histories do not lose precision in the cumsum.
+    base = x[0]
+    return _windowed_sum(x - base, period) / counts + base
+
+
+def rolling_std(x: np.ndarray, period: int) -> np.ndarray:
+    """Population standard deviation over a trailing window (expanding during warm-up)."""
+    x = np.asarray(x, dtype=float)
+    if x.size == 0:
+        return x.copy()
+    counts = np.minimum(np.arange(1, x.size + 1), period)
+    shifted = x - x[0]
+    mean = _windowed_sum(shifted, period) / counts
+    mean_sq = _windowed_sum(shifted * shifted, period) / counts
+    return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+
+def ema(x: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the first observation."""
+    return linear_filter(x, 2.0 / (period + 1))
+
+
+def wilder(x: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing seeded with the simple mean of the first ``period`` values."""
+    x = np.asarray(x, dtype=float)
+    out = np.full(x.shape, np.nan)
+    if x.size < period:
+        return out
+    seed = float(np.mean(x[:period]))
+    out[period - 1] = seed
+    if x.size > period:
+        out[period:] = linear_filter(x[period:], 1.0 / period, init=seed)
+    return out
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    close = np.asarray(close, dtype=float)
+    out = np.full(close.shape, np.nan)
+    if close.size < period + 1:
+        return out
+    deltas = np.diff(close)
+    avg_gain = wilder(np.clip(deltas, 0.0, None), period)
+    avg_loss = wilder(np.clip(-deltas, 0.0, None), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / avg_loss
+        values = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + rs))
+    out[1:] = np.where(np.isnan(avg_gain), np.nan, values)
+    return out
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    line = ema(close, fast) - ema(close, slow)
+    sig = ema(line, signal)
+    return {"macd": line, "macd_signal": sig, "macd_histogram": line - sig}
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    tr = high - low
+    if close.size > 1:
+        prev = close[:-1]
+        tr[1:] = np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - prev), np.abs(low[1:] - prev)])
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder ATR; the first bar's range has no previous close and is excluded from the seed."""
+    tr = true_range(high, low, close)
+    out = np.full(tr.shape, np.nan)
+    if tr.size < period + 1:
+        return out
+    out[1:] = wilder(tr[1:], period)
+    return out
+
+
+def bollinger(close: np.ndarray, period: int = 20, width: float = 2.0) -> Dict[str, np.ndarray]:
+    mid = sma(close, period)
+    std = rolling_std(close, period)
+    upper = mid + width * std
+    lower = mid - width * std
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bw = np.where(mid != 0, (upper - lower) / mid * 100, 0.0)
+    return {"bb_upper": upper, "bb_middle": mid, "bb_lower": lower, "bb_width": bw}
+
+
+def stochastic(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14, smooth: int = 3
+) -> Dict[str, np.ndarray]:
+    hh = rolling_max(high, period)
+    ll = rolling_min(low, period)
+    rng = hh - ll
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(rng != 0, 100 * (close - ll) / rng, 50.0)
+        wr = np.where(rng != 0, -100 * (hh - close) / rng, -50.0)
+    return {"stoch_k": k, "stoch_d": sma(k, smooth), "williams_r": wr}
+
+
+def volatility(close: np.ndarray, period: int = 20, bars_per_year: int = TRADING_DAYS) -> np.ndarray:
+    """Annualized % volatility of the ``period - 1`` bar returns inside a ``period`` bar window."""
+    close = np.asarray(close, dtype=float)
+    out = np.full(close.shape, np.nan)
+    window = period - 1
+    if close.size < period or window < 1:
+        return out
+    ret = np.diff(close) / close[:-1]
+    csum = np.cumsum(np.insert(ret, 0, 0.0))
+    csq = np.cumsum(np.insert(ret * ret, 0, 0.0))
+    mean = (csum[window:] - csum[:-window]) / window
+    var = (csq[window:] - csq[:-window]) / window - mean * mean
+    out[period - 1:] = np.sqrt(np.maximum(var, 0.0)) * np.sqrt(bars_per_year) * 100
+    return out
+
+
+def momentum(close: np.ndarray, period: int = 10) -> np.ndarray:
+    """Percent change against the first close of a ``period`` bar window."""
+    close = np.asarray(close, dtype=float)
+    out = np.full(close.shape, np.nan)
+    lag = period - 1
+    if close.size < period or lag < 1:
+        return out
+    out[lag:] = (close[lag:] - close[:-lag]) / close[:-lag] * 100
+    return out
+
+
+def compute_series(
+    close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray, bars_per_year: int = TRADING_DAYS
+) -> Dict[str, np.ndarray]:
+    """Compute every published indicator as a full-length series.
+
+    ``bars_per_year`` sets the 52-week window and the volatility annualization, so the
+    same engine runs on resampled weekly (52) or monthly (12) bars.
+    """
+    close = np.asarray(close, dtype=float)
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    volume = np.asarray(volume, dtype=float)
+
+    w52_high = rolling_max(close, bars_per_year)
+    w52_low = rolling_min(close, bars_per_year)
+    w52_rng = w52_high - w52_low
+    avg_volume = sma(volume, 20)
+    vol_20 = volatility(close, 20, bars_per_year)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pos_52 = np.where(w52_rng != 0, (close - w52_low) / w52_rng * 100, 50.0)
+        volume_ratio = np.where(avg_volume != 0, volume / avg_volume, 1.0)
+
+    series: Dict[str, np.ndarray] = {
+        "ma_5": sma(close, 5),
+        "ma_10": sma(close, 10),
+        "ma_20": sma(close, 20),
+        "ma_50": sma(close, 50),
+        "ma_200": sma(close, 200),
+        "ema_12": ema(close, 12),
+        "ema_26": ema(close, 26),
+        "rsi_14": rsi(close, 14),
+        "rsi_6": rsi(close, 6),
+        **macd(close),
+        **bollinger(close, 20),
+        "atr": atr(high, low, close, 14),
+        "volatility": vol_20,
+        "historical_vol_20": vol_20,
+        "historical_vol_60": volatility(close, 60, bars_per_year),
+        "momentum_10": momentum(close, 10),
+        **stochastic(high, low, close, 14),
+        "52w_high": w52_high,
+        "52w_low": w52_low,
+        "52w_position": pos_52,
+        "avg_volume_20": avg_volume,
+        "volume_ratio": volume_ratio,
+        "support_20": rolling_min(close, 20),
+        "resistance_20": rolling_max(close, 20),
+    }
+    return series
+
+
+# Scalar fallbacks used when an indicator has not warmed up yet.
+_WARMUP_DEFAULTS = {
+    "rsi_14": 50.0,
+    "rsi_6": 50.0,
+    "atr": 0.0,
+    "volatility": 0.0,
+    "historical_vol_20": 0.0,
+    "historical_vol_60": 0.0,
+    "momentum_10": 0.0,
+}
+
+
+def latest_values(series: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Reduce full series to the scalar dict published in company payloads."""
+    latest: Dict[str, Any] = {}
+    for key, values in series.items():
+        if key in ("support_20", "resistance_20"):
+            continue
+        value = float(values[-1])
+        if math.isnan(value):
+            value = _WARMUP_DEFAULTS.get(key, 0.0)
+        latest[key] = value
+    latest["support_levels"] = [float(series["support_20"][-1])]
+    latest["resistance_levels"] = [float(series["resistance_20"][-1])]
+    return latest
+
+
+def points_to_arrays(points: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    return {
+        "close": np.array([p["close"] for p in points], dtype=float),
+        "high": np.array([p["high"] for p in points], dtype=float),
+        "low": np.array([p["low"] for p in points], dtype=float),
+        "volume": np.array([p.get("volume", 0) for p in points], dtype=float),
+    }
+
+
+def chart_series(
+    series: Dict[str, np.ndarray], dates: List[str], keys: List[str], tail: int = 120, digits: int = 4
+) -> Dict[str, Any]:
+    """JSON-friendly slice of selected series for charting; NaN becomes null."""
+    out: Dict[str, Any] = {"dates": list(dates[-tail:])}
+    for key in keys:
+        values = series[key][-tail:]
+        out[key] = [None if math.isnan(v) else round(float(v), digits) for v in values]
+    return out
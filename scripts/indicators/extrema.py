@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Rolling window extrema and swing-pivot support/resistance detection.
+
+``MonotonicExtrema`` keeps monotonic deques so a streaming window min/max costs O(1)
+amortized per push. ``rolling_max``/``rolling_min`` produce the same full series for
+arrays with the van Herk/Gil-Werman block decomposition (the vectorized equivalent of
+the deque scan): two block-wise accumulates and one elementwise max, O(n) for any window.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class MonotonicExtrema:
+    """Streaming min/max over the last ``window`` values."""
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.index = 0
+        self._max: deque = deque()
+        self._min: deque = deque()
+
+    def push(self, value: float) -> None:
+        value = float(value)
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((self.index, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((self.index, value))
+
+        expired = self.index - self.window
+        while self._max[0][0] <= expired:
+            self._max.popleft()
+        while self._min[0][0] <= expired:
+            self._min.popleft()
+        self.index += 1
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1]
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1]
+
+    def copy(self) -> "MonotonicExtrema":
+        clone = MonotonicExtrema(self.window)
+        clone.index = self.index
+        clone._max = deque(self._max)
+        clone._min = deque(self._min)
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"window": self.window, "index": self.index, "max": [list(e) for e in self._max], "min": [list(e) for e in self._min]}
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "MonotonicExtrema":
+        ext = cls(int(raw["window"]))
+        ext.index = int(raw["index"])
+        ext._max = deque((int(i), float(v)) for i, v in raw["max"])
+        ext._min = deque((int(i), float(v)) for i, v in raw["min"])
+        return ext
+
+
+def _rolling(x: np.ndarray, period: int, accumulate: np.ufunc, fill: float) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    if x.shape[-1] == 0 or period <= 1:
+        return x.copy()
+    # Warm-up windows repeat the first value, i.e. an expanding window until ``period`` bars exist.
+    lead = np.repeat(x[..., :1], period - 1, axis=-1)
+    padded = np.concatenate([lead, x], axis=-1)
+    n = padded.shape[-1]
+    blocks = -(-n // period)
+    tail = blocks * period - n
+    padded = np.concatenate([padded, np.full(padded.shape[:-1] + (tail,), fill)], axis=-1)
+    shaped = padded.reshape(padded.shape[:-1] + (blocks, period))
+    prefix = accumulate.accumulate(shaped, axis=-1).reshape(padded.shape)
+    suffix = accumulate.accumulate(shaped[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    out_len = x.shape[-1]
+    return accumulate(suffix[..., :out_len], prefix[..., period - 1:period - 1 + out_len])
+
+
+def rolling_max(x: np.ndarray, period: int) -> np.ndarray:
+    """Trailing-window max along the last axis (1-D or 2-D), expanding during warm-up."""
+    return _rolling(x, period, np.maximum, -np.inf)
+
+
+def rolling_min(x: np.ndarray, period: int) -> np.ndarray:
+    """Trailing-window min along the last axis (1-D or 2-D), expanding during warm-up."""
+    return _rolling(x, period, np.minimum, np.inf)
+
+
+def find_pivots(high: np.ndarray, low: np.ndarray, left: int = 5, right: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices of swing highs/lows: bars that are the extreme of the ``left + right + 1`` bars around them."""
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    n = high.size
+    span = left + right + 1
+    if n < span:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    centre = np.arange(left, n - right)
+    # The trailing window ending at i + right is exactly [i - left, i + right].
+    highs = centre[high[centre] >= rolling_max(high, span)[centre + right]]
+    lows = centre[low[centre] <= rolling_min(low, span)[centre + right]]
+    return highs, lows
+
+
+def swing_levels(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    left: int = 5,
+    right: int = 5,
+    tolerance_pct: float = 1.5,
+    max_levels: int = 3,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Cluster swing pivots into price levels with touch counts.
+
+    Pivots closer than ``tolerance_pct`` to their neighbour (sorted by price) share a
+    level. Levels below the last close are support, above are resistance; each side keeps
+    the ``max_levels`` most-touched levels, ordered nearest to price first.
+    """
+    close = np.asarray(close, dtype=float)
+    highs, lows = find_pivots(high, low, left, right)
+    idx = np.concatenate([highs, lows])
+    prices = np.concatenate([np.asarray(high, dtype=float)[highs], np.asarray(low, dtype=float)[lows]])
+    if prices.size == 0:
+        return {"support": [], "resistance": []}
+
+    order = np.argsort(prices)
+    prices, idx = prices[order], idx[order]
+    breaks = np.flatnonzero(np.diff(prices) > prices[:-1] * tolerance_pct / 100) + 1
+    starts = np.concatenate([[0], breaks])
+    touches = np.diff(np.concatenate([starts, [prices.size]]))
+    level_price = np.add.reduceat(prices, starts) / touches
+    last_seen = np.maximum.reduceat(idx, starts)
+
+    last = float(close[-1])
+    levels = [
+        {"price": float(p), "touches": int(t), "last_index": int(i)}
+        for p, t, i in zip(level_price, touches, last_seen)
+    ]
+    support = [lvl for lvl in levels if lvl["price"] < last]
+    resistance = [lvl for lvl in levels if lvl["price"] >= last]
+
+    def strongest(side: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        ranked = sorted(side, key=lambda lvl: (-lvl["touches"], abs(lvl["price"] - last)))[:max_levels]
+        return sorted(ranked, key=lambda lvl: abs(lvl["price"] - last))
+
+    return {"support": strongest(support), "resistance": strongest(resistance)}
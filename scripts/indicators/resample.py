@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Aggregate daily OHLCV bars into weekly, monthly or N-trading-day bars.
+
+Group boundaries come from the dates actually traded, so holidays never create empty
+bars and a week or month is closed by its last trading session, not a calendar day.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+BARS_PER_YEAR = {"daily": 252, "weekly": 52, "monthly": 12}
+
+
+def _group_keys(dates: np.ndarray, timeframe: str) -> np.ndarray:
+    days = dates.astype("datetime64[D]")
+    if timeframe == "weekly":
+        # 1970-01-01 was a Thursday; shift so ISO weeks start on Monday.
+        return (days.astype(np.int64) + 3) // 7
+    if timeframe == "monthly":
+        return days.astype("datetime64[M]").astype(np.int64)
+    if timeframe == "daily":
+        return days.astype(np.int64)
+    raise ValueError(f"unknown timeframe: {timeframe}")
+
+
+def group_starts(dates: List[str], timeframe: str = "weekly", every: int = 0) -> np.ndarray:
+    """Index of the first bar of each output bar. ``every`` > 0 groups every N trading days instead."""
+    n = len(dates)
+    if n == 0:
+        return np.array([], dtype=int)
+    if every > 0:
+        return np.arange(0, n, every)
+    keys = _group_keys(np.array(dates, dtype="datetime64[D]"), timeframe)
+    return np.concatenate([[0], np.flatnonzero(np.diff(keys) != 0) + 1])
+
+
+def resample_arrays(
+    dates: List[str],
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    timeframe: str = "weekly",
+    every: int = 0,
+) -> Dict[str, Any]:
+    """Vectorized OHLCV aggregation; each output bar is dated by its last session."""
+    starts = group_starts(dates, timeframe, every)
+    if starts.size == 0:
+        return {"date": [], "open": np.array([]), "high": np.array([]), "low": np.array([]), "close": np.array([]), "volume": np.array([])}
+    ends = np.concatenate([starts[1:], [len(dates)]]) - 1
+    date_arr = np.asarray(dates)
+    return {
+        "date": date_arr[ends].tolist(),
+        "open": np.asarray(open_, dtype=float)[starts],
+        "high": np.maximum.reduceat(np.asarray(high, dtype=float), starts),
+        "low": np.minimum.reduceat(np.asarray(low, dtype=float), starts),
+        "close": np.asarray(close, dtype=float)[ends],
+        "volume": np.add.reduceat(np.asarray(volume, dtype=float), starts),
+    }
+
+
+def resample_points(points: List[Dict[str, Any]], timeframe: str = "weekly", every: int = 0) -> List[Dict[str, Any]]:
+    """Resample provider-shaped OHLCV points (as in ``OHLCVData.points``)."""
+    if not points:
+        return []
+    bars = resample_arrays(
+        [str(p["date"])[:10] for p in points],
+        np.array([p.get("open", p["close"]) for p in points], dtype=float),
+        np.array([p["high"] for p in points], dtype=float),
+        np.array([p["low"] for p in points], dtype=float),
+        np.array([p["close"] for p in points], dtype=float),
+        np.array([p.get("volume", 0) or 0 for p in points], dtype=float),
+        timeframe=timeframe,
+        every=every,
+    )
+    return [
+        {
+            "date": bars["date"][i],
+            "open": float(bars["open"][i]),
+            "high": float(bars["high"][i]),
+            "low": float(bars["low"][i]),
+            "close": float(bars["close"][i]),
+            "volume": int(bars["volume"][i]),
+        }
+        for i in range(len(bars["date"]))
+    ]
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Incremental per-symbol indicator state updated in O(1) per bar or tick.
+
+The state mirrors the full-history engine in ``scripts.indicators.engine``: feeding a
+history bar by bar yields the same latest values as ``compute_series``. Live quotes
+can be evaluated with ``preview`` without committing them to the state.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import math
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .engine import TRADING_DAYS
+from .extrema import MonotonicExtrema
+
+SMA_PERIODS = (5, 10, 20, 50, 200)
+EMA_PERIODS = (12, 26)
+RSI_PERIODS = (14, 6)
+VOL_PERIODS = (20, 60)
+MACD_SIGNAL = 9
+ATR_PERIOD = 14
+STOCH_PERIOD = 14
+STOCH_SMOOTH = 3
+BB_PERIOD = 20
+MOMENTUM_PERIOD = 10
+
+# Running sums accumulate rounding error; rebuild them from the buffers periodically.
+RESYNC_EVERY = 2048
+
+
+class RingBuffer:
+    """Fixed-size float buffer; ``ago(0)`` is the newest value."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.values = np.zeros(size)
+        self.pos = 0
+        self.count = 0
+
+    def push(self, value: float) -> None:
+        self.values[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def ago(self, k: int) -> float:
+        return float(self.values[(self.pos - 1 - k) % self.size])
+
+    def last(self, n: int) -> np.ndarray:
+        n = min(n, self.count)
+        idx = (self.pos - n + np.arange(n)) % self.size
+        return self.values[idx]
+
+    def copy(self) -> "RingBuffer":
+        clone = RingBuffer(self.size)
+        clone.values = self.values.copy()
+        clone.pos = self.pos
+        clone.count = self.count
+        return clone
+
+    def to_list(self) -> List[float]:
+        return [float(v) for v in self.last(self.count)]
+
+    @classmethod
+    def from_list(cls, size: int, values: List[float]) -> "RingBuffer":
+        buf = cls(size)
+        for v in values[-size:]:
+            buf.push(float(v))
+        return buf
+
+
+@dataclass
+class _Wilder:
+    period: int
+    seen: int = 0
+    seed_sum: float = 0.0
+    value: Optional[float] = None
+
+    def update(self, x: float) -> None:
+        self.seen += 1
+        if self.value is None:
+            self.seed_sum += x
+            if self.seen == self.period:
+                self.value = self.seed_sum / self.period
+        else:
+            self.value += (x - self.value) / self.period
+
+
+@dataclass
+class IndicatorState:
+    symbol: str
+    count: int = 0
+    last_date: str = ""
+    last_close: Optional[float] = None
+    anchor: Optional[float] = None
+    ema: Dict[int, float] = field(default_factory=dict)
+    macd_signal: Optional[float] = None
+    gains: Dict[int, _Wilder] = field(default_factory=lambda: {p: _Wilder(p) for p in RSI_PERIODS})
+    losses: Dict[int, _Wilder] = field(default_factory=lambda: {p: _Wilder(p) for p in RSI_PERIODS})
+    atr: _Wilder = field(default_factory=lambda: _Wilder(ATR_PERIOD))
+    sums: Dict[int, float] = field(default_factory=lambda: {p: 0.0 for p in SMA_PERIODS})
+    bb_sum_sq: float = 0.0
+    ret_sums: Dict[int, float] = field(default_factory=lambda: {p: 0.0 for p in VOL_PERIODS})
+    ret_sum_sqs: Dict[int, float] = field(default_factory=lambda: {p: 0.0 for p in VOL_PERIODS})
+    closes: RingBuffer = field(default_factory=lambda: RingBuffer(TRADING_DAYS))
+    highs: MonotonicExtrema = field(default_factory=lambda: MonotonicExtrema(STOCH_PERIOD))
+    lows: MonotonicExtrema = field(default_factory=lambda: MonotonicExtrema(STOCH_PERIOD))
+    range_52w: MonotonicExtrema = field(default_factory=lambda: MonotonicExtrema(TRADING_DAYS))
+    range_20: MonotonicExtrema = field(default_factory=lambda: MonotonicExtrema(20))
+    volumes: RingBuffer = field(default_factory=lambda: RingBuffer(20))
+    returns: RingBuffer = field(default_factory=lambda: RingBuffer(max(VOL_PERIODS)))
+    stoch_k: RingBuffer = field(default_factory=lambda: RingBuffer(STOCH_SMOOTH))
+    volume_sum: float = 0.0
+    stoch_k_sum: float = 0.0
+
+    @classmethod
+    def from_points(cls, symbol: str, points: Iterable[Dict[str, Any]]) -> "IndicatorState":
+        state = cls(symbol=symbol)
+        for p in points:
+            state.update(p)
+        return state
+
+    def update(self, bar: Dict[str, Any]) -> None:
+        """Commit a completed bar. Bars dated at or before ``last_date`` are ignored."""
+        date = str(bar.get("date", "") or "")
+        if date and self.last_date and date <= self.last_date:
+            return
+        close = float(bar["close"])
+        high = float(bar.get("high", close) or close)
+        low = float(bar.get("low", close) or close)
+        volume = float(bar.get("volume", 0) or 0)
+
+        if self.anchor is None:
+            self.anchor = close
+        shifted = close - self.anchor
+
+        for p in SMA_PERIODS:
+            out = self.closes.ago(p - 1) - self.anchor if self.closes.count >= p else 0.0
+            self.sums[p] += shifted - out
+        out_bb = self.closes.ago(BB_PERIOD - 1) - self.anchor if self.closes.count >= BB_PERIOD else 0.0
+        self.bb_sum_sq += shifted * shifted - out_bb * out_bb
+
+        if self.volumes.count >= self.volumes.size:
+            self.volume_sum -= self.volumes.ago(self.volumes.size - 1)
+        self.volume_sum += volume
+        self.volumes.push(volume)
+
+        if self.last_close is not None:
+            delta = close - self.last_close
+            for p in RSI_PERIODS:
+                self.gains[p].update(max(delta, 0.0))
+                self.losses[p].update(max(-delta, 0.0))
+            self.atr.update(max(high - low, abs(high - self.last_close), abs(low - self.last_close)))
+
+            ret = delta / self.last_close
+            for p in VOL_PERIODS:
+                window = p - 1
+                if self.returns.count >= window:
+                    old = self.returns.ago(window - 1)
+                    self.ret_sums[p] -= old
+                    self.ret_sum_sqs[p] -= old * old
+                self.ret_sums[p] += ret
+                self.ret_sum_sqs[p] += ret * ret
+            self.returns.push(ret)
+
+        for p in EMA_PERIODS:
+            prev = self.ema.get(p)
+            alpha = 2.0 / (p + 1)
+            self.ema[p] = close if prev is None else prev + alpha * (close - prev)
+        line = self.ema[12] - self.ema[26]
+        alpha = 2.0 / (MACD_SIGNAL + 1)
+        self.macd_signal = line if self.macd_signal is None else self.macd_signal + alpha * (line - self.macd_signal)
+
+        self.closes.push(close)
+        self.highs.push(high)
+        self.lows.push(low)
+        self.range_52w.push(close)
+        self.range_20.push(close)
+
+        hh, ll = self.highs.max, self.lows.min
+        k = 100 * (close - ll) / (hh - ll) if hh != ll else 50.0
+        if self.stoch_k.count >= STOCH_SMOOTH:
+            self.stoch_k_sum -= self.stoch_k.ago(STOCH_SMOOTH - 1)
+        self.stoch_k_sum += k
+        self.stoch_k.push(k)
+
+        self.last_close = close
+        self.last_date = date
+        self.count += 1
+        if self.count % RESYNC_EVERY == 0:
+            self._resync()
+
+    def preview(self, bar: Dict[str, Any]) -> Dict[str, Any]:
+        """Indicators as if ``bar`` (e.g. the in-progress session built from live ticks) closed now."""
+        clone = self.copy()
+        clone.last_date = ""
+        clone.update(bar)
+        return clone.indicators()
+
+    def _resync(self) -> None:
+        closes = self.closes.last(TRADING_DAYS) - self.anchor
+        for p in SMA_PERIODS:
+            self.sums[p] = float(np.sum(closes[-p:]))
+        self.bb_sum_sq = float(np.sum(closes[-BB_PERIOD:] ** 2))
+        self.volume_sum = float(np.sum(self.volumes.last(self.volumes.size)))
+        self.stoch_k_sum = float(np.sum(self.stoch_k.last(STOCH_SMOOTH)))
+        for p in VOL_PERIODS:
+            window = self.returns.last(p - 1)
+            self.ret_sums[p] = float(np.sum(window))
+            self.ret_sum_sqs[p] = float(np.sum(window * window))
+
+    def indicators(self) -> Dict[str, Any]:
+        """Latest indicator values in the same shape as ``engine.latest_values``."""
+        if self.count == 0:
+            return {}
+        close = float(self.last_close)
+
+        def sma(p: int) -> float:
+            return self.sums[p] / min(self.count, p) + self.anchor
+
+        def rsi(p: int) -> float:
+            gain, loss = self.gains[p].value, self.losses[p].value
+            if gain is None or loss is None:
+                return 50.0
+            if loss == 0:
+                return 100.0
+            return 100.0 - 100.0 / (1.0 + gain / loss)
+
+        def vol(p: int) -> float:
+            window = p - 1
+            if self.count < p:
+                return 0.0
+            mean = self.ret_sums[p] / window
+            var = max(self.ret_sum_sqs[p] / window - mean * mean, 0.0)
+            return math.sqrt(var) * math.sqrt(TRADING_DAYS) * 100
+
+        n_bb = min(self.count, BB_PERIOD)
+        bb_mean = self.sums[BB_PERIOD] / n_bb
+        bb_std = math.sqrt(max(self.bb_sum_sq / n_bb - bb_mean * bb_mean, 0.0))
+        bb_mid = bb_mean + self.anchor
+        bb_up = bb_mid + 2 * bb_std
+        bb_low = bb_mid - 2 * bb_std
+
+        macd_line = self.ema[12] - self.ema[26]
+        hh, ll = self.highs.max, self.lows.min
+        w52_high, w52_low = self.range_52w.max, self.range_52w.min
+        avg_volume = self.volume_sum / min(self.count, self.volumes.size)
+        momentum_base = self.closes.ago(MOMENTUM_PERIOD - 1) if self.count >= MOMENTUM_PERIOD else None
+
+        return {
+            **{f"ma_{p}": sma(p) for p in SMA_PERIODS},
+            **{f"ema_{p}": float(self.ema[p]) for p in EMA_PERIODS},
+            "rsi_14": rsi(14),
+            "rsi_6": rsi(6),
+            "macd": macd_line,
+            "macd_signal": float(self.macd_signal),
+            "macd_histogram": macd_line - float(self.macd_signal),
+            "bb_upper": bb_up,
+            "bb_middle": bb_mid,
+            "bb_lower": bb_low,
+            "bb_width": (bb_up - bb_low) / bb_mid * 100 if bb_mid else 0.0,
+            "atr": float(self.atr.value) if self.atr.value is not None else 0.0,
+            "volatility": vol(20),
+            "historical_vol_20": vol(20),
+            "historical_vol_60": vol(60),
+            "momentum_10": (close - momentum_base) / momentum_base * 100 if momentum_base else 0.0,
+            "stoch_k": self.stoch_k.ago(0),
+            "stoch_d": self.stoch_k_sum / self.stoch_k.count,
+            "williams_r": -100 * (hh - close) / (hh - ll) if hh != ll else -50.0,
+            "52w_high": w52_high,
+            "52w_low": w52_low,
+            "52w_position": (close - w52_low) / (w52_high - w52_low) * 100 if w52_high != w52_low else 50.0,
+            "avg_volume_20": avg_volume,
+            "volume_ratio": self.volumes.ago(0) / avg_volume if avg_volume else 1.0,
+            "support_levels": [self.range_20.min],
+            "resistance_levels": [self.range_20.max],
+        }
+
+    def copy(self) -> "IndicatorState":
+        clone = copy.copy(self)
+        clone.ema = dict(self.ema)
+        clone.gains = {p: replace(w) for p, w in self.gains.items()}
+        clone.losses = {p: replace(w) for p, w in self.losses.items()}
+        clone.atr = replace(self.atr)
+        clone.sums = dict(self.sums)
+        clone.ret_sums = dict(self.ret_sums)
+        clone.ret_sum_sqs = dict(self.ret_sum_sqs)
+        for name in ("closes", "highs", "lows", "range_52w", "range_20", "volumes", "returns", "stoch_k"):
+            setattr(clone, name, getattr(self, name).copy())
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        def wilder(w: _Wilder) -> Dict[str, Any]:
+            return {"seen": w.seen, "seed_sum": w.seed_sum, "value": w.value}
+
+        return {
+            "symbol": self.symbol,
+            "count": self.count,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "anchor": self.anchor,
+            "ema": {str(p): v for p, v in self.ema.items()},
+            "macd_signal": self.macd_signal,
+            "gains": {str(p): wilder(w) for p, w in self.gains.items()},
+            "losses": {str(p): wilder(w) for p, w in self.losses.items()},
+            "atr": wilder(self.atr),
+            "closes": self.closes.to_list(),
+            "highs": self.highs.to_dict(),
+            "lows": self.lows.to_dict(),
+            "range_52w": self.range_52w.to_dict(),
+            "range_20": self.range_20.to_dict(),
+            "volumes": self.volumes.to_list(),
+            "returns": self.returns.to_list(),
+            "stoch_k": self.stoch_k.to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "IndicatorState":
+        def wilder(period: int, w: Dict[str, Any]) -> _Wilder:
+            return _Wilder(period, seen=int(w["seen"]), seed_sum=float(w["seed_sum"]), value=w["value"])
+
+        state = cls(symbol=raw["symbol"])
+        state.count = int(raw["count"])
+        state.last_date = raw.get("last_date", "")
+        state.last_close = raw.get("last_close")
+        state.anchor = raw.get("anchor")
+        state.ema = {int(p): float(v) for p, v in raw.get("ema", {}).items()}
+        state.macd_signal = raw.get("macd_signal")
+        state.gains = {int(p): wilder(int(p), w) for p, w in raw["gains"].items()}
+        state.losses = {int(p): wilder(int(p), w) for p, w in raw["losses"].items()}
+        state.atr = wilder(ATR_PERIOD, raw["atr"])
+        state.closes = RingBuffer.from_list(TRADING_DAYS, raw["closes"])
+        state.highs = MonotonicExtrema.from_dict(raw["highs"])
+        state.lows = MonotonicExtrema.from_dict(raw["lows"])
+        state.range_52w = MonotonicExtrema.from_dict(raw["range_52w"])
+        state.range_20 = MonotonicExtrema.from_dict(raw["range_20"])
+        state.volumes = RingBuffer.from_list(20, raw["volumes"])
+        state.returns = RingBuffer.from_list(max(VOL_PERIODS), raw["returns"])
+        state.stoch_k = RingBuffer.from_list(STOCH_SMOOTH, raw["stoch_k"])
+        # Sums are derived data; rebuild them instead of persisting accumulated rounding error.
+        if state.anchor is not None:
+            state._resync()
+        return state
+
+
+def load_states(path: Path) -> Dict[str, IndicatorState]:
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    states: Dict[str, IndicatorState] = {}
+    for company, payload in raw.get("states", {}).items():
+        try:
+            states[company] = IndicatorState.from_dict(payload)
+        except (KeyError, TypeError, ValueError):
+            # Older layouts are rebuilt from history on the next successful fetch.
+            continue
+    return states
+
+
+def states_payload(states: Dict[str, IndicatorState]) -> Dict[str, Any]:
+    return {"schema_version": "v2", "states": {company: s.to_dict() for company, s in states.items()}}
@@ -4,14 +4,16 @@ Inject comprehensive metrics into HTML files
 """
 
 import sys
-import re
-from enhance_analysis import get_key_metrics_section, get_bull_bear_cases, get_catalysts_section
+from pathlib import Path
 
-def inject_enhancements_to_html(html_file, lang='en'):
-    """Inject all enhancement sections into HTML file"""
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+from scripts.enhance_analysis import get_key_metrics_section, get_bull_bear_cases, get_catalysts_section
+
+def inject_enhancements_text(content, lang='en', verbose=False):
+    """Insert metrics, bull/bear and catalyst sections after each rating box not already followed by them"""
 
     # For each company section, inject after the investment rating box
     for company in ['alibaba', 'xiaomi', 'meituan']:
@@ -31,13 +33,26 @@ def inject_enhancements_to_html(html_file, lang='en'):
 
             # Combine all enhancements
             enhancements = f'\n\n                        {metrics_html}\n\n                        {bull_bear_html}\n\n                        {catalysts_html}\n'
+            if marker + enhancements in content:
+                continue
 
             # Insert after the investment rating box
             content = content.replace(marker, marker + enhancements)
-            print(f"✅ Injected enhancements for {company.title()}")
-        else:
+            if verbose:
+                print(f"✅ Injected enhancements for {company.title()}")
+        elif verbose:
             print(f"⚠️  Warning: Could not find insertion point for {company}")
 
+    return content
+
+def inject_enhancements_to_html(html_file, lang='en'):
+    """Inject all enhancement sections into HTML file"""
+
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    content = inject_enhancements_text(content, lang, verbose=True)
+
     # Write back
     with open(html_file, 'w', encoding='utf-8') as f:
         f.write(content)
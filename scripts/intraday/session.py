@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Streaming intraday session statistics (VWAP, volume, range, opening range) per symbol.
+
+State lives in fixed-size NumPy arrays indexed by symbol, so one update call applies a
+whole poll (one minute bar per symbol) with a handful of vectorized operations. Bars
+are keyed by their minute timestamp: a revised in-progress bar replaces its previous
+contribution instead of being counted twice.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.config import load_config
+from scripts.storage.jsonio import atomic_write_text, dumps
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 1440
+# HKEX continuous trading opens at 09:30 HKT; bar timestamps are HKT wall-clock.
+SESSION_OPEN_MINUTE = 9 * 60 + 30
+OUTPUT_PATH = ROOT / "data" / "intraday_session.json"
+
+
+def to_minutes(stamps: List[str]) -> np.ndarray:
+    """``YYYY-MM-DD HH:MM[:SS]`` wall-clock strings to integer minutes since the epoch."""
+    return np.array([s.replace(" ", "T")[:16] for s in stamps], dtype="datetime64[m]").astype(np.int64)
+
+
+class SessionAggregator:
+    def __init__(self, symbols: List[str], opening_range_minutes: int = 30) -> None:
+        self.symbols = list(symbols)
+        self.index = {s: i for i, s in enumerate(self.symbols)}
+        self.opening_range_end = SESSION_OPEN_MINUTE + opening_range_minutes
+        n = len(self.symbols)
+        self.session_day = np.full(n, -1, dtype=np.int64)
+        self.last_ts = np.full(n, -1, dtype=np.int64)
+        self.bars = np.zeros(n, dtype=np.int64)
+        self.open = np.full(n, np.nan)
+        self.high = np.full(n, -np.inf)
+        self.low = np.full(n, np.inf)
+        self.last = np.full(n, np.nan)
+        self.cum_pv = np.zeros(n)
+        self.cum_volume = np.zeros(n)
+        self.bar_pv = np.zeros(n)
+        self.bar_volume = np.zeros(n)
+        self.or_high = np.full(n, -np.inf)
+        self.or_low = np.full(n, np.inf)
+
+    def _reset(self, idx: np.ndarray, day: np.ndarray, first_open: np.ndarray) -> None:
+        self.session_day[idx] = day
+        self.last_ts[idx] = -1
+        self.bars[idx] = 0
+        self.open[idx] = first_open
+        self.high[idx] = -np.inf
+        self.low[idx] = np.inf
+        self.cum_pv[idx] = 0.0
+        self.cum_volume[idx] = 0.0
+        self.bar_pv[idx] = 0.0
+        self.bar_volume[idx] = 0.0
+        self.or_high[idx] = -np.inf
+        self.or_low[idx] = np.inf
+
+    def _apply(self, idx, ts, o, h, lo, c, v) -> None:
+        """Apply bars for distinct symbols."""
+        day = ts // MINUTES_PER_DAY
+        new_day = day > self.session_day[idx]
+        if new_day.any():
+            self._reset(idx[new_day], day[new_day], o[new_day])
+
+        keep = (day == self.session_day[idx]) & (ts >= self.last_ts[idx])
+        if not keep.all():
+            idx, ts, o, h, lo, c, v = (a[keep] for a in (idx, ts, o, h, lo, c, v))
+        if idx.size == 0:
+            return
+
+        revised = ts == self.last_ts[idx]
+        pv = (h + lo + c) / 3.0 * v
+        self.cum_pv[idx] += pv - np.where(revised, self.bar_pv[idx], 0.0)
+        self.cum_volume[idx] += v - np.where(revised, self.bar_volume[idx], 0.0)
+        self.bar_pv[idx] = pv
+        self.bar_volume[idx] = v
+        self.bars[idx] += ~revised
+        self.high[idx] = np.maximum(self.high[idx], h)
+        self.low[idx] = np.minimum(self.low[idx], lo)
+        self.last[idx] = c
+        self.last_ts[idx] = ts
+
+        in_range = (ts % MINUTES_PER_DAY) < self.opening_range_end
+        self.or_high[idx] = np.where(in_range, np.maximum(self.or_high[idx], h), self.or_high[idx])
+        self.or_low[idx] = np.where(in_range, np.minimum(self.or_low[idx], lo), self.or_low[idx])
+
+    def update(self, idx, ts, open_, high, low, close, volume) -> None:
+        """Apply any number of bars; bars for the same symbol are applied in timestamp order."""
+        idx = np.asarray(idx, dtype=np.int64)
+        ts = np.asarray(ts, dtype=np.int64)
+        if idx.size == 0:
+            return
+        arrays = [np.asarray(a, dtype=float) for a in (open_, high, low, close, volume)]
+        order = np.lexsort((ts, idx))
+        idx, ts = idx[order], ts[order]
+        arrays = [a[order] for a in arrays]
+
+        # Rank of each bar within its symbol; every round touches each symbol at most once.
+        group_start = np.concatenate([[0], np.flatnonzero(np.diff(idx)) + 1])
+        starts = np.repeat(group_start, np.diff(np.concatenate([group_start, [idx.size]])))
+        rank = np.arange(idx.size) - starts
+        if rank.max() == 0:
+            self._apply(idx, ts, *arrays)
+            return
+        for r in range(int(rank.max()) + 1):
+            sel = rank == r
+            self._apply(idx[sel], ts[sel], *(a[sel] for a in arrays))
+
+    def update_points(self, points_by_symbol: Dict[str, List[Dict[str, Any]]]) -> None:
+        idx: List[int] = []
+        stamps: List[str] = []
+        cols: Dict[str, List[float]] = {k: [] for k in ("open", "high", "low", "close", "volume")}
+        for symbol, points in points_by_symbol.items():
+            if symbol not in self.index:
+                continue
+            for p in points:
+                idx.append(self.index[symbol])
+                stamps.append(str(p["date"]))
+                for k in ("open", "high", "low", "close"):
+                    cols[k].append(float(p.get(k, p["close"])))
+                cols["volume"].append(float(p.get("volume", 0) or 0))
+        if idx:
+            self.update(idx, to_minutes(stamps), cols["open"], cols["high"], cols["low"], cols["close"], cols["volume"])
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(self.cum_volume > 0, self.cum_pv / self.cum_volume, np.nan)
+        out: Dict[str, Dict[str, Any]] = {}
+        for i, symbol in enumerate(self.symbols):
+            if self.bars[i] == 0:
+                continue
+            or_set = np.isfinite(self.or_high[i])
+            breakout = None
+            if or_set and self.last[i] > self.or_high[i]:
+                breakout = "up"
+            elif or_set and self.last[i] < self.or_low[i]:
+                breakout = "down"
+            out[symbol] = {
+                "session_date": str(np.datetime64(int(self.session_day[i]), "D")),
+                "last_bar": str(np.datetime64(int(self.last_ts[i]), "m")).replace("T", " "),
+                "bars": int(self.bars[i]),
+                "open": float(self.open[i]),
+                "high": float(self.high[i]),
+                "low": float(self.low[i]),
+                "last": float(self.last[i]),
+                "vwap": float(vwap[i]) if np.isfinite(vwap[i]) else None,
+                "vwap_deviation_pct": float((self.last[i] / vwap[i] - 1) * 100) if np.isfinite(vwap[i]) and vwap[i] else None,
+                "cum_volume": float(self.cum_volume[i]),
+                "opening_range_high": float(self.or_high[i]) if or_set else None,
+                "opening_range_low": float(self.or_low[i]) if or_set else None,
+                "opening_range_breakout": breakout,
+            }
+        return out
+
+
+def load_replay(path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """Recorded minute bars as ``{"symbols": {symbol: [points]}}`` or a bare ``{symbol: [points]}``."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return raw.get("symbols", raw)
+
+
+def write_snapshot(aggregator: SessionAggregator, path: Path = OUTPUT_PATH) -> None:
+    payload = {"generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "symbols": aggregator.snapshot()}
+    atomic_write_text(path, dumps(payload))
+
+
+def run_live(symbols: List[str], polls: int = 0) -> int:
+    """Poll every symbol each ``poll_seconds``; fetches run on ``intraday.workers`` threads.
+
+    One poll takes roughly ``len(symbols) / workers`` request latencies, so the 1s cadence
+    holds for hundreds of symbols only with enough workers and a provider that is not
+    rate-limited (AllTick's throttle serializes its requests); overrunning polls are logged.
+    """
+    from scripts.providers.registry import ProviderRegistry
+
+    registry = ProviderRegistry()
+    cfg = registry.config.get("intraday", {})
+    interval = int(cfg.get("interval_minutes", 1))
+    poll_seconds = float(cfg.get("poll_seconds", 1.0))
+    workers = max(1, min(int(cfg.get("workers", 16)), len(symbols) or 1))
+    aggregator = SessionAggregator(symbols, int(cfg.get("opening_range_minutes", 30)))
+
+    def fetch(symbol: str, limit: int) -> List[Dict[str, Any]]:
+        try:
+            payload = registry.get_intraday(symbol, interval_minutes=interval, limit=limit)
+        except Exception as exc:
+            logger.warning("Intraday fetch failed for %s: %s", symbol, exc)
+            return []
+        return payload.data.points if payload else []
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while not polls or count < polls:
+            started = time.monotonic()
+            # Only the latest two bars are needed: the just-closed bar and the in-progress one.
+            limit = 2 if count else 240
+            batch = {s: points for s, points in zip(symbols, pool.map(lambda s: fetch(s, limit), symbols)) if points}
+            aggregator.update_points(batch)
+            write_snapshot(aggregator)
+            count += 1
+            elapsed = time.monotonic() - started
+            if elapsed > poll_seconds:
+                logger.warning("Poll of %s symbols took %.2fs (poll_seconds=%s, workers=%s)", len(symbols), elapsed, poll_seconds, workers)
+            time.sleep(max(0.0, poll_seconds - elapsed))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aggregate intraday minute bars into session statistics")
+    parser.add_argument("symbols", nargs="*", help="Symbols such as 0700.HK (default: all configured companies)")
+    parser.add_argument("--replay", type=Path, help="Replay recorded minute bars instead of polling providers")
+    parser.add_argument("--polls", type=int, default=0, help="Stop after N live polls (0 = run until interrupted)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    symbols = list(args.symbols)
+    if args.replay:
+        bars = load_replay(args.replay)
+        aggregator = SessionAggregator(symbols or list(bars), int(load_config().get("intraday", {}).get("opening_range_minutes", 30)))
+        started = time.perf_counter()
+        aggregator.update_points(bars)
+        logger.info("Replayed %s bars in %.3fs", sum(len(v) for v in bars.values()), time.perf_counter() - started)
+        write_snapshot(aggregator)
+        return 0
+
+    if not symbols:
+        from scripts.akshare_stock_updater import STOCK_CONFIG
+
+        symbols = [cfg["symbol"] for cfg in STOCK_CONFIG.values()]
+    return run_live(symbols, polls=args.polls)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -97,6 +97,36 @@ class AkshareProvider(DataProvider):
         except Exception:
             return None, None
 
+    def fetch_intraday(self, symbol: str, interval_minutes: int = 1, limit: int = 240) -> tuple[Optional[OHLCVData], Optional[ProviderMeta]]:
+        try:
+            self._ensure()
+            hk_code = self._to_hk_code(symbol)
+            min_df = self._ak.stock_hk_hist_min_em(symbol=hk_code, period=str(interval_minutes), adjust="")
+            if min_df is None or min_df.empty:
+                return None, None
+
+            points: List[Dict[str, Any]] = []
+            for _, row in min_df.tail(limit).iterrows():
+                close = float(row.get("收盘", 0.0) or 0.0)
+                if close <= 0:
+                    continue
+                points.append(
+                    {
+                        "date": str(row.get("时间", "")),
+                        "open": float(row.get("开盘", close) or close),
+                        "high": float(row.get("最高", close) or close),
+                        "low": float(row.get("最低", close) or close),
+                        "close": close,
+                        "volume": int(row.get("成交量", 0) or 0),
+                        "turnover": float(row.get("成交额", 0.0) or 0.0),
+                    }
+                )
+            if not points:
+                return None, None
+            return OHLCVData(symbol=f"{int(hk_code)}.HK", points=points), ProviderMeta(provider=self.name, confidence=0.9)
+        except Exception:
+            return None, None
+
 
 def _period_to_points(period: str) -> int:
     p = (period or "").lower()
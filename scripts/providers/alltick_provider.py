@@ -8,6 +8,7 @@ import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
 
 import requests
 
@@ -15,6 +16,12 @@ from .base import DataProvider
 from .types import OHLCVData, ProviderMeta, QuoteData
 
 
+HKT = ZoneInfo("Asia/Hong_Kong")
+
+# AllTick kline_type codes for minute bars.
+INTRADAY_KLINE_TYPES = {1: "1", 5: "2", 15: "3", 30: "4", 60: "5"}
+
+
 class AllTickProvider(DataProvider):
     name = "alltick"
     _lock = threading.Lock()
@@ -46,13 +53,13 @@ class AllTickProvider(DataProvider):
                 time.sleep(wait)
             self._last_request_at = time.monotonic()
 
-    def _fetch_kline(self, symbol: str, query_num: int) -> Optional[List[Dict[str, Any]]]:
+    def _fetch_kline(self, symbol: str, query_num: int, kline_type: str = "8") -> Optional[List[Dict[str, Any]]]:
         code = self._to_alltick_symbol(symbol)
         query = {
             "trace": "stock-master",
             "data": {
                 "code": code,
-                "kline_type": "8",  # day kline
+                "kline_type": kline_type,  # 8 = day kline, see INTRADAY_KLINE_TYPES
                 "kline_timestamp_end": "0",
                 "query_kline_num": str(query_num),
                 "adjust_type": "0",
@@ -110,6 +117,34 @@ class AllTickProvider(DataProvider):
         )
         return quote, ProviderMeta(provider=self.name, confidence=0.8)
 
+    def fetch_intraday(self, symbol: str, interval_minutes: int = 1, limit: int = 240) -> tuple[Optional[OHLCVData], Optional[ProviderMeta]]:
+        kline_type = INTRADAY_KLINE_TYPES.get(interval_minutes)
+        if not self.api_key or not kline_type:
+            return None, None
+        rows = self._fetch_kline(symbol, query_num=limit, kline_type=kline_type)
+        if not rows:
+            return None, None
+
+        points: List[Dict[str, Any]] = []
+        for row in rows:
+            close = _f(row.get("close_price"))
+            ts = int(_f(row.get("timestamp"), 0.0))
+            if close is None or ts <= 0:
+                continue
+            points.append(
+                {
+                    "date": datetime.fromtimestamp(ts, HKT).strftime("%Y-%m-%d %H:%M:%S"),
+                    "open": _f(row.get("open_price"), close),
+                    "high": _f(row.get("high_price"), close),
+                    "low": _f(row.get("low_price"), close),
+                    "close": close,
+                    "volume": int(_f(row.get("volume"), 0.0)),
+                }
+            )
+        if not points:
+            return None, None
+        return OHLCVData(symbol=symbol, points=points), ProviderMeta(provider=self.name, confidence=0.8)
+
     def fetch_ohlcv(self, symbol: str, period: str = "3mo") -> tuple[Optional[OHLCVData], Optional[ProviderMeta]]:
         if not self.api_key:
             return None, None
@@ -20,6 +20,9 @@ class DataProvider:
     def fetch_ohlcv(self, symbol: str, period: str = "1y") -> tuple[Optional[OHLCVData], Optional[ProviderMeta]]:
         return None, None
 
+    def fetch_intraday(self, symbol: str, interval_minutes: int = 1, limit: int = 240) -> tuple[Optional[OHLCVData], Optional[ProviderMeta]]:
+        return None, None
+
     def fetch_fundamentals(self, symbol: str) -> tuple[Optional[FundamentalsData], Optional[ProviderMeta]]:
         return None, None
 
@@ -64,6 +64,16 @@ class ProviderRegistry:
                 return ProviderPayload(o, meta)
         return None
 
+    def get_intraday(self, symbol: str, interval_minutes: int = 1, limit: int = 240) -> Optional[ProviderPayload]:
+        for name in self.config["providers"].get("intraday", []):
+            provider = self.providers.get(name)
+            if not provider or not provider.is_available():
+                continue
+            o, meta = provider.fetch_intraday(symbol, interval_minutes=interval_minutes, limit=limit)
+            if o and meta and o.points:
+                return ProviderPayload(o, meta)
+        return None
+
     def get_fundamentals(self, symbol: str) -> Optional[ProviderPayload]:
         for name in self.config["providers"]["fundamentals"]:
             provider = self.providers.get(name)
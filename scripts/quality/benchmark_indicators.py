@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""Verify indicator implementations against a loop-based reference and benchmark throughput."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.config import load_config
+from scripts.indicators.batch import compute_batch
+from scripts.indicators.engine import _WARMUP_DEFAULTS, compute_series
+from scripts.indicators.streaming import IndicatorState
+
+SYMBOL_COUNTS = (1, 100, 1000)
+
+
+def reference_series(close: List[float], high: List[float], low: List[float], volume: List[float]) -> Dict[str, List[float]]:
+    """Every published indicator at every bar, from textbook per-bar loops; deliberately slow and obvious.
+
+    Bars before an indicator has enough history are NaN, as in ``engine.compute_series``.
+    """
+    n = len(close)
+    nan = math.nan
+
+    def trailing(values: List[float], i: int, period: int) -> List[float]:
+        return values[max(0, i - period + 1):i + 1]
+
+    def mean(values: List[float]) -> float:
+        return sum(values) / len(values)
+
+    def pstdev(values: List[float]) -> float:
+        m = mean(values)
+        return math.sqrt(sum((v - m) ** 2 for v in values) / len(values))
+
+    def ema_path(values: List[float], period: int) -> List[float]:
+        alpha = 2 / (period + 1)
+        out = [values[0]]
+        for v in values[1:]:
+            out.append(alpha * v + (1 - alpha) * out[-1])
+        return out
+
+    def wilder_path(values: List[float], period: int) -> List[float]:
+        out = [nan] * len(values)
+        if len(values) < period:
+            return out
+        avg = sum(values[:period]) / period
+        out[period - 1] = avg
+        for j in range(period, len(values)):
+            avg = (avg * (period - 1) + values[j]) / period
+            out[j] = avg
+        return out
+
+    def rsi(period: int) -> List[float]:
+        out = [nan] * n
+        deltas = [close[i] - close[i - 1] for i in range(1, n)]
+        gains = wilder_path([max(d, 0.0) for d in deltas], period)
+        losses = wilder_path([max(-d, 0.0) for d in deltas], period)
+        for j, (gain, loss) in enumerate(zip(gains, losses)):
+            if not math.isnan(gain):
+                out[j + 1] = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+        return out
+
+    def vol(period: int) -> List[float]:
+        out = [nan] * n
+        for i in range(period - 1, n):
+            window = close[i - period + 1:i + 1]
+            rets = [(window[k] - window[k - 1]) / window[k - 1] for k in range(1, period)]
+            out[i] = pstdev(rets) * math.sqrt(252) * 100
+        return out
+
+    def ratio(num: float, den: float, scale: float, fallback: float) -> float:
+        return num / den * scale if den else fallback
+
+    ema_12 = ema_path(close, 12)
+    ema_26 = ema_path(close, 26)
+    macd_path = [a - b for a, b in zip(ema_12, ema_26)]
+    signal = ema_path(macd_path, 9)
+
+    trs = [max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])) for i in range(1, n)]
+    atr = [nan] + (wilder_path(trs, 14) if len(trs) >= 14 else [nan] * len(trs))
+
+    out: Dict[str, List[float]] = {f"ma_{p}": [mean(trailing(close, i, p)) for i in range(n)] for p in (5, 10, 20, 50, 200)}
+    out.update({"ema_12": ema_12, "ema_26": ema_26, "rsi_14": rsi(14), "rsi_6": rsi(6)})
+    out.update({"macd": macd_path, "macd_signal": signal, "macd_histogram": [m - s for m, s in zip(macd_path, signal)]})
+
+    bb_std = [pstdev(trailing(close, i, 20)) for i in range(n)]
+    out["bb_middle"] = out["ma_20"]
+    out["bb_upper"] = [m + 2 * sd for m, sd in zip(out["bb_middle"], bb_std)]
+    out["bb_lower"] = [m - 2 * sd for m, sd in zip(out["bb_middle"], bb_std)]
+    out["bb_width"] = [ratio(u - lo, m, 100, 0.0) for u, lo, m in zip(out["bb_upper"], out["bb_lower"], out["bb_middle"])]
+
+    out["atr"] = atr
+    out["volatility"] = vol(20)
+    out["historical_vol_20"] = out["volatility"]
+    out["historical_vol_60"] = vol(60)
+    out["momentum_10"] = [ratio(close[i] - close[i - 9], close[i - 9], 100, nan) if i >= 9 else nan for i in range(n)]
+
+    hh = [max(trailing(high, i, 14)) for i in range(n)]
+    ll = [min(trailing(low, i, 14)) for i in range(n)]
+    out["stoch_k"] = [ratio(close[i] - ll[i], hh[i] - ll[i], 100, 50.0) for i in range(n)]
+    out["stoch_d"] = [mean(trailing(out["stoch_k"], i, 3)) for i in range(n)]
+    out["williams_r"] = [ratio(hh[i] - close[i], hh[i] - ll[i], -100, -50.0) for i in range(n)]
+
+    out["52w_high"] = [max(trailing(close, i, 252)) for i in range(n)]
+    out["52w_low"] = [min(trailing(close, i, 252)) for i in range(n)]
+    out["52w_position"] = [
+        ratio(close[i] - lo, hi - lo, 100, 50.0) for i, (hi, lo) in enumerate(zip(out["52w_high"], out["52w_low"]))
+    ]
+    out["avg_volume_20"] = [mean(trailing(volume, i, 20)) for i in range(n)]
+    out["volume_ratio"] = [ratio(volume[i], avg, 1, 1.0) for i, avg in enumerate(out["avg_volume_20"])]
+    return out
+
+
+def reference_indicators(close: List[float], high: List[float], low: List[float], volume: List[float]) -> Dict[str, float]:
+    """Latest reference values with warm-up defaults, in the shape of ``engine.latest_values``."""
+    return {key: _published(key, values[-1]) for key, values in reference_series(close, high, low, volume).items()}
+
+
+def _published(key: str, value: float) -> float:
+    return _WARMUP_DEFAULTS.get(key, 0.0) if math.isnan(value) else value
+
+
+def synthetic_cases(seed: int = 7) -> Dict[str, Dict[str, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+
+    def ohlcv(close: np.ndarray) -> Dict[str, np.ndarray]:
+        spread = rng.uniform(0.0, 0.02, close.size)
+        return {
+            "close": close,
+            "high": close * (1 + spread),
+            "low": close * (1 - spread),
+            "volume": rng.integers(1_000, 1_000_000, close.size).astype(float),
+        }
+
+    return {
+        "random_walk_10y": ohlcv(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 2520)))),
+        "short_history": ohlcv(50 + np.cumsum(rng.normal(0, 1, 12))),
+        "flat": ohlcv(np.full(300, 25.0)),
+        "steady_uptrend": ohlcv(np.linspace(10, 60, 400)),
+        "gap_crash": ohlcv(np.concatenate([np.full(150, 400.0), np.full(150, 120.0)]) * (1 + rng.normal(0, 0.005, 300))),
+    }
+
+
+def recorded_cases(directory: Path) -> Tuple[Dict[str, Dict[str, np.ndarray]], List[str]]:
+    """Load ``{"points": [...]}`` OHLCV recordings (e.g. exported provider history), plus a note per unreadable file."""
+    cases: Dict[str, Dict[str, np.ndarray]] = {}
+    problems: List[str] = []
+    paths = sorted(directory.glob("*.json")) if directory.is_dir() else []
+    if not paths:
+        problems.append(f"no recorded series in {directory}")
+    for path in paths:
+        try:
+            points = json.loads(path.read_text(encoding="utf-8"))["points"]
+        except Exception as exc:
+            problems.append(f"recording {path.name} skipped ({exc})")
+            continue
+        cases[f"recorded:{path.stem}"] = {
+            "close": np.array([p["close"] for p in points], dtype=float),
+            "high": np.array([p["high"] for p in points], dtype=float),
+            "low": np.array([p["low"] for p in points], dtype=float),
+            "volume": np.array([p.get("volume", 0) for p in points], dtype=float),
+        }
+    return cases, problems
+
+
+def _implementations() -> Dict[str, Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]]]:
+    """Full per-bar series from each implementation; streaming records its published values after every bar."""
+
+    def engine(c: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        return compute_series(c["close"], c["high"], c["low"], c["volume"])
+
+    def streaming(c: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        state = IndicatorState(symbol="bench")
+        rows: List[Dict[str, Any]] = []
+        for i in range(c["close"].size):
+            state.update({"close": c["close"][i], "high": c["high"][i], "low": c["low"][i], "volume": c["volume"][i]})
+            rows.append(state.indicators())
+        return {key: np.array([row[key] for row in rows], dtype=float) for key in rows[0] if not isinstance(rows[0][key], list)}
+
+    def batch(c: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        result = compute_batch(["bench"], c["close"][None, :], c["high"][None, :], c["low"][None, :], c["volume"][None, :])
+        return {key: values[0] for key, values in result.series.items()}
+
+    return {"engine": engine, "streaming": streaming, "batch": batch}
+
+
+def verify(cases: Dict[str, Dict[str, np.ndarray]], tolerance: float) -> Tuple[List[str], int]:
+    """Compare every published field over the whole series, bar by bar, against the reference.
+
+    Streaming state has no NaN warm-up, so its reference is mapped to the published defaults.
+    """
+    errors: List[str] = []
+    checks = 0
+    for case_name, case in cases.items():
+        expected = {k: np.array(v) for k, v in reference_series(*(case[k].tolist() for k in ("close", "high", "low", "volume"))).items()}
+        for impl_name, impl in _implementations().items():
+            actual = impl(case)
+            for key, want in expected.items():
+                if impl_name == "streaming":
+                    want = np.where(np.isnan(want), _WARMUP_DEFAULTS.get(key, 0.0), want)
+                got = actual.get(key)
+                checks += want.size
+                if got is None:
+                    errors.append(f"{impl_name} {case_name} {key}: missing")
+                    continue
+                if not np.allclose(got, want, rtol=tolerance, atol=tolerance, equal_nan=True):
+                    ok = np.isclose(got, want, rtol=tolerance, atol=tolerance, equal_nan=True)
+                    bar = int(np.flatnonzero(~ok)[0])
+                    errors.append(f"{impl_name} {case_name} {key} bar {bar}: got {got[bar]:.10g}, reference {want[bar]:.10g}")
+    return errors, checks
+
+
+def legacy_divergence(case: Dict[str, np.ndarray]) -> Tuple[List[str], List[str]]:
+    """Report how the older per-script calculators disagree with the reference (informational).
+
+    Returns ``(divergences, skipped)``; ``skipped`` names every calculator that could not be compared.
+    """
+    notes: List[str] = []
+    skipped: List[str] = []
+    expected = reference_indicators(*(case[k].tolist() for k in ("close", "high", "low", "volume")))
+    legacy: Dict[str, Callable[[], Dict[str, Any]]] = {}
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError:
+        return notes, ["legacy calculators not compared: pandas is not installed"]
+
+    frame_en = pd.DataFrame({"Open": case["close"], "High": case["high"], "Low": case["low"], "Close": case["close"], "Volume": case["volume"]})
+    frame_zh = pd.DataFrame({"开盘": case["close"], "最高": case["high"], "最低": case["low"], "收盘": case["close"], "成交量": case["volume"]})
+    try:
+        from scripts.fetch_yfinance import calculate_indicators as yf_calc
+
+        legacy["fetch_yfinance"] = lambda: yf_calc(frame_en)
+    except Exception as exc:
+        skipped.append(f"fetch_yfinance not compared: import failed ({exc})")
+    try:
+        from scripts.fetch_all_stocks import calculate_indicators as ak_calc
+
+        legacy["fetch_all_stocks"] = lambda: ak_calc(frame_zh)
+    except Exception as exc:
+        skipped.append(f"fetch_all_stocks not compared: import failed ({exc})")
+
+    for name, run in legacy.items():
+        try:
+            values = run() or {}
+        except Exception as exc:
+            notes.append(f"{name}: failed ({exc})")
+            continue
+        for key, want in expected.items():
+            if key not in values:
+                continue
+            got = float(values[key])
+            if not math.isclose(got, want, rel_tol=1e-6, abs_tol=1e-6):
+                notes.append(f"{name} {key}: {got:.6g} vs reference {want:.6g}")
+    return notes, skipped
+
+
+def throughput(bars: int, repeats: int = 3) -> Dict[str, float]:
+    """Bars per second: engine for one symbol, batch for 100 and 1,000, streaming per bar."""
+    rng = np.random.default_rng(11)
+    results: Dict[str, float] = {}
+    for symbols in SYMBOL_COUNTS:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (symbols, bars)), axis=1))
+        high, low, volume = close * 1.01, close * 0.99, np.full(close.shape, 1e5)
+        best = math.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            if symbols == 1:
+                compute_series(close[0], high[0], low[0], volume[0])
+            else:
+                compute_batch([str(i) for i in range(symbols)], close, high, low, volume)
+            best = min(best, time.perf_counter() - start)
+        results[f"{symbols}"] = symbols * bars / best
+
+    state = IndicatorState(symbol="bench")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    start = time.perf_counter()
+    for value in close:
+        state.update({"close": value, "high": value * 1.01, "low": value * 0.99, "volume": 1e5})
+    results["streaming"] = bars / (time.perf_counter() - start)
+    return results
+
+
+def run_benchmark(
+    bars: int = 2520, recorded_dir: Optional[Path] = None, skip_speed: bool = False, strict: bool = False
+) -> int:
+    """Correctness and throughput gate; ``strict`` turns checks that could not run into errors."""
+    cfg = load_config().get("indicator_benchmark", {})
+    tolerance = float(cfg.get("tolerance", 1e-6))
+    floors = {str(k): float(v) for k, v in (cfg.get("min_bars_per_sec") or {}).items()}
+
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    cases = synthetic_cases()
+    if recorded_dir is not None:
+        recorded, problems = recorded_cases(recorded_dir)
+        cases.update(recorded)
+        (errors if strict else warnings).extend(problems)
+    drift, checks = verify(cases, tolerance)
+    errors.extend(drift)
+    print(f"verified {checks} values across {len(cases)} series")
+
+    divergences, skipped = legacy_divergence(cases["random_walk_10y"])
+    warnings.extend(divergences)
+    (errors if strict else warnings).extend(skipped)
+
+    if not skip_speed:
+        for label, rate in throughput(bars).items():
+            print(f"throughput[{label}]: {rate:,.0f} bars/sec")
+            floor = floors.get(label)
+            if floor and rate < floor:
+                errors.append(f"speed regression for {label}: {rate:,.0f} < {floor:,.0f} bars/sec")
+
+    for w in warnings:
+        print(f"WARN: {w}")
+    for e in errors:
+        print(f"ERROR: {e}")
+
+    if errors:
+        return 1
+    print("indicator benchmark passed")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verify and benchmark technical indicators")
+    parser.add_argument("--bars", type=int, default=2520, help="Bars per symbol for throughput runs")
+    parser.add_argument("--recorded", type=Path, help="Also verify recorded OHLCV JSON series in this directory")
+    parser.add_argument("--skip-speed", action="store_true", help="Only run correctness checks")
+    parser.add_argument("--strict", action="store_true", help="Fail when a check is skipped (no pandas, unreadable recordings)")
+    args = parser.parse_args()
+    return run_benchmark(bars=args.bars, recorded_dir=args.recorded, skip_speed=args.skip_speed, strict=args.strict)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -45,7 +45,13 @@ def run_checks(scope: str = "all") -> int:
             comp = json.loads(comp_path.read_text(encoding="utf-8"))
             _validate_stock_payload(comp)
 
-            age = _hours_since(comp["timestamp"])
+            # Unchanged runs skip rewriting the data file; the run metadata records the last check.
+            last_checked = comp["timestamp"]
+            run_meta_path = data_dir / "run_metadata.json"
+            if run_meta_path.exists():
+                last_checked = json.loads(run_meta_path.read_text(encoding="utf-8")).get("last_run_at") or last_checked
+
+            age = _hours_since(last_checked)
             if age > float(max_age.get("comprehensive_stock_data", 24)):
                 errors.append(f"comprehensive_stock_data stale: {age:.1f}h")
 
@@ -55,6 +61,15 @@ def run_checks(scope: str = "all") -> int:
             if ratio > 0.3:
                 warnings.append(f"high estimated ratio: {ratio:.0%}")
 
+        # Clients fetch the minified copies; they must carry the same data as the pretty files.
+        for name in ("comprehensive_stock_data", "stock_summary"):
+            pretty, minified = data_dir / f"{name}.json", data_dir / f"{name}.min.json"
+            if pretty.exists() and minified.exists():
+                if json.loads(minified.read_text(encoding="utf-8")) != json.loads(pretty.read_text(encoding="utf-8")):
+                    errors.append(f"{minified.name} out of sync with {pretty.name}")
+            elif pretty.exists():
+                warnings.append(f"missing {minified.name}")
+
     if scope in ("all", "news"):
         for news_file in sorted(data_dir.glob("news_*.json")):
             if news_file.name == "news_metadata.json":
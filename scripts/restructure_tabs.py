@@ -715,13 +715,8 @@ def create_tab_structure(lang='en'):
         </div>
 '''
 
-def restructure_html_file(input_file, output_file, lang='en'):
-    """Restructure HTML file with tab navigation"""
-
-    with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Find content-wrapper start and footer start
+def _content_bounds(lines):
+    """Line indexes of the content-wrapper start and footer start (None when missing)."""
     content_start = None
     footer_start = None
 
@@ -732,20 +727,37 @@ def restructure_html_file(input_file, output_file, lang='en'):
             footer_start = i
             break
 
+    return content_start, footer_start
+
+
+def restructure_text(content, lang='en'):
+    """Return content with the tab structure between content-wrapper and footer; unchanged without both."""
+    lines = content.splitlines(keepends=True)
+    content_start, footer_start = _content_bounds(lines)
     if content_start is None or footer_start is None:
-        print(f"❌ Could not find content boundaries in {input_file}")
-        return
+        return content
 
     # Combine: header + new tab content + footer
-    new_content = (
+    return (
         ''.join(lines[:content_start]) +
         create_tab_structure(lang) +
         '\n' +
         ''.join(lines[footer_start:])
     )
 
+
+def restructure_html_file(input_file, output_file, lang='en'):
+    """Restructure HTML file with tab navigation"""
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if None in _content_bounds(content.splitlines(keepends=True)):
+        print(f"❌ Could not find content boundaries in {input_file}")
+        return
+
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+        f.write(restructure_text(content, lang))
 
     print(f"✅ Restructured {output_file}")
 
@@ -34,6 +34,10 @@ def main() -> int:
 
         update_news()
 
+    from scripts.build.miniapp_bundle import write_bundles
+
+    write_bundles()
+
     if args.skip_quality:
         return 0
 
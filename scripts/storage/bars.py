@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Per-symbol columnar OHLCV store of append-only, memory-mappable column files under data/bars."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from scripts.storage.manifest import DATA_DIR
+
+BARS_DIR = DATA_DIR / "bars"
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Each symbol directory holds raw little-endian column files (date.<gen>.bin as
+# datetime64[D], one float64 <field>.<gen>.bin per field) and meta.json, whose ``rows``
+# is the only authority on how many rows are valid. Appends write the new rows at
+# offset rows * 8 in place and then swap meta.json with os.replace, so an append costs
+# the new bars, not the history, and a crash mid-append leaves ignored trailing bytes.
+# A revised tail (today's bar re-fetched) is first hidden by shrinking ``rows`` and then
+# rewritten in place; files are never truncated, so open memmaps stay valid. Only a
+# merge that inserts bars before the stored tail rewrites every column, as a new
+# generation; the previous one stays on disk until the next rewrite.
+
+DATE_DTYPE = np.dtype("<M8[D]")
+VALUE_DTYPE = np.dtype("<f8")
+LAYOUT = 2
+
+
+def _safe_name(symbol: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", symbol)
+
+
+def to_day(value: Any) -> np.datetime64:
+    return np.datetime64(str(value)[:10], "D")
+
+
+class BarStore:
+    def __init__(self, root: Path = BARS_DIR) -> None:
+        self.root = root
+
+    def _dir(self, symbol: str) -> Path:
+        return self.root / _safe_name(symbol)
+
+    def meta(self, symbol: str) -> Optional[Dict[str, Any]]:
+        path = self._dir(symbol) / "meta.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def symbols(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        out = []
+        for meta_path in sorted(self.root.glob("*/meta.json")):
+            out.append(json.loads(meta_path.read_text(encoding="utf-8")).get("symbol", meta_path.parent.name))
+        return out
+
+    def last_date(self, symbol: str) -> Optional[str]:
+        meta = self.meta(symbol)
+        return meta.get("last_date") if meta else None
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        columns: Iterable[str] = COLUMNS,
+        mmap: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """Columns for dates in [start, end] (inclusive, YYYY-MM-DD); ``date`` is datetime64[D].
+
+        With ``mmap`` the arrays are read-only views into the column files, so a
+        range read only touches the pages it slices.
+        """
+        meta = self.meta(symbol)
+        if not meta or not meta.get("rows"):
+            return {"date": np.array([], dtype="datetime64[D]"), **{c: np.array([]) for c in columns}}
+        folder = self._dir(symbol)
+        dates = self._column(folder, meta, "date", mmap)
+        lo = int(np.searchsorted(dates, to_day(start), "left")) if start else 0
+        hi = int(np.searchsorted(dates, to_day(end), "right")) if end else len(dates)
+        out = {"date": dates[lo:hi]}
+        for col in columns:
+            out[col] = self._column(folder, meta, col, mmap)[lo:hi]
+        return out
+
+    @staticmethod
+    def _column(folder: Path, meta: Dict[str, Any], name: str, mmap: bool) -> np.ndarray:
+        gen, rows = meta["generation"], int(meta["rows"])
+        if meta.get("layout", 1) < LAYOUT:
+            # Whole-file .npy generations from before in-place appends; rewritten on the next append.
+            return np.load(folder / f"{name}.{gen}.npy", mmap_mode="r" if mmap else None)
+        dtype = DATE_DTYPE if name == "date" else VALUE_DTYPE
+        path = folder / f"{name}.{gen}.bin"
+        if mmap:
+            return np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+        return np.fromfile(path, dtype=dtype, count=rows)
+
+    def read_points(self, symbol: str, start: Optional[str] = None, end: Optional[str] = None, tail: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Bars in the provider point format used across the pipeline."""
+        cols = self.read(symbol, start, end, mmap=False)
+        if tail is not None:
+            cols = {k: v[-tail:] for k, v in cols.items()}
+        dates = cols["date"].astype(str).tolist()
+        values = {c: cols[c].tolist() for c in COLUMNS}
+        return [{"date": d, **{c: values[c][i] for c in COLUMNS}} for i, d in enumerate(dates)]
+
+    def append(self, symbol: str, points: List[Dict[str, Any]]) -> int:
+        """Merge bars into the store; same-date bars overwrite stored ones. Returns new row count."""
+        incoming = [p for p in points if p.get("date") and p.get("close") is not None]
+        if not incoming:
+            return 0
+        new_dates = np.array([to_day(p["date"]) for p in incoming], dtype="datetime64[D]")
+        new_cols = {c: np.array([float(p.get(c, p["close"]) or 0.0) for p in incoming]) for c in COLUMNS}
+        # Incoming bars win on duplicate dates (np.unique keeps the first occurrence).
+        new_dates, first = np.unique(new_dates[::-1], return_index=True)
+        new_cols = {c: v[::-1][first] for c, v in new_cols.items()}
+
+        meta = self.meta(symbol)
+        current = self.read(symbol, mmap=False)
+        old_dates = current["date"]
+        # Rows before the first incoming date are untouched; everything from there on is rewritten.
+        keep = int(np.searchsorted(old_dates, new_dates[0], "left"))
+        old_tail = old_dates[keep:]
+        if meta and meta.get("layout", 1) >= LAYOUT and np.isin(old_tail, new_dates).all():
+            tail_dates, tail_cols = new_dates, new_cols
+        else:
+            all_dates = np.concatenate([new_dates, old_dates])
+            dates, first = np.unique(all_dates, return_index=True)
+            cols = {c: np.concatenate([new_cols[c], current[c]])[first] for c in COLUMNS}
+            self._rewrite(symbol, dates, cols)
+            return int(dates.size - old_dates.size)
+
+        if self._unchanged(current, keep, tail_dates, tail_cols):
+            # Re-fetched bars identical to the stored ones: nothing is written.
+            return 0
+        self._write_tail(symbol, meta, old_dates, keep, tail_dates, tail_cols)
+        return int(keep + tail_dates.size - old_dates.size)
+
+    @staticmethod
+    def _unchanged(current: Dict[str, np.ndarray], keep: int, dates: np.ndarray, cols: Dict[str, np.ndarray]) -> bool:
+        if not np.array_equal(current["date"][keep:], dates):
+            return False
+        return all(np.array_equal(current[c][keep:], cols[c], equal_nan=True) for c in COLUMNS)
+
+    def _write_meta(self, symbol: str, gen: int, rows: int, first_date: Any, last_date: Any) -> None:
+        folder = self._dir(symbol)
+        new_meta = {
+            "symbol": symbol,
+            "layout": LAYOUT,
+            "generation": gen,
+            "rows": int(rows),
+            "first_date": str(first_date) if rows else None,
+            "last_date": str(last_date) if rows else None,
+            "columns": ["date", *COLUMNS],
+        }
+        tmp = folder / "meta.json.tmp"
+        tmp.write_text(json.dumps(new_meta, indent=2), encoding="utf-8")
+        os.replace(tmp, folder / "meta.json")
+
+    def _write_tail(
+        self, symbol: str, meta: Dict[str, Any], old_dates: np.ndarray, keep: int, dates: np.ndarray, cols: Dict[str, np.ndarray]
+    ) -> None:
+        folder = self._dir(symbol)
+        gen = meta["generation"]
+        if keep < old_dates.size:
+            # Hide the rows about to be overwritten before touching them.
+            self._write_meta(symbol, gen, keep, meta["first_date"], old_dates[keep - 1] if keep else None)
+        offset = keep * 8
+        for name, values in (("date", dates.astype(DATE_DTYPE)), *((c, cols[c].astype(VALUE_DTYPE)) for c in COLUMNS)):
+            with open(folder / f"{name}.{gen}.bin", "r+b") as fh:
+                fh.seek(offset)
+                fh.write(values.tobytes())
+        first = meta["first_date"] if keep else dates[0]
+        self._write_meta(symbol, gen, keep + dates.size, first, dates[-1])
+
+    def _rewrite(self, symbol: str, dates: np.ndarray, cols: Dict[str, np.ndarray]) -> None:
+        folder = self._dir(symbol)
+        folder.mkdir(parents=True, exist_ok=True)
+        meta = self.meta(symbol)
+        old_gen = meta["generation"] if meta else None
+        gen = (old_gen or 0) + 1
+        dates.astype(DATE_DTYPE).tofile(folder / f"date.{gen}.bin")
+        for col in COLUMNS:
+            cols[col].astype(VALUE_DTYPE).tofile(folder / f"{col}.{gen}.bin")
+        self._write_meta(symbol, gen, dates.size, dates[0] if dates.size else None, dates[-1] if dates.size else None)
+        keep = {gen, old_gen}
+        for stale in [*folder.glob("*.npy"), *folder.glob("*.bin")]:
+            stale_gen = stale.stem.rsplit(".", 1)[-1]
+            if not (stale_gen.isdigit() and int(stale_gen) in keep):
+                stale.unlink(missing_ok=True)
+
+    def load_history(self, symbols: Iterable[str], start: Optional[str] = None, tail: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        return {s: pts for s in symbols if (pts := self.read_points(s, start=start, tail=tail))}
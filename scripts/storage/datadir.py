@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Single point of reads and atomic writes for JSON files in data/."""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from scripts.storage.jsonio import atomic_write_text, dumps, minified_path
+from scripts.storage.manifest import DATA_DIR, ContentManifest, json_digest
+
+logger = logging.getLogger(__name__)
+
+
+class DataDirectory:
+    """Parses each data file at most once per run and writes pretty plus optional minified copies."""
+
+    def __init__(self, root: Path = DATA_DIR) -> None:
+        self.root = root
+        self._cache: Dict[str, Any] = {}
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def load(self, name: str, default: Any = None) -> Any:
+        if name not in self._cache:
+            path = self.path(name)
+            try:
+                self._cache[name] = json.loads(path.read_text(encoding="utf-8")) if path.exists() else None
+            except Exception as exc:
+                logger.warning("Ignoring unreadable %s: %s", name, exc)
+                self._cache[name] = None
+        value = self._cache[name]
+        return default if value is None else value
+
+    def write(
+        self, name: str, payload: Any, manifest: Optional[ContentManifest] = None, minify: bool = False, pretty: bool = True
+    ) -> bool:
+        """Write ``name`` (and ``name.min.json`` when ``minify``); returns False when the manifest says unchanged.
+
+        ``pretty=False`` writes ``name`` itself minified, for client-only files.
+        """
+        self._cache[name] = payload
+        path = self.path(name)
+        targets = [(path, pretty)] + ([(minified_path(path), False)] if minify else [])
+        digest = json_digest(payload) if manifest is not None else None
+        written = False
+        for target, target_pretty in targets:
+            if manifest is None:
+                atomic_write_text(target, dumps(payload, target_pretty))
+                written = True
+            elif manifest.write_text(target, dumps(payload, target_pretty), digest):
+                written = True
+        if not written:
+            logger.info("Unchanged %s (skipped write)", name)
+        return written
+
+    def write_shards(
+        self, companies: Dict[str, Dict[str, Any]], manifest: Optional[ContentManifest] = None, folder: str = "companies"
+    ) -> Dict[str, Any]:
+        """Write one minified ``<folder>/<company>.json`` per company plus the client-facing ``manifest.json``.
+
+        Each shard entry carries a content hash (stable across runs that only refresh
+        timestamps) and its byte size, so clients can fetch and cache shards individually.
+        """
+        shard_dir = self.root / folder
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        shards: Dict[str, Dict[str, Any]] = {}
+        for company, payload in sorted(companies.items()):
+            path = shard_dir / f"{company}.json"
+            content = dumps(payload, pretty=False)
+            digest = json_digest(payload)
+            if manifest is None:
+                atomic_write_text(path, content)
+            else:
+                manifest.write_text(path, content, digest)
+            shards[company] = {
+                "path": f"{folder}/{company}.json",
+                "hash": digest[:16],
+                "size": path.stat().st_size,
+            }
+        for stale in shard_dir.glob("*.json"):
+            if stale.stem not in companies:
+                stale.unlink()
+                logger.info("Removed stale shard %s", stale.name)
+
+        index = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": json_digest({c: s["hash"] for c, s in shards.items()})[:16],
+            "shards": shards,
+        }
+        self.write("manifest.json", index, manifest)
+        return index
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""Delta-encoded snapshot log: periodic base snapshots plus per-run JSON Patch deltas."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import numbers
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.storage.jsonio import atomic_write_text, dumps
+from scripts.storage.manifest import DATA_DIR, strip_volatile
+
+SNAPSHOT_DIR = DATA_DIR / "snapshots"
+
+# Layout: one segment directory per base, named by the base timestamp.
+#   snapshots/<YYYYmmddTHHMMSS>/base.json     {"ts": ..., "documents": {name: doc}}
+#   snapshots/<YYYYmmddTHHMMSS>/deltas.jsonl  {"ts": ..., "ops": {name: [RFC 6902 ops]}} per run
+# A new segment starts after ``rebase_every`` deltas or once the deltas outgrow the base.
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _same_number(old: Any, new: Any) -> bool:
+    if old == new:
+        return True
+    try:
+        return math.isnan(old) and math.isnan(new)
+    except TypeError:
+        return False
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Minimal JSON Patch (add/remove/replace) turning ``old`` into ``new``.
+
+    Objects are diffed per key; lists are replaced whole unless only appended to.
+    Numbers compare by value, so 1, 1.0 and np.float64(1.0) are equal.
+    """
+    if _is_number(old) and _is_number(new):
+        return [] if _same_number(old, new) else [{"op": "replace", "path": path, "value": new}]
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    if isinstance(old, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+    if isinstance(old, list):
+        if old == new:
+            return []
+        if len(new) > len(old) and new[: len(old)] == old:
+            return [{"op": "add", "path": f"{path}/-", "value": v} for v in new[len(old):]]
+        return [{"op": "replace", "path": path, "value": new}]
+    return [] if old == new else [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply ops produced by ``diff``; ``doc`` is modified in place where possible and returned."""
+    for op in ops:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = op["value"]
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if op["op"] == "remove":
+            if isinstance(parent, list):
+                del parent[int(last)]
+            else:
+                del parent[last]
+        elif isinstance(parent, list):
+            if last == "-":
+                parent.append(op["value"])
+            elif op["op"] == "add":
+                parent.insert(int(last), op["value"])
+            else:
+                parent[int(last)] = op["value"]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+def _complete_size(path: Path) -> int:
+    """Bytes up to and including the last newline; 0 when the file does not exist."""
+    if not path.exists():
+        return 0
+    data = path.read_bytes()
+    return data.rfind(b"\n") + 1
+
+
+def _segment_name(ts: str) -> str:
+    return datetime.fromisoformat(ts).strftime("%Y%m%dT%H%M%S")
+
+
+class SnapshotLog:
+    def __init__(self, root: Path = SNAPSHOT_DIR, rebase_every: int = 168) -> None:
+        self.root = root
+        self.rebase_every = rebase_every
+
+    def segments(self) -> List[Path]:
+        if not self.root.exists():
+            return []
+        return sorted(p for p in self.root.iterdir() if (p / "base.json").exists())
+
+    @staticmethod
+    def _deltas(segment: Path) -> List[Dict[str, Any]]:
+        path = segment / "deltas.jsonl"
+        if not path.exists():
+            return []
+        text = path.read_text(encoding="utf-8")
+        # A line without its newline is a torn append; record() drops it before appending.
+        complete = text[: text.rfind("\n") + 1]
+        return [json.loads(line) for line in complete.splitlines() if line.strip()]
+
+    def _replay(self, segment: Path, at: Optional[str] = None) -> Dict[str, Any]:
+        state = json.loads((segment / "base.json").read_text(encoding="utf-8"))
+        docs = state["documents"]
+        ts = state["ts"]
+        for delta in self._deltas(segment):
+            if at is not None and delta["ts"] > at:
+                break
+            for name, ops in delta["ops"].items():
+                docs[name] = apply_patch(docs.get(name), ops)
+            ts = delta["ts"]
+        return {"ts": ts, "documents": docs}
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        segments = self.segments()
+        return self._replay(segments[-1]) if segments else None
+
+    def reconstruct(self, at: str) -> Optional[Dict[str, Any]]:
+        """Documents as recorded by the last run at or before ``at`` (ISO timestamp)."""
+        candidates = [s for s in self.segments() if json.loads((s / "base.json").read_text(encoding="utf-8"))["ts"] <= at]
+        return self._replay(candidates[-1], at) if candidates else None
+
+    def record(self, documents: Dict[str, Any], ts: Optional[str] = None) -> str:
+        """Append this run's documents; returns "base", "delta" or "unchanged".
+
+        Per-run timestamps (manifest ``VOLATILE_KEYS``) are stripped before diffing
+        and storing, so a run with identical market data records nothing.
+        """
+        ts = ts or datetime.utcnow().isoformat()
+        documents = {name: strip_volatile(doc) for name, doc in documents.items()}
+        segments = self.segments()
+        if segments:
+            segment = segments[-1]
+            current = self._replay(segment)["documents"]
+            ops = {name: d for name, doc in documents.items() if (d := diff(strip_volatile(current.get(name)), doc))}
+            if not ops:
+                return "unchanged"
+            line = (json.dumps({"ts": ts, "ops": ops}, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            deltas_path = segment / "deltas.jsonl"
+            size = _complete_size(deltas_path)
+            base_size = (segment / "base.json").stat().st_size
+            if len(self._deltas(segment)) < self.rebase_every and size + len(line) < base_size:
+                with open(deltas_path, "ab") as fh:
+                    fh.truncate(size)
+                    fh.write(line)
+                return "delta"
+            documents = {**current, **documents}
+        self._write_base(ts, documents)
+        return "base"
+
+    def _write_base(self, ts: str, documents: Dict[str, Any]) -> None:
+        segment = self.root / _segment_name(ts)
+        segment.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(segment / "base.json", dumps({"ts": ts, "documents": documents}, pretty=False))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        out = []
+        for segment in self.segments():
+            deltas = segment / "deltas.jsonl"
+            out.append(
+                {
+                    "segment": segment.name,
+                    "base_bytes": (segment / "base.json").stat().st_size,
+                    "deltas": len(self._deltas(segment)),
+                    "delta_bytes": deltas.stat().st_size if deltas.exists() else 0,
+                }
+            )
+        return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect or reconstruct the delta-encoded snapshot history")
+    parser.add_argument("--root", type=Path, default=SNAPSHOT_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("reconstruct", help="Rebuild documents as of a point in time")
+    rec.add_argument("at", help="ISO timestamp or date (a date means end of that day)")
+    rec.add_argument("--doc", help="Only this document, e.g. comprehensive_stock_data.json")
+    rec.add_argument("--output", type=Path, help="Write here instead of stdout")
+    sub.add_parser("stats", help="Per-segment base and delta sizes")
+    args = parser.parse_args()
+
+    log = SnapshotLog(args.root)
+    if args.command == "stats":
+        print(json.dumps(log.stats(), indent=2))
+        return 0
+
+    at = args.at + "T23:59:59.999999" if len(args.at) == 10 else args.at
+    state = log.reconstruct(at)
+    if state is None:
+        print(f"No snapshot at or before {args.at}", file=sys.stderr)
+        return 1
+    result = state["documents"].get(args.doc) if args.doc else state
+    text = dumps(result)
+    if args.output:
+        atomic_write_text(args.output, text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
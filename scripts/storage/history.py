@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""SQLite history of per-company payload snapshots with indexed metric queries."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.storage.manifest import DATA_DIR, json_digest
+
+HISTORY_PATH = DATA_DIR / "history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    symbol TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    company TEXT NOT NULL,
+    price REAL,
+    is_estimated INTEGER,
+    stale INTEGER,
+    digest TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (symbol, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS snapshots_ts ON snapshots (ts);
+CREATE TABLE IF NOT EXISTS metrics (
+    symbol TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (symbol, metric, ts)
+) WITHOUT ROWID;
+"""
+
+
+def flatten_metrics(payload: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Numeric leaves as dotted paths, e.g. ``confidence.quote`` or ``timeframes.weekly.rsi_14``."""
+    for key, value in payload.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, bool):
+            yield name, float(value)
+        elif isinstance(value, (int, float)):
+            yield name, float(value)
+        elif isinstance(value, dict):
+            yield from flatten_metrics(value, f"{name}.")
+
+
+class SnapshotHistory:
+    def __init__(self, path: Path = HISTORY_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "SnapshotHistory":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _latest_digest(self, symbol: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT digest FROM snapshots WHERE symbol = ? ORDER BY ts DESC LIMIT 1", (symbol,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(self, companies: Dict[str, Dict[str, Any]], ts: Optional[str] = None) -> List[str]:
+        """Store one snapshot per company whose substantive content changed; returns recorded companies.
+
+        Snapshots are keyed by (symbol, last_verified_at), falling back to ``ts`` or now.
+        Stale payloads carry the ``last_verified_at`` of the snapshot they were copied from,
+        so they are keyed by the run time instead and never replace that earlier row.
+        """
+        fallback_ts = ts or datetime.utcnow().isoformat()
+        recorded = []
+        with self.conn:
+            for company, payload in companies.items():
+                symbol = str(payload.get("symbol") or company)
+                digest = json_digest(payload)
+                if digest == self._latest_digest(symbol):
+                    continue
+                if payload.get("stale"):
+                    when = fallback_ts
+                else:
+                    when = str(payload.get("last_verified_at") or fallback_ts)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        symbol,
+                        when,
+                        company,
+                        payload.get("price"),
+                        int(bool(payload.get("is_estimated"))),
+                        int(bool(payload.get("stale"))),
+                        digest,
+                        json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                    ),
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?)",
+                    [(symbol, name, when, value) for name, value in flatten_metrics(payload)],
+                )
+                recorded.append(company)
+        return recorded
+
+    def _symbol(self, symbol_or_company: str) -> str:
+        row = self.conn.execute(
+            "SELECT symbol FROM snapshots WHERE symbol = ? OR company = ? LIMIT 1", (symbol_or_company, symbol_or_company)
+        ).fetchone()
+        return row[0] if row else symbol_or_company
+
+    def metric_series(
+        self, symbol: str, metric: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """``metric`` for one symbol (or company key) between ISO ``start`` and ``end``, oldest first."""
+        sql = "SELECT ts, value FROM metrics WHERE symbol = ? AND metric = ?"
+        args: List[Any] = [self._symbol(symbol), metric]
+        if start:
+            sql += " AND ts >= ?"
+            args.append(start)
+        if end:
+            # Date-only bounds include the whole day.
+            sql += " AND ts <= ?"
+            args.append(end + "T99" if len(end) == 10 else end)
+        return [(ts, value) for ts, value in self.conn.execute(sql + " ORDER BY ts", args)]
+
+    def as_of(self, ts: str) -> Dict[str, Dict[str, Any]]:
+        """Latest snapshot of every company at or before ``ts``."""
+        rows = self.conn.execute(
+            """
+            SELECT s.company, s.payload FROM snapshots s
+            JOIN (SELECT symbol, MAX(ts) AS ts FROM snapshots WHERE ts <= ? GROUP BY symbol) latest
+              ON s.symbol = latest.symbol AND s.ts = latest.ts
+            ORDER BY s.company
+            """,
+            (ts + "T99" if len(ts) == 10 else ts,),
+        )
+        return {company: json.loads(payload) for company, payload in rows}
+
+    def symbols(self) -> Dict[str, str]:
+        return dict(self.conn.execute("SELECT DISTINCT company, symbol FROM snapshots ORDER BY company"))
+
+    def metrics(self, symbol: str) -> List[str]:
+        rows = self.conn.execute("SELECT DISTINCT metric FROM metrics WHERE symbol = ? ORDER BY metric", (self._symbol(symbol),))
+        return [r[0] for r in rows]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Query the company snapshot history")
+    parser.add_argument("--db", type=Path, default=HISTORY_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    series = sub.add_parser("series", help="One metric for one company over a date range")
+    series.add_argument("symbol", help="Company key (tencent) or symbol code (00700)")
+    series.add_argument("metric", help="Metric path, e.g. rsi_14 or derivative_analysis.atr_percent")
+    series.add_argument("--start")
+    series.add_argument("--end")
+    as_of = sub.add_parser("as-of", help="Every company's latest snapshot at a point in time")
+    as_of.add_argument("ts", help="ISO date or timestamp")
+    as_of.add_argument("--fields", default="price,rsi_14,technical_rating.score")
+    sub.add_parser("symbols", help="List recorded companies")
+    args = parser.parse_args()
+
+    with SnapshotHistory(args.db) as history:
+        if args.command == "series":
+            result: Any = history.metric_series(args.symbol, args.metric, args.start, args.end)
+        elif args.command == "as-of":
+            fields = [f for f in args.fields.split(",") if f]
+            snapshots = history.as_of(args.ts)
+            result = {c: {k: v for k, v in flatten_metrics(p) if k in fields} for c, p in snapshots.items()}
+        else:
+            result = history.symbols()
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
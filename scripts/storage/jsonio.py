@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""JSON encoding and crash-safe file writes shared by every data-directory writer."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+def _finite(obj: Any) -> Any:
+    """Copy of ``obj`` with NaN/Infinity floats replaced by None (strict JSON has no spelling for them)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def dumps(obj: Any, pretty: bool = True) -> str:
+    """Serialize like ``json.dumps(obj, indent=2, ensure_ascii=False)``, or minified when not ``pretty``.
+
+    Always the stdlib encoder, so file bytes (and the manifest digests and git diffs built
+    on them) do not depend on which optional packages are installed. Non-finite floats
+    become ``null`` so browsers and the miniapp can parse every file.
+    """
+    options: Dict[str, Any] = {"indent": 2} if pretty else {"separators": (",", ":")}
+    try:
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, **options)
+    except ValueError:
+        return json.dumps(_finite(obj), ensure_ascii=False, allow_nan=False, **options)
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write via a temp file in the same directory and ``os.replace`` so readers never see a torn file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; keep the existing mode so served files stay world-readable.
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def minified_path(path: Path) -> Path:
+    """``data/x.json`` -> ``data/x.min.json``."""
+    return path.with_name(f"{path.stem}.min{path.suffix}")
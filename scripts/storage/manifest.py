@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Content-hash manifest so generated artifacts are only rewritten when their data changes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from scripts.storage.jsonio import atomic_write_text, dumps
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+DATA_DIR = ROOT / "data"
+MANIFEST_PATH = DATA_DIR / "content_manifest.json"
+RUN_METADATA_PATH = DATA_DIR / "run_metadata.json"
+
+# Keys refreshed on every run even when the underlying market data is identical.
+VOLATILE_KEYS = {"timestamp", "timestamps", "last_verified_at", "source_timestamp", "last_attempt_at"}
+
+# Timestamps stamped into rendered pages; mirrors the substitutions in akshare_stock_updater.
+VOLATILE_PATTERNS = [
+    re.compile(r"Last updated: [^<]+"),
+    re.compile(r"最近更新： [^<]+"),
+    re.compile(r"📅 Data Snapshot:.*?</span>"),
+    re.compile(r"📅 数据快照：.*?</span>"),
+    # Timestamps rendered into data-bound pages (scripts/build/bindings.py meta_context).
+    re.compile(r'data-bind="meta\.[\w.]+">[^<]*'),
+]
+
+
+def strip_volatile(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: strip_volatile(v) for k, v in obj.items() if k not in VOLATILE_KEYS}
+    if isinstance(obj, list):
+        return [strip_volatile(v) for v in obj]
+    return obj
+
+
+def json_digest(obj: Any) -> str:
+    canonical = json.dumps(strip_volatile(obj), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def text_digest(text: str) -> str:
+    for pattern in VOLATILE_PATTERNS:
+        text = pattern.sub("", text)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContentManifest:
+    """Maps repo-relative artifact paths to the digest of their substantive content."""
+
+    def __init__(self, path: Path = MANIFEST_PATH) -> None:
+        self.path = path
+        self.entries: Dict[str, str] = {}
+        self.changed: List[str] = []
+        self._dirty = False
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8")).get("files", {})
+            except Exception:
+                self.entries = {}
+
+    @staticmethod
+    def key(file_path: Path) -> str:
+        try:
+            return file_path.resolve().relative_to(ROOT).as_posix()
+        except ValueError:
+            return file_path.resolve().as_posix()
+
+    def is_current(self, file_path: Path, digest: str) -> bool:
+        return file_path.exists() and self.entries.get(self.key(file_path)) == digest
+
+    def mark_written(self, file_path: Path, digest: str) -> None:
+        key = self.key(file_path)
+        self.entries[key] = digest
+        if key not in self.changed:
+            self.changed.append(key)
+        self._dirty = True
+
+    def write_text(self, file_path: Path, content: str, digest: Optional[str] = None) -> bool:
+        digest = digest or text_digest(content)
+        if self.is_current(file_path, digest):
+            return False
+        atomic_write_text(file_path, content)
+        self.mark_written(file_path, digest)
+        return True
+
+    def save(self) -> bool:
+        if not self._dirty:
+            return False
+        payload = {"files": dict(sorted(self.entries.items()))}
+        atomic_write_text(self.path, dumps(payload))
+        return True
+
+
+def load_run_metadata(path: Path = RUN_METADATA_PATH) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def write_run_metadata(
+    companies: Dict[str, Dict[str, Any]],
+    changed: List[str],
+    path: Path = RUN_METADATA_PATH,
+    now: Optional[str] = None,
+    changed_at: Optional[str] = None,
+) -> None:
+    """Collect the per-run timestamps that are deliberately kept out of the data files.
+
+    ``changed_at`` overrides ``last_change_at`` so it matches the stamp already rendered into pages.
+    """
+    now = now or datetime.utcnow().isoformat()
+    previous = load_run_metadata(path)
+
+    meta = {
+        "last_run_at": now,
+        "last_change_at": changed_at or (now if changed else previous.get("last_change_at")),
+        "changed_files": sorted(changed),
+        "companies": {
+            company: {
+                "last_verified_at": payload.get("last_verified_at"),
+                "source_timestamp": payload.get("source_timestamp"),
+                "stale": bool(payload.get("stale", False)),
+            }
+            for company, payload in companies.items()
+        },
+    }
+    atomic_write_text(path, dumps(meta))
@@ -42,19 +42,29 @@ def sync_company_page(text: str) -> str:
     return text
 
 
+def zh_text(en: str, text: str) -> str:
+    """zh copy of the English page file ``en`` whose source is ``text``."""
+    if en == 'equity-analysis.html':
+        text = sync_equity_analysis(text)
+    elif en == 'technical-analysis.html':
+        text = sync_technical_analysis(text)
+    else:
+        text = sync_company_page(text)
+    # hydrate.js binds the zh payload (zh timestamps) instead of the English one.
+    stem = Path(en).stem
+    return text.replace(f'data/pages/{stem}.json', f'data/pages/{stem}-zh.json')
+
+
 def main():
     for en, zh in PAGE_PAIRS.items():
         src = ROOT / en
         dst = ROOT / zh
-        text = src.read_text(encoding='utf-8')
-
-        if en == 'equity-analysis.html':
-            text = sync_equity_analysis(text)
-        elif en == 'technical-analysis.html':
-            text = sync_technical_analysis(text)
-        else:
-            text = sync_company_page(text)
+        text = zh_text(en, src.read_text(encoding='utf-8'))
 
+        # Copies whose English source did not change since the last sync are left as-is.
+        if dst.exists() and dst.read_text(encoding='utf-8') == text:
+            print(f'unchanged {zh}')
+            continue
         dst.write_text(text, encoding='utf-8')
         print(f'synced {zh} <= {en}')
 